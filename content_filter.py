@@ -16,14 +16,93 @@ Categories filtered:
 """
 
 import re
+import time
+import bisect
+import string
 import logging
-from typing import Tuple, Optional
+import functools
+import itertools
+import threading
+from array import array
+from collections import namedtuple
+from typing import Tuple, Optional, Iterable
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import ahocorasick  # optional: pip install pyahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import re2  # optional: pip install google-re2
+except ImportError:
+    re2 = None
+
+try:
+    import hyperscan  # optional: pip install hyperscan
+except ImportError:
+    hyperscan = None
+
 logger = logging.getLogger(__name__)
 
 
+def _compile(pattern: str):
+    """
+    Compile a filter pattern with RE2 when it is installed, else with re.
+
+    RE2 matches in linear time with a DFA and never backtracks, and its
+    match objects support everything the filter uses (search, subn,
+    lastgroup). Patterns needing backreferences must use re directly.
+    Category patterns are written in lowercase and run against lowercased
+    text, so no case-insensitive flag is needed. re.ASCII keeps \\b, \\w,
+    \\s and \\d to ASCII, which is cheaper and matches RE2 and Hyperscan;
+    _MessageFeatures maps other whitespace to a space, and patterns that
+    must match non-ASCII words spell that out with _WORD.
+    """
+    if re2 is not None:
+        return re2.compile(pattern)
+    return re.compile(pattern, re.ASCII)
+
+
+# Folds common digit-for-letter substitutions ("sh1t", "wh0re") before
+# keyword matching; digits and letters are both word characters, so word
+# boundaries are unchanged
+_LEET_FOLD = str.maketrans('0134', 'oiea')
+
+# Keyword lists for the single-pass keyword matcher. Plain lowercase words,
+# matched at word starts; profanity letters may repeat ("fuuuck"). A
+# deployment can extend these before the first ContentFilter is created.
+PROFANITY_WORDS = [
+    'fuck', 'shit', 'asshole', 'bitch', 'damn', 'cunt',
+    'dick', 'piss', 'cock', 'whore', 'slut', 'fag',
+]
+EXPLICIT_WORDS = ['nude', 'naked', 'sex', 'porn', 'penis', 'vagina', 'breast']
+
+# Same word characters as \w under re.ASCII
+_WORD_CHARS = frozenset(string.ascii_letters + string.digits + '_')
+
+# A word character in a pattern, accented and other non-ASCII letters
+# included, for every engine
+_WORD = r'(?:\w|[^\x00-\x7f])'
+
+# Whitespace that ASCII \s misses (no-break and typographic spaces, line
+# separators), mapped to a plain space so "kill\xa0all" reads as "kill all"
+_OTHER_SPACES = {c: ' ' for c in range(0x3001) if chr(c).isspace() and not re.match(r'\s', chr(c), re.ASCII)}
+
+# Distinct message texts whose filter results are kept per ContentFilter
+FILTER_CACHE_SIZE = 1024
+
+# Translation table that deletes ASCII digits, for counting them at C speed
+_DELETE_DIGITS = str.maketrans('', '', string.digits)
+
+# Translation table that deletes ASCII capitals, for counting them at C speed
+_DELETE_UPPER = str.maketrans('', '', string.ascii_uppercase)
+
+# Fewest digits any sensitive-info pattern can match (an unseparated SSN)
+_MIN_SENSITIVE_DIGITS = 9
+
+
 class FilterCategory(Enum):
     """Categories of filtered content."""
     PROFANITY = "profanity"
@@ -37,9 +116,9 @@ class FilterCategory(Enum):
     SCAM = "scam"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FilterResult:
-    """Result of content filtering."""
+    """Result of content filtering. Immutable, so results can be shared."""
     is_allowed: bool
     original_text: str
     filtered_text: Optional[str]
@@ -48,12 +127,153 @@ class FilterResult:
     confidence: float
 
 
+# Shared result for empty messages
+_EMPTY_ALLOWED = FilterResult(
+    is_allowed=True,
+    original_text="",
+    filtered_text="",
+    category=None,
+    reason=None,
+    confidence=1.0
+)
+
+
+@dataclass(slots=True)
+class _MessageFeatures:
+    """Per-message values computed once and shared by every check."""
+    text: str
+    lower: str
+    folded: str
+    length: int
+    upper: int
+    is_ascii: bool
+
+    @classmethod
+    def of(cls, text: str) -> '_MessageFeatures':
+        is_ascii = text.isascii()
+        if is_ascii:
+            upper = len(text) - len(text.translate(_DELETE_UPPER))
+        else:
+            upper = sum(1 for c in text if c.isupper())
+        lower = text.lower()
+        # isprintable() is False for any whitespace but ' ', so plain ASCII
+        # text with no tabs or newlines skips the translate
+        if not (is_ascii and lower.isprintable()):
+            lower = lower.translate(_OTHER_SPACES)
+        return cls(text, lower, lower.translate(_LEET_FOLD), len(text), upper, is_ascii)
+
+
+# Stand-in for a regex match; the filter only reads lastgroup
+_CategoryHit = namedtuple('_CategoryHit', 'lastgroup')
+
+
+class _HyperscanMatcher:
+    """
+    Scans for several named patterns at once with a Hyperscan database.
+
+    Drop-in for a combined named-group regex: search() reports the
+    highest-priority (first listed) name that matches anywhere in the
+    text, found in one vectorized pass. Scratch space is per thread, since
+    Hyperscan scratch may not be shared between concurrent scans.
+    """
+
+    def __init__(self, named_patterns: list):
+        self.names = [name for name, _ in named_patterns]
+        flags = hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8
+        self._database = hyperscan.Database()
+        self._database.compile(
+            expressions=[pattern.encode() for _, pattern in named_patterns],
+            ids=list(range(len(named_patterns))),
+            elements=len(named_patterns),
+            flags=[flags] * len(named_patterns),
+        )
+        self._local = threading.local()
+
+    def search(self, text: str) -> Optional[_CategoryHit]:
+        """Return the best-ranked pattern that matches, or None."""
+        scratch = getattr(self._local, 'scratch', None)
+        if scratch is None:
+            scratch = self._local.scratch = hyperscan.Scratch(self._database)
+
+        hits = []
+        self._database.scan(
+            text.encode('utf-8', 'replace'),
+            match_event_handler=lambda pattern_id, start, end, flags, context: hits.append(pattern_id),
+            scratch=scratch,
+        )
+        return _CategoryHit(self.names[min(hits)]) if hits else None
+
+
+class _KeywordMatcher:
+    """
+    Matches a keyword list in a single pass over the text.
+
+    Uses a pyahocorasick automaton when the package is installed and falls
+    back to one compiled regex otherwise; both give the same answers.
+    Keywords match at the start of a word in lowercased, leet-folded text
+    (see _LEET_FOLD). With
+    repeatable=True every letter may be repeated ("fuuuck" matches "fuck"),
+    the same as writing each letter with a '+' in a regex.
+    """
+
+    # Runs of 3+ identical characters are collapsed to 2, which is enough
+    # to tell "s" and "ss" apart while keeping the variant list small.
+    _RUN_PATTERN = re.compile(r'(.)\1{2,}')
+
+    def __init__(self, words: Iterable[str], repeatable: bool = True):
+        words = [w.lower() for w in words]
+        self.repeatable = repeatable
+        self.min_length = min(map(len, words))
+
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for word in words:
+                variants = self._variants(word) if repeatable else (word,)
+                for variant in variants:
+                    self._automaton.add_word(variant, len(variant))
+            self._automaton.make_automaton()
+            self._pattern = None
+        else:
+            self._automaton = None
+            if repeatable:
+                alternatives = [''.join(re.escape(c) + '+' for c in w) for w in words]
+            else:
+                alternatives = [re.escape(w) for w in words]
+            self._pattern = _compile(r'\b(?:' + '|'.join(alternatives) + ')')
+
+    @staticmethod
+    def _variants(word: str) -> list:
+        """All spellings of word after run collapsing (each letter once or twice)."""
+        options = []
+        for char, run in itertools.groupby(word):
+            if len(list(run)) == 1:
+                options.append((char, char * 2))
+            else:
+                options.append((char * 2,))
+        return [''.join(parts) for parts in itertools.product(*options)]
+
+    def search(self, folded: str) -> Optional[str]:
+        """Return the first keyword hit in already-folded text, or None."""
+        if self._automaton is None:
+            match = self._pattern.search(folded)
+            return match.group() if match else None
+
+        normalized = self._RUN_PATTERN.sub(r'\1\1', folded) if self.repeatable else folded
+        for end, length in self._automaton.iter(normalized):
+            # Automaton hits are plain substrings, so check the word boundary here
+            start = end - length + 1
+            if start == 0 or normalized[start - 1] not in _WORD_CHARS:
+                return normalized[start:end + 1]
+        return None
+
+
 class ContentFilter:
     """
     Content filter for mesh messages.
 
     Filters both incoming and outgoing content to maintain
     a safe and appropriate communication environment.
+    Use get_content_filter() to share one instance per mode.
     """
 
     def __init__(self, strict_mode: bool = True):
@@ -65,49 +285,47 @@ class ContentFilter:
         """
         self.strict_mode = strict_mode
         self._compile_patterns()
+        self._filter_cached = functools.lru_cache(maxsize=FILTER_CACHE_SIZE)(self._filter_uncached)
 
-    def _compile_patterns(self):
-        """Compile regex patterns for filtering."""
+    # Compiled patterns are independent of strict_mode, so they are built
+    # once per process and shared by every instance
+    _patterns_compiled = False
+    _compile_lock = threading.Lock()
 
-        # Profanity patterns (basic list - expand as needed)
-        # Using word boundaries to avoid false positives
-        profanity_words = [
-            r'\bf+u+c+k+', r'\bs+h+i+t+', r'\ba+s+s+h+o+l+e',
-            r'\bb+i+t+c+h+', r'\bd+a+m+n+', r'\bc+u+n+t+',
-            r'\bd+i+c+k+', r'\bp+i+s+s+', r'\bc+o+c+k+',
-            r'\bw+h+o+r+e+', r'\bs+l+u+t+', r'\bf+a+g+',
-        ]
-        self.profanity_pattern = re.compile(
-            '|'.join(profanity_words),
-            re.IGNORECASE
-        )
+    @classmethod
+    def _compile_patterns(cls):
+        """Compile regex patterns for filtering (once, on first use)."""
+        with cls._compile_lock:
+            if not cls._patterns_compiled:
+                cls._build_patterns()
+                cls._patterns_compiled = True
+
+    @classmethod
+    def _build_patterns(cls):
+        """Build every compiled pattern and check table as class attributes."""
+
+        cls.profanity_pattern = _KeywordMatcher(PROFANITY_WORDS)
 
         # Hate speech patterns
         hate_patterns = [
-            r'\b(kill|murder|exterminate)\s+(all|every)\s+\w+',
-            r'\b(death\s+to|die)\s+\w+',
+            r'\b(kill|murder|exterminate)\s+(all|every)\s+' + _WORD + '+',
+            r'\b(death\s+to|die)\s+' + _WORD + '+',
             r'\bn+[i1]+g+[g3]+[e3a]+r*',
             r'\bk+[i1]+k+e+',
             r'\bsp+[i1]+c+',
             r'\bch+[i1]+n+k+',
         ]
-        self.hate_pattern = re.compile(
-            '|'.join(hate_patterns),
-            re.IGNORECASE
-        )
+        cls.hate_pattern = _compile('|'.join(hate_patterns))
 
         # Violence/threat patterns
         violence_patterns = [
             r'\b(going to|gonna|will)\s+(kill|shoot|stab|hurt|attack)',
             r'\b(bomb|explosive|weapon)\s+(threat|attack)',
-            r'\bi\'?ll\s+(kill|shoot|stab|hurt)',
+            r"\bi'?ll\s+(kill|shoot|stab|hurt)",
             r'\bkill\s+your?(self)?',
             r'\bharm\s+(you|your|myself)',
         ]
-        self.violence_pattern = re.compile(
-            '|'.join(violence_patterns),
-            re.IGNORECASE
-        )
+        cls.violence_pattern = _compile('|'.join(violence_patterns))
 
         # Illegal activity patterns
         illegal_patterns = [
@@ -117,26 +335,23 @@ class ContentFilter:
             r'\bhow\s+to\s+(make|build)\s+(bomb|explosive|weapon)',
             r'\bsteal\s+(credit|identity|money)',
         ]
-        self.illegal_pattern = re.compile(
-            '|'.join(illegal_patterns),
-            re.IGNORECASE
-        )
+        cls.illegal_pattern = _compile('|'.join(illegal_patterns))
 
         # Sensitive personal info patterns
-        self.ssn_pattern = re.compile(r'\b\d{3}[-\s]?\d{2}[-\s]?\d{4}\b')
-        self.credit_card_pattern = re.compile(r'\b(?:\d{4}[-\s]?){3}\d{4}\b')
-        self.phone_pattern = re.compile(r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b')
+        cls.ssn_pattern = _compile(r'\b\d{3}[-\s]?\d{2}[-\s]?\d{4}\b')
+        cls.credit_card_pattern = _compile(r'\b(?:\d{4}[-\s]?){3}\d{4}\b')
+        cls.phone_pattern = _compile(r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b')
+        # Card first so a 16-digit number is never partly taken as an SSN
+        cls._sensitive_pattern = _compile(
+            f'(?P<card>{cls.credit_card_pattern.pattern})|(?P<ssn>{cls.ssn_pattern.pattern})'
+        )
 
-        # Explicit content patterns
+        # Explicit content words and phrases
+        cls.explicit_words = _KeywordMatcher(EXPLICIT_WORDS, repeatable=False)
         explicit_patterns = [
-            r'\b(nude|naked|sex|porn)',
             r'\bsend\s+(nudes?|pics?|photos?)',
-            r'\b(penis|vagina|breasts?)',
         ]
-        self.explicit_pattern = re.compile(
-            '|'.join(explicit_patterns),
-            re.IGNORECASE
-        )
+        cls.explicit_pattern = _compile('|'.join(explicit_patterns))
 
         # Scam patterns
         scam_patterns = [
@@ -146,14 +361,66 @@ class ContentFilter:
             r'\bclick\s+(this|here|link)',
             r'\bfree\s+(money|crypto|bitcoin)',
         ]
-        self.scam_pattern = re.compile(
-            '|'.join(scam_patterns),
-            re.IGNORECASE
+        cls.scam_pattern = _compile('|'.join(scam_patterns))
+
+        # All regex categories fused into one pattern so a clean message is
+        # scanned once; the named group that matched identifies the pattern
+        cls._regex_groups = {
+            'hate': cls.hate_pattern,
+            'violence': cls.violence_pattern,
+            'illegal': cls.illegal_pattern,
+            'explicit': cls.explicit_pattern,
+            'scam': cls.scam_pattern,
+        }
+        cls._combined_lenient = cls._combine_patterns('hate', 'violence', 'illegal')
+        cls._combined_strict = cls._combine_patterns(
+            'hate', 'violence', 'illegal', 'explicit', 'scam'
+        )
+
+        # Category checks in priority order; strict mode adds the rest
+        # Each check carries the shortest text it can possibly match (hand
+        # counted, e.g. "kike" for hate, "buy meth" for illegal) so short
+        # messages skip it without touching the regex engine
+        cls._checks_lenient = (
+            (cls.hate_pattern, FilterCategory.HATE_SPEECH, "Contains hate speech", 4),
+            (cls.violence_pattern, FilterCategory.VIOLENCE, "Contains violent threats", 8),
+            (cls.illegal_pattern, FilterCategory.ILLEGAL, "References illegal activity", 8),
+        )
+        cls._checks_strict = cls._checks_lenient + (
+            (cls.profanity_pattern, FilterCategory.PROFANITY, "Contains profanity",
+             cls.profanity_pattern.min_length),
+            (cls.explicit_words, FilterCategory.EXPLICIT, "Contains explicit content",
+             cls.explicit_words.min_length),
+            (cls.explicit_pattern, FilterCategory.EXPLICIT, "Contains explicit content", 8),
+            (cls.scam_pattern, FilterCategory.SCAM, "Appears to be a scam", 3),
         )
+        cls._combined_min_len_lenient = cls._regex_min_len(cls._checks_lenient)
+        cls._combined_min_len_strict = cls._regex_min_len(cls._checks_strict)
 
         # Spam detection (repetitive characters, all caps, etc.)
-        self.repetition_pattern = re.compile(r'(.)\1{4,}')  # 5+ repeated chars
-        self.caps_threshold = 0.7  # 70% caps = likely spam
+        cls.repetition_pattern = re.compile(r'(.)\1{4,}')  # 5+ repeated chars
+        cls.caps_threshold = 0.7  # 70% caps = likely spam
+
+    @staticmethod
+    def _regex_min_len(checks: tuple) -> int:
+        """Shortest text any regex check in the list can match."""
+        return min(min_len for pattern, _, _, min_len in checks
+                   if not isinstance(pattern, _KeywordMatcher))
+
+    @classmethod
+    def _combine_patterns(cls, *names: str):
+        """
+        Join the named regex categories into one matcher.
+
+        Uses a Hyperscan database when available, otherwise one alternation
+        of named groups compiled with _compile().
+        """
+        if hyperscan is not None:
+            try:
+                return _HyperscanMatcher([(name, cls._regex_groups[name].pattern) for name in names])
+            except hyperscan.error as e:
+                logger.warning("Hyperscan compile failed, using regex: %s", e)
+        return _compile('|'.join(f'(?P<{name}>{cls._regex_groups[name].pattern})' for name in names))
 
     def filter_message(self, text: str, is_outgoing: bool = False) -> FilterResult:
         """
@@ -167,33 +434,50 @@ class ContentFilter:
             FilterResult with filtering decision and details.
         """
         if not text:
-            return FilterResult(
-                is_allowed=True,
-                original_text=text,
-                filtered_text=text,
-                category=None,
-                reason=None,
-                confidence=1.0
-            )
-
-        # Check each category
-        checks = [
-            (self.hate_pattern, FilterCategory.HATE_SPEECH, "Contains hate speech"),
-            (self.violence_pattern, FilterCategory.VIOLENCE, "Contains violent threats"),
-            (self.illegal_pattern, FilterCategory.ILLEGAL, "References illegal activity"),
-        ]
+            return _EMPTY_ALLOWED
+
+        result = self._filter_cached(text, self.strict_mode)
+        if not result.is_allowed:
+            # %-style args so logging only slices and formats when enabled
+            if result.category == FilterCategory.SENSITIVE_INFO:
+                logger.warning("Sensitive info detected: %.30s...", text)
+            elif result.category == FilterCategory.SPAM:
+                logger.warning("Spam detected: %.50s...", text)
+            else:
+                logger.warning("Content filtered (%s): %.50s...", result.category.value, text)
+        return result
+
+    def _filter_uncached(self, text: str, strict_mode: bool) -> FilterResult:
+        """
+        Run every check on non-empty text.
 
-        # Add stricter checks if in strict mode
-        if self.strict_mode:
-            checks.extend([
-                (self.profanity_pattern, FilterCategory.PROFANITY, "Contains profanity"),
-                (self.explicit_pattern, FilterCategory.EXPLICIT, "Contains explicit content"),
-                (self.scam_pattern, FilterCategory.SCAM, "Appears to be a scam"),
-            ])
-
-        for pattern, category, reason in checks:
-            if pattern.search(text):
-                logger.warning(f"Content filtered ({category.value}): {text[:50]}...")
+        Depends only on its arguments, so __init__ wraps it in an LRU cache;
+        repeated mesh messages then cost one dict lookup.
+        """
+        # Check each category, in priority order
+        if strict_mode:
+            checks, combined = self._checks_strict, self._combined_strict
+            combined_min_len = self._combined_min_len_strict
+        else:
+            checks, combined = self._checks_lenient, self._combined_lenient
+            combined_min_len = self._combined_min_len_lenient
+        features = _MessageFeatures.of(text)
+        match = combined.search(features.lower) if features.length >= combined_min_len else None
+        matched = self._regex_groups[match.lastgroup] if match else None
+
+        for pattern, category, reason, min_len in checks:
+            if features.length < min_len:
+                continue
+            if pattern is matched:
+                hit = True
+            elif isinstance(pattern, _KeywordMatcher):
+                hit = pattern.search(features.folded)
+            else:
+                # A combined regex returns the leftmost hit, so a higher
+                # priority category can still match further right in the
+                # text (Hyperscan already reports the best-ranked one)
+                hit = matched is not None and pattern.search(features.lower)
+            if hit:
                 return FilterResult(
                     is_allowed=False,
                     original_text=text,
@@ -204,21 +488,20 @@ class ContentFilter:
                 )
 
         # Check for sensitive personal info
-        if self._contains_sensitive_info(text):
-            logger.warning(f"Sensitive info detected: {text[:30]}...")
+        redacted, redactions = self._redact_sensitive_info(features)
+        if redactions:
             return FilterResult(
                 is_allowed=False,
                 original_text=text,
-                filtered_text=self._redact_sensitive_info(text),
+                filtered_text=redacted,
                 category=FilterCategory.SENSITIVE_INFO,
                 reason="Contains sensitive personal information",
                 confidence=0.95
             )
 
         # Check for spam characteristics
-        spam_result = self._check_spam(text)
+        spam_result = self._check_spam(features)
         if spam_result:
-            logger.warning(f"Spam detected: {text[:50]}...")
             return FilterResult(
                 is_allowed=False,
                 original_text=text,
@@ -238,29 +521,34 @@ class ContentFilter:
             confidence=1.0
         )
 
-    def _contains_sensitive_info(self, text: str) -> bool:
-        """Check if text contains sensitive personal information."""
-        if self.ssn_pattern.search(text):
-            return True
-        if self.credit_card_pattern.search(text):
-            return True
-        return False
-
-    def _redact_sensitive_info(self, text: str) -> str:
-        """Redact sensitive information from text."""
-        text = self.ssn_pattern.sub('[SSN REDACTED]', text)
-        text = self.credit_card_pattern.sub('[CARD REDACTED]', text)
-        return text
-
-    def _check_spam(self, text: str) -> Optional[str]:
+    def _redact_sensitive_info(self, features: _MessageFeatures) -> Tuple[str, int]:
+        """
+        Redact sensitive information from text in a single pass.
+
+        Returns:
+            Tuple of (redacted_text, number_of_redactions)
+        """
+        text = features.text
+        # Literal prefilter: most messages carry too few digits to hold an
+        # SSN or card number, so skip the regex scan for them
+        if features.is_ascii and len(text) - len(text.translate(_DELETE_DIGITS)) < _MIN_SENSITIVE_DIGITS:
+            return text, 0
+        return self._sensitive_pattern.subn(self._redaction_for, text)
+
+    @staticmethod
+    def _redaction_for(match) -> str:
+        """Replacement token for a sensitive-info match."""
+        return '[CARD REDACTED]' if match.lastgroup == 'card' else '[SSN REDACTED]'
+
+    def _check_spam(self, features: _MessageFeatures) -> Optional[str]:
         """Check if message appears to be spam."""
-        # Check for excessive repetition
-        if self.repetition_pattern.search(text):
+        # Check for excessive repetition (needs at least 5 characters)
+        if features.length >= 5 and self.repetition_pattern.search(features.text):
             return "Excessive character repetition"
 
         # Check for excessive caps (if message is long enough)
-        if len(text) > 10:
-            caps_ratio = sum(1 for c in text if c.isupper()) / len(text)
+        if features.length > 10:
+            caps_ratio = features.upper / features.length
             if caps_ratio > self.caps_threshold:
                 return "Excessive capitalization"
 
@@ -292,6 +580,12 @@ class ContentFilter:
             return "I can't respond to that message."
 
 
+@functools.lru_cache(maxsize=2)
+def get_content_filter(strict_mode: bool = True) -> ContentFilter:
+    """Return the process-wide ContentFilter for a mode, creating it on first use."""
+    return ContentFilter(strict_mode=strict_mode)
+
+
 class RateLimiter:
     """Rate limiter to prevent message flooding."""
 
@@ -305,7 +599,7 @@ class RateLimiter:
         """
         self.max_messages = max_messages
         self.window_seconds = window_seconds
-        self.message_times: dict = {}  # user_id -> list of timestamps
+        self.message_times: dict = {}  # user_id -> array('d') of timestamps, oldest first
 
     def is_allowed(self, user_id: str) -> Tuple[bool, Optional[str]]:
         """
@@ -314,22 +608,20 @@ class RateLimiter:
         Returns:
             Tuple of (is_allowed, reason_if_blocked)
         """
-        import time
         current_time = time.time()
+        times = self.message_times.get(user_id)
+        if times is None:
+            times = self.message_times[user_id] = array('d')
 
-        if user_id not in self.message_times:
-            self.message_times[user_id] = []
-
-        # Remove old timestamps
-        self.message_times[user_id] = [
-            t for t in self.message_times[user_id]
-            if current_time - t < self.window_seconds
-        ]
+        # Timestamps are appended in order, so expired ones form a prefix
+        expired = bisect.bisect_right(times, current_time - self.window_seconds)
+        if expired:
+            del times[:expired]
 
-        if len(self.message_times[user_id]) >= self.max_messages:
+        if len(times) >= self.max_messages:
             return False, f"Rate limited: max {self.max_messages} messages per {self.window_seconds}s"
 
-        self.message_times[user_id].append(current_time)
+        times.append(current_time)
         return True, None
 
     def reset(self, user_id: Optional[str] = None):
@@ -4,28 +4,306 @@ A web-based GUI for monitoring the mesh network and LLM interactions.
 
 Requirements:
     pip install flask flask-socketio
+    pip install eventlet   # optional: async server for many concurrent viewers
+    pip install brotli     # optional: brotli-compressed dashboard page
+    pip install orjson     # optional: faster JSON for API responses and socket frames
+    pip install msgpack    # optional: binary MessagePack socket frames
 
 Usage:
     python dashboard.py
     Then open http://localhost:5000 in your browser
 """
 
+# eventlet has to patch the stdlib before anything else opens sockets or
+# sqlite connections, so this stays above every other import.
+try:
+    import eventlet  # optional: pip install eventlet
+    eventlet.monkey_patch()
+    from eventlet import tpool
+    ASYNC_MODE = 'eventlet'
+except ImportError:
+    eventlet = None
+    tpool = None
+    ASYNC_MODE = 'threading'
+
 import os
+import re
+import gzip
+import base64
 import time
+import hashlib
+import functools
+import mimetypes
+import threading
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from flask import Flask, render_template_string, jsonify, request
+from flask import Flask, Response, g, jsonify, make_response, request, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from flask_socketio import SocketIO
 
+try:
+    import brotli  # optional: pip install brotli
+except ImportError:
+    brotli = None
+
+try:
+    import orjson  # optional: pip install orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack  # optional: pip install msgpack
+except ImportError:
+    msgpack = None
+
 # Import our modules
-from mesh_database import MeshDatabase
+from mesh_database import DB_FILE, MeshDatabase
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """jsonify() backed by orjson; anything orjson can't encode natively goes
+    through Flask's default handler (dates, Decimal, UUID, dataclasses)."""
+
+    option = (orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC) if orjson else 0
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self.option)
+        return self._app.response_class(body, mimetype='application/json')
+
+
+class OrjsonSocketJSON:
+    """json-module stand-in for socket.io packets."""
+
+    @staticmethod
+    def dumps(obj, **kwargs):
+        return orjson.dumps(obj, default=DefaultJSONProvider.default,
+                            option=OrjsonProvider.option).decode()
+
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
+
+@dataclass(frozen=True, slots=True)
+class DashboardConfig:
+    """Startup settings, read from the environment once at import."""
+    secret_key: str
+    host: str
+    port: int
+    db_path: str
+    cert_file: str | None = None
+    key_file: str | None = None
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            secret_key=os.environ.get('FLASK_SECRET_KEY', 'change-me-in-production'),
+            host=os.environ.get('DASHBOARD_HOST', '0.0.0.0'),
+            port=int(os.environ.get('DASHBOARD_PORT', 5000)),
+            db_path=os.environ.get('MESH_DB', DB_FILE),
+            cert_file=os.environ.get('DASHBOARD_CERT') or None,
+            key_file=os.environ.get('DASHBOARD_KEY') or None,
+        )
+
+    @property
+    def tls(self):
+        return bool(self.cert_file and self.key_file)
+
+
+CFG = DashboardConfig.from_env()
 
 app = Flask(__name__)
-app.config['SECRET_KEY'] = os.environ.get('FLASK_SECRET_KEY', 'change-me-in-production')
-socketio = SocketIO(app, cors_allowed_origins="*")
+app.config['SECRET_KEY'] = CFG.secret_key
+if orjson:
+    app.json = OrjsonProvider(app)
+# WebSocket frames are deflated by the transport itself: both simple-websocket
+# (threading) and eventlet accept the browser's permessage-deflate offer.
+# compression_threshold covers the HTTP long-polling fallback, lowered so
+# typical node/message batches qualify. With msgpack installed, socket
+# frames are binary MessagePack and the page loads the matching client build.
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode=ASYNC_MODE,
+                    serializer='msgpack' if msgpack else 'default',
+                    json=OrjsonSocketJSON if orjson else None,
+                    http_compression=True, compression_threshold=256)
 
 # Global state
 db = None
 
+# Socket events are queued and flushed as one 'batch' frame per tick
+BROADCAST_INTERVAL = 0.05   # seconds between flushes
+BROADCAST_BATCH_MAX = 128   # events per frame
+WATCH_INTERVAL = 0.1        # seconds between database change checks
+WATCH_MESSAGE_PAGE = 50     # new messages read per check
+UPDATE_PUSH_INTERVAL = 5.0  # min seconds between non-message 'db_update' pushes
+_pending = deque()
+_background_tasks = set()
+_background_lock = threading.Lock()
+
+# Blocking SQLite reads in flight on OS threads (eventlet mode only)
+DB_READ_CONCURRENCY = 8
+_db_read_slots = threading.BoundedSemaphore(DB_READ_CONCURRENCY)
+
+
+def _offload(fn, *args):
+    """Run a blocking database read without stalling the event loop.
+
+    sqlite3 is C code that eventlet can't patch, so under eventlet the call
+    goes to a real OS thread while this green thread waits; the semaphore
+    keeps a burst of clients from queueing unbounded work behind it. With
+    plain threads every request already has its own thread.
+    """
+    if tpool is None:
+        return fn(*args)
+    with _db_read_slots:
+        return tpool.execute(fn, *args)
+
+# Front-end libraries. Served from static/vendor/ once fetched with
+# `python dashboard.py --fetch-vendor`, otherwise straight from the CDN.
+VENDOR_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'vendor')
+VENDOR_MAX_AGE = 31536000  # one year; filenames are pinned to a release
+_LEAFLET_CDN = 'https://unpkg.com/leaflet@1.9.4/dist/'
+_CLUSTER_CDN = 'https://unpkg.com/leaflet.markercluster@1.5.3/dist/'
+VENDOR_ASSETS = {
+    'socket.io.js': 'https://cdnjs.cloudflare.com/ajax/libs/socket.io/4.0.1/socket.io.js',
+    'socket.io.msgpack.js': 'https://unpkg.com/socket.io-client@4.0.1/dist/socket.io.msgpack.min.js',
+    'leaflet.css': _LEAFLET_CDN + 'leaflet.css',
+    'leaflet.js': _LEAFLET_CDN + 'leaflet.js',
+    'images/layers.png': _LEAFLET_CDN + 'images/layers.png',
+    'images/layers-2x.png': _LEAFLET_CDN + 'images/layers-2x.png',
+    'images/marker-icon.png': _LEAFLET_CDN + 'images/marker-icon.png',
+    'images/marker-icon-2x.png': _LEAFLET_CDN + 'images/marker-icon-2x.png',
+    'images/marker-shadow.png': _LEAFLET_CDN + 'images/marker-shadow.png',
+    'MarkerCluster.css': _CLUSTER_CDN + 'MarkerCluster.css',
+    'MarkerCluster.Default.css': _CLUSTER_CDN + 'MarkerCluster.Default.css',
+    'leaflet.markercluster.js': _CLUSTER_CDN + 'leaflet.markercluster.js',
+}
+
+
+def vendor_urls():
+    """Map each vendor asset to its local URL if fetched, else its CDN URL."""
+    return {
+        name: f'/static/vendor/{name}' if os.path.isfile(os.path.join(VENDOR_DIR, name)) else url
+        for name, url in VENDOR_ASSETS.items()
+    }
+
+
+# Images that used to be inlined as data: URLs in every page load; served on
+# their own URLs (versioned by content hash) so the browser caches them once
+FAVICON_PNG = base64.b64decode(
+    'iVBORw0KGgoAAAANSUhEUgAAACAAAAAZCAYAAABQDyyRAAAFl0lEQVR4nHVWW28bRRT+5rK7jmPHLQkxaUnSGylpSy8vCAQSqD+EFx75c/wAqBDijQcKUqsUqeotJI3TNI0dX9a7O4POOTNrN1KTyD7ZnTmX73znm1FXrm17AFAeEANiqJl59ofX0suwHHHLnI/5vR/0A0DHf5z2wYOHp2/e9AFbnbWDj7nnbIedZNdp1ras0bw3pk6e+I9+QyU+biRbavHzdtjOH/F5CBLRqWPylujb81ortoJyUg0voC8NKKc4ttihBqWgKkDRKwVoWhMd0xra7BR02Dfz58VfLCzYNhQCbzgDKHhU2kN7LTAGm76pEHZsYs8VnOaoEsQIeTgHChjQEFvXrYu+6Z2u4eNMVYA3UIMr1DWUmrOV/2QtJUWVz6NAJUQ2xjbqD9qW17kzMIVSVSUVVN6hKpywVlNCUo1UK1VxW+reBtoTXLXvGez+/RZ43vgeTBE+41G6ElmSYnl1CVobDN4NMCknQlPnZ3MU0PMlY8LtONsCsiOBKQYnwJBx5QK1ZCd2WZVYaCxg8+o60gULYwymPkf/VR9pI0WYISkAFYpxhayZwpUeKANRQ+XsO6IQpo4S0QxZXBCyI1hphYFGd3UFJgGaH2XwrRJ5mePm/etIMssIMOGcQ9Zu4LNvLqGclFAGUFbBefI9G1OemHp0JXkt408wyZyxzSz37CRXU/SHp0g3ErSvt3Dp23Xc/mEbymp4CkCBKo+sleKrn+7h6neXUIxLai5UquBIiHg6pM2OUKAW6TBhKmTCsIuWSKYeTL7e/iHeHB/h4YNHGD6eYnlzCfs7Pa4URqEqKtjUIO9PsbdzgLV7y2ieb8IVoqqUhCoDsYkyUQvCxOioXrEF4UNITD12CtXYYfByhINeDyY3aHQy+AVgaaOF7u1ltqnKrNlggnYuLqHKJUH2zHJ3RiXDeWJjI5gbgZAMrSb4nHxPPVzuoBYJIYPysMTXP36B7tYyssUUu3+/xmB/ggoVNKFSVURv4Yd3UImGz6n8ueBB2Cy5pIA1NEEX5I0CKgAG0JnGeDBBf3CMtbsr+OTmJopxAQ2NrfsbyE8L7P7VQ/HO4fTNENYY6gBUkG6eGBrbcFQK2RGmIKpa0G4KKPoMZjRttG2Lsihw7f4mPrnxMaajAtZSloKOTTW2vl9n7ZiWU+g0CARDHfRirgXxuZXDRgSCBmH+qI0azEyHw8bdC/zu2R97yFoSfOXyeZz0TuDGABKP1c87aK00MeyNWQuiUDHgfOQH9QzPrZy0ilvAgWluqS0xCZpOCySpRe/fIzQfpDjsH6BzsYML19awu3OAaV5id2cXC0kTbqAwGU5hjEblK6maWxBISO0NpyvVZwUaQYGrVUEmeWwk4zhCw9EQ21vbuPzPNg6PX+PCjYtI2hYnj06R/NnGnS9v4dcnv6CcVLAqli7VhlvAnESHCwlCL+IJxkIUyahF3+knH01x5dY6JmsDjD/tI+ta7D76D2+eH6H3sofOrSZeLj7F6t0OGq0MZSHHdDiy6htQ7GtE2NbzGQlK+uziWMozQhKVwsJKhsb5DMWdMcM9eTvB/sPX6G534a1HmU/hjxwaSwlGe2MYq2dIahEeDj93PuiakWEu43EZHsszUsW8xNsXA2SpRaYMpkcFkiSF9imsSTB8cYoin8BNgMHeUBIn+OPNKMBKgjWTfy8J1P0PtkhyvCqJI5tYPP39FZ789hyLyxlMw2P4boS0neD06ARVI0dVlHj88zPkxwULkqe5p/aSDxeP+bki/dydkDN87x4Y9IER9EzOalwhaaWoKod0yWBcOtjCYZKPYDPL42pTy3cCJMzoMFVhnOtTl65lEqe+bxE7a2iYqZEvckJ5klSrYDK5tFht0Wo3oTVwrnsOzcUGtDHQJvQ9XlT48hqmifJhtOXa5ozD/9UqRpnPOt2kAAAAAElFTkSuQmCC'
+)
+LOGO_PNG = base64.b64decode(
+    'iVBORw0KGgoAAAANSUhEUgAAAEYAAABACAYAAACndwGZAAAS0klEQVR42u2aeXCdZ3XGf++33FVX+2o7XqVrrY6txbLsLHYSHAIJiUnSJKShQwt0KFDolBYYWgptp5ShLaFl6AxtBwK0pcMSEkJZEoKz2I4sW46txVq9yLJl7brS1V2/7zv945PlSHZIIiuEzujoD+l+uvddnvec5zznvBdWbMVWbMVWbMVWbMVWbMVWbMVWbMVWbMVWbMVWbMVW7JJV1W2T/8/rV8s1UHVdrWypriIvLxelFCKAuDNMTkxx7PgJOo61vu75SmsrpK/1pHqrgDGWY5B7H3pQ1l63msEL5zlw+BCtLx6e39C2XY0SXl9Kblb2/PvL6ipEaQpBwIbeqwBwNVDKaisE3QW898ibC9o1D/7xT/ypzMRm+I+vfV0B7Lr9ZllTshrTMInFY3R39dJx9GW1qW6zmH4TJ+3Q09y5LJsqq68UpaCnpVP9VgHzwT/6sExMj/P973xX3XTHLbKzoREHh0g0QspKEwwGyM3Mo7Ong5dPttH3UtebdspldRUC0Ht0eTxpyYPcve9eycgM8p+PfUvdce9dctuePfzkFz/l2SefVqVNmyWjyMfk5DQhMgmZmRx65oXfCF+U1lVI3zKAs+QB/vjjH5d/fvRRtaWxTu65805+/PRTxCXG3pveRk5OLpoByXiaFw8f5OL5YTRLo6u1fX6+LXW1cuJoqyqrr5DXwxdl9ZWidPdvJy28FjGX1VdK75Glh9iSyPfeBx6Uc+cHAWjYVkdzy2GOPX9Ufe6fPi+TU2M88b+PY6Vt6utrKSzMZ3hoBD3g7urW39krb/uznRiZJt96n5ITB4++rsUv3uS+P98njR/dStcTp/nmR76pXu394foq6TnS8YYB0pYCTGFhPv2nTwPg83rpG+7jnb9/l4yNjvPT539OzT1buPFju+mb6qfrbBeZa4Kk0il2PnCz7P3ybijSEK8QyPYv2dUz1gdJazZ1D1fwV8986lU1U8+RDhXeXiW/EWCUpjhx5KjacfNNkpEfJC5xSjJLGDh7lqLwKnY8UM+O22uofscWDNMkOp6gsKSIfV/aS8cvujnz8gVSSZuZi7NLBmZ6MErQ46Pjf3rwbvDywe98QADKGq8Eoedwhyp7g+AsCZivfeVfXNcMCcOTo1w4PKhO9Z1mfHICK2ERi8xiWzbTFyIkJ9Oc/NUJdesndjF5aoLun5zEl+0lMhmlo/WYKmuslHBDpZTVVsirCb2y+koJN1ZKuLFKwnMbT4wl8Ps9jI9O8tTnn2XT2zdy90f2SW9zhyq/oeaKsXoPd6iy+tcPzpIF3uYd1TI5McUL+w9S0bRFBobOYQRNsvNCPP1v+1lXtIHciXxOvtim9n36PklnC83/foTiqjxyV+Vwvv2iu+DX0DSvRrKzkQQzsSShTdkkjp+i78le9nxsB0989XG6XmxTZfWVIiK8MkP1HnHB6X0dnKMtFZjul9pV98E21d96UllJC2/ISzDfT2omzYXWEZ797n4CKsieu26T2n1V9P+8l3gyjqa8BLODpCbS15ROpwYiRCNxQnkhcq/LZKD9FLPpBPf/xQNyiXz7jp68gl96j3SocMNre47GMpjSFWZQJzGZIjacQBKAaLx0rIXbbr2VdCzN9NAEnoCJLYLmBZmxr2nO9kPHVGImRVZRJobuwTHTdD/fy9pbr7uCX8qbFoZWT0uHCjdWy5teKxkBk9hIip6WdhWurZKu1jZV0bRVzkXOMdgzTHwoApkWakLhzTSxxSIdcz2mbHuliAaarkBd+q3AAXGcy1JLBCftcsX8xEnwFnrQNRPMJOc7zrN65zq23rRdXn7+cr3WdahNbd5RI90vtc0/62luV+U7aqTrFc+W1WM276iRzudeVj0trnjrae1Q4foaUV7h9IFuNeIfJIcCdKVjejSCuUEccUhZLjBGloFmustQouh6rl117W9T6VkLZWguLhqIrlBeRfiGKindUSkAhmjoXg1RYDuQiichJRRXFlwl9NvU5kVe0vVSm9pcf3XPuSZgwg1VC07hkul+jc79xxVA1i2ZpHNSZI4VIppFRlYGIiBzKlY0sC0b0aH7QLu6+ZE9csen7pDcgiy69rcpPeBW4WILSnOlgtIVVY21Ypo6tuagGRqOJWgehRWzyFgVuup67bRDWd1CfhH1JnBMT8uV7F7eVCMnXzg+/zwjM0TvRDc56UKY8uALmGBBRknABTGpkV+YS3ZGlkuqIxEa31/NPY/u5t6/3CedP29ToYwgpq3T/Vy76n6+XfUe6FCGVwevwrHsOc9SCGClLHTTnb5810Ju6WvtVEpXi/bQrjY3Xpnel8wx4e3V0nO4fcEsmxurpevQQg/yOSb+XJOR8SEK0mtJkyQzEMDAdZk19cXUva8cJ+Kw/Q8rZfrMDImhOIkMjS0Pl+Ek75a1e4r45RcP07hvh2SvyiQyEMXRFI5PcCwH3dBRhkIsIa0sYjNxN1QOtKnwzmrpOXh5nT2H21V5U7V0Hbr8rLv5Sq/XltYHqboClPD2aulubr9iguR4ktUbV3FBP0V+Xh7TxxP89LP7Ge8e4/6/vVuyCgMkphKI7lCwMZuyt6/DyDBQlmDNptn63jLMDJNdH9vKLZ9rYNdHt7Lt4UpsyyIRSyAAtoNmgKZpeENeJs5OXfaIg+1qsRruOtR+hdgLL/KaJXnM1QTSYqDKGiqlt6VTjXVPsq5pFZpHMSj9xA86rP7dbDbVXoedcrDsNFbcQhDSKQuVFJSmMHQDpSCdsDB9GrnXhbCTwtR4lMHjQ4RyMzBtAyftEIvGsD0WwawQmaEAU32RhYtzrsIhxqKQWuQ1b9hjwleR1eHtVzK78ik2NVbI6cPnyCgOEAxlMxOYYEqbwOvxMnVxmuRMGitmo6HQlHJ3oEAhc68VSoGm3P97DAN/jkn9B6rY9nApXY/3IXEBj00qZlFYXsLs2RgdzccWbLK3pUNtXqRlul9qV2WLhF55w+X3vGFgFpfwZbVXhlVZU5WIBaZfZ+z8OKMnxjFSXoYOR1hXX0woy4vp0UFz0PS5rKNwm7kiiCOIY4MImq7QNQ1N09A0hXKE6NAMgRIvvmyDtv9uZ6JvhplTKcp2bOD4Dzvcw1pEvN2H2lRp7UIgdH3h9h3bWT6Bt5jlS2srRWkgDoi4Ieb/sldq7t7Ehg82kF0eQmzAwgVEACVoKFCaK+jEmdN1gsLVMjJ344BSeLwGTlIovXUVqUSagsFMZrrj7P+7F3n620+rsp3VIs6V8uRStnqljllw6K2XD/2aBd4lYTcPlNe9OtFMje7n2lXd3gbZ+8UmKu/byOrrS1ApHSyFZdvIHHqadilsNJQCpRSars2Do+kamgaO47hgKYVp6CjAF/IQWhNkzW2FFN6YPdfhc0++bOfCEL9acti8iAbCde7raxR4V1GNc/tRcyNvum0tDg7jQxGiU7N4dC+mboISHByUAh0DTSkcW+bvokRAzf3YtltX6WiIJTiOjaZpmJoHTTQMpTHcM47jUzS95wbpb+lUmu7yU2ltpSyUFAtDTBbtoOeoC941ASP2wlHLmuZieC4iSusrpO2HvcRG43h8BraA5diIAo/mITaVBE2b+8Al+a9wRFyQUDiOYDuCYzPvUYjCEXCUIIA/4MWf7SHaE+PQf72oyhqrRMQNU+VduEVZhMRij1+WUOptXUjESnfrP6W54dR35KR6xyd3kV+RTXLawppNMx2fxtEdUhFBxXR8GT6isVls5eAL+HFsBwE03UQEbHHAcRVuIp3ASoKOF9t2iCcTxKeSxGeS+ENeSveu5v6/vld6mzsuK1z918sKgNKrZNolAxNeVHOU1l3qwLn8kJxOcdPDu6WgPBctaZAYSzE5FCGQ5cWf4aXrmX66nziNpB0y8gJIGvZ/5QizF5N4vV7iqRhig6l7iU7FiU7F8GYZJJJpLr48Sl5BJp4MD2NDk0wORAhlZTA9MkNRfQ5Vu7aKnbTdQwI2LVrrYnGnlGJxpl1yVnKd+BWDG8qtyJSbdc+0dqvyXRslQQrDb+DxGRz+RhupmQ1cODKK5oW8mmye/vuDhHIziM3ESSQSnH5ukPzKagLKj9hCIMvH8e91YXltNuqrObV/kPG2CabPRTFXm/Q/P0Du+gwy12egmTq6R2F4DRLJFJhqPuUv7ln/ujuk3tYOtWyXYOGmKrl0RJqmsC2boCfAHZ/dxcjYJCcf76Ns5yranzpD3ImztqEEdEUw5MOb5yEQ8pC5KkTzYyfI9GZSccMGElqaMy2DzIxFCRb4mB1NYkdt8sozGewYY3YozvZ91YwOTRKdibP5HRuJdET4wWefVOFd1SLO3BcLBHpfkZHCDdXyatyy7N92CDe5GWpOsKJ0hZ206W3uVNv3NsnmO9ciYhFNzOLNN0nMplGOMNUTpeLmzRRvLSQaT5KIzDBybISxsxE0W8PINVl1YwlF+dl0/qif2dQsgSIfmkdH1yF2KsXG2g0MNA9w6sAF2g8dV6Xbq0TpypVDIijUAm4J11VJz9Ff3/c1lguYS3lPlJtixRaMoDv8tneVY/g0XvhZC3nVATImghhBH4YH8rdlMdQ1Qm5NHoaukVdYQGB3BnnxKKZmEvT5UX6dyNlZZqNRsip8pGMKSTkk0xZj1jiRH8zQ9Mg2LvZMzoe12C4g6lJ4L0jJr90MN5YTl3lVjxtV8+oz22GofYz7ah5g1YZinvjZk3QP9lGwLhfJc7BjgkzZ+At8jA5ECGZ7KSooYno0SiKWpiA3wOCZC8RmU2QNZDPcPkTk/CwleSV8+OE/4dmxX3L+9EU8OeZ8GIi4pYZaYlAso8dc4t45haaBEqhsvF4y1gYY6LjAu/fdQ3FJMe9/7x/Mr/bL//BVGUuOMZkcJNhtk5UXJJjnR9MVZmEWEz1TTKs4CTvJ+2s/xGw8yke+/yEF8M5PvFPe++DDnBk4RUviAPnh7FeQqzNXWMuSoNFYZpM599EMjZPPtamK3RvIyg8SKsngsR8/hsf08jdf+ILcsHuPfPIzn5F33XUPETXG1MA0eq5BzvosbIG0ZaNMjZJtRUyPzJJMpomkpiguKeHGW/bI/Q89JJ/+zCfpau/hxNQxMnMyKd6Sx/W768RK2q56dhvJb+1XzUq3V7oFsq5QGtiWg1f38uCX9qIFYbBrjHP9A1Ql6nlo3yPYloNNmq9841HOJvrY/Xs7yarMIjmTmmdwpUAzwDRN+p86w9GftfHI7Y+wd+defL4A7Z0d/OsTj7LurkLiEYfs9QHOPjPMD//6R6qsqVqcOWWuBPpa3tjF/vKFkjPXyRdXMPU3n1TltTVipwWf8mA6BmuvX83zv3qGI48dJDOYxcjYMP4MH5vKN+LL9zB6ZgTT4yUjO4ToCidpMzUewR/0kluRzYYzq/ne8cf4cfcP8BsBpq0JPGEv3lCQxPg0ftOc1yiOfYnnrixdfqPA9B3pVKXbKwVx0yRAdnEII0eRtC3SVppAQSZr1q8mlZglOTtNwfpCcoryKFmTwzP/+AJ6vrC2oRjdF0Dz6CjLIjoSpfeZQcLbNrJ2+2qMMyajw8PYmTGyVYiiilXYCPHYLMmkj4y1PpcjlFtnAfS3dqq3lGNEcBczd0Dh29Yza8WJJKM4hoOKK7beXkPxhvWEt1XR8O5tJOJJzLCP9Q3rmD1mc/zb/UxeHCMVnebskSGOf70P74yXwu2FJHOFYFGIm95zA9et38iq6g1satjEzOAMtsdieHiSwCoPO++7UXqb29UlFf7WZiXmO5PYSYfyuhopuT4fO26TSiXJ35TD9Kk4TrFiw841KE1jqneKrEAAn+Gh+p7NVL07TMeTPZx67jTxVXFUxMNtX9xNcTgXSTkk0jZn2iLYAbiu6To8AQ8XTgyRiscJ5PtJRFPYIZvCyuy5U1dzPZy3OCv1H+1Uas51PQGTUy+eQ+KC3+/D4zXJ3ZTBYPMF0mMWKGFsdBp/rhePaTA9FWV2Jk79QzVcf2c1I+0xbvz0dgo35jATiROdTqDFQPcoYpE4mqYYPjHCxd4hsta799eBbD+TvVGmL8bm67mlhNGbk67FrV5PvNCq+g8MEiz04/f4wQLDp1NUnsVAywDR8VlCIT+x6SRjFyJ4Aia6rTE1OkNgY4Dqt4exNGF6YhaPbqA5ivYfdeNVJqGAn7PHzjHYfZa8DVk4tqDrOqbXAA2e/fovrznbLjswfa2dypkLbG+mB103UbgNJitho0whryrEVPcU6ek0mDDSMoqKC5pfQ3k1dE0jkUjhDXgwPDqeTA/TvdMUl+ejAhqDrReIDI8TWO0jGUuC47Y7DWWge9wtbaytkL7DHeq3Bhi4XArMXIiRmIzjiAUKHGxSyTSGx6CoIofISITkWJJ19cUc/uYJRrvHkYhN30/OcOLxTgaPDGHYGp2P9zBydpy11xdztnmQaGKKzJIAknawHAtH3BYpukNsKLEsCu3/ANLKl+X2CljVAAAAAElFTkSuQmCC'
+)
+IMAGES = {'favicon': FAVICON_PNG, 'logo': LOGO_PNG}
+
+
+def image_versions():
+    """Short content hash per image, used as a cache-busting query string."""
+    return {name: hashlib.blake2b(data, digest_size=6).hexdigest() for name, data in IMAGES.items()}
+
+
+# Short-lived query cache: every viewer polling the same endpoint within the
+# TTL shares one SQLite query instead of each running their own
+QUERY_CACHE_TTL = 1.0   # seconds
+QUERY_CACHE_MAX = 64    # entries
+_query_cache = {}
+_query_locks = {}
+_query_cache_lock = threading.Lock()
+
+
+def _cached(key, fn, ttl=None):
+    """Return fn(), memoized under key for ttl (default QUERY_CACHE_TTL) seconds.
+
+    Concurrent misses on the same key wait for the first caller's result
+    rather than all hitting the database.
+    """
+    with _query_cache_lock:
+        hit = _query_cache.get(key)
+        if hit and hit[0] > time.monotonic():
+            return hit[1]
+        key_lock = _query_locks.setdefault(key, threading.Lock())
+
+    with key_lock:
+        with _query_cache_lock:
+            hit = _query_cache.get(key)
+            if hit and hit[0] > time.monotonic():
+                return hit[1]
+        value = _offload(fn)
+        with _query_cache_lock:
+            now = time.monotonic()
+            if len(_query_cache) >= QUERY_CACHE_MAX:
+                for k in [k for k, (expires, _) in _query_cache.items() if expires <= now]:
+                    del _query_cache[k]
+                    _query_locks.pop(k, None)
+                while len(_query_cache) >= QUERY_CACHE_MAX:
+                    oldest = next(iter(_query_cache))
+                    del _query_cache[oldest]
+                    _query_locks.pop(oldest, None)
+            _query_cache[key] = (now + (QUERY_CACHE_TTL if ttl is None else ttl), value)
+        return value
+
+
+def _cached_query(key, fn):
+    """_cached for database reads, keyed on the data version conditional_get
+    read for this request so a body is never older than its ETag."""
+    version = g.get('data_version')
+    if version is None:
+        return _offload(fn)
+    return _cached((*key, version), fn)
+
+
+@app.before_request
+def _stamp_request_time():
+    """Read the clock once per request; every cutoff and bucket in the
+    handler then measures from the same instant."""
+    g.now_ts = time.time()
+
+
+def conditional_get(view):
+    """Answer 304 Not Modified when the database hasn't changed since the
+    client's copy, skipping the query and serialization entirely.
+
+    Relative windows ("last 24h") drift without any writes, so the tag also
+    rolls over once a minute.
+    """
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        global db
+        if not db:
+            db = MeshDatabase(CFG.db_path)
+
+        try:
+            version = _offload(db.get_data_version)
+        except Exception as e:
+            print(f"Error computing ETag: {e}")
+            return view(*args, **kwargs)
+        g.data_version = version
+
+        minute = int(g.now_ts // 60)
+        etag = hashlib.blake2b(f"{request.full_path}:{version}:{minute}".encode(),
+                               digest_size=8).hexdigest()
+
+        if request.if_none_match.contains_weak(etag):
+            resp = Response(status=304)
+        else:
+            resp = make_response(view(*args, **kwargs))
+            if resp.status_code != 200:
+                return resp
+        resp.set_etag(etag, weak=True)
+        resp.cache_control.no_cache = True
+        return resp
+    return wrapper
+
+
 # Dashboard HTML template
 DASHBOARD_HTML = """
 <!DOCTYPE html>
@@ -34,16 +312,24 @@ DASHBOARD_HTML = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>LoRaLlama Dashboard</title>
-    <link rel="icon" type="image/png" href="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAACAAAAAZCAYAAABQDyyRAAAFl0lEQVR4nHVWW28bRRT+5rK7jmPHLQkxaUnSGylpSy8vCAQSqD+EFx75c/wAqBDijQcKUqsUqeotJI3TNI0dX9a7O4POOTNrN1KTyD7ZnTmX73znm1FXrm17AFAeEANiqJl59ofX0suwHHHLnI/5vR/0A0DHf5z2wYOHp2/e9AFbnbWDj7nnbIedZNdp1ras0bw3pk6e+I9+QyU+biRbavHzdtjOH/F5CBLRqWPylujb81ortoJyUg0voC8NKKc4ttihBqWgKkDRKwVoWhMd0xra7BR02Dfz58VfLCzYNhQCbzgDKHhU2kN7LTAGm76pEHZsYs8VnOaoEsQIeTgHChjQEFvXrYu+6Z2u4eNMVYA3UIMr1DWUmrOV/2QtJUWVz6NAJUQ2xjbqD9qW17kzMIVSVSUVVN6hKpywVlNCUo1UK1VxW+reBtoTXLXvGez+/RZ43vgeTBE+41G6ElmSYnl1CVobDN4NMCknQlPnZ3MU0PMlY8LtONsCsiOBKQYnwJBx5QK1ZCd2WZVYaCxg8+o60gULYwymPkf/VR9pI0WYISkAFYpxhayZwpUeKANRQ+XsO6IQpo4S0QxZXBCyI1hphYFGd3UFJgGaH2XwrRJ5mePm/etIMssIMOGcQ9Zu4LNvLqGclFAGUFbBefI9G1OemHp0JXkt408wyZyxzSz37CRXU/SHp0g3ErSvt3Dp23Xc/mEbymp4CkCBKo+sleKrn+7h6neXUIxLai5UquBIiHg6pM2OUKAW6TBhKmTCsIuWSKYeTL7e/iHeHB/h4YNHGD6eYnlzCfs7Pa4URqEqKtjUIO9PsbdzgLV7y2ieb8IVoqqUhCoDsYkyUQvCxOioXrEF4GUITD12CtXYYfByhINeDyY3aHQy+AVgaaOF7u1ltqnKrNlggnYuLqHKJUH2zHJ3RiXDeWJjI5gbgZAMrSb4nHxPPVzuoBYJIYPysMTXP36B7tYyssUUu3+/xmB/ggoVNKFSVURv4Yd3UImGz6n8ueBB2Cy5pIA1NEEX5I0CKgAG0JnGeDBBf3CMtbsr+OTmJopxAQ2NrfsbyE8L7P7VQ/HO4fTNENYY6gBUkG6eGBrbcFQK2RGmIKpa0G4KKPoMZjRttG2Lsihw7f4mPrnxMaajAtZSloKOTTW2vl9n7ZiWU+g0CARDHfRirgXxuZXDRgSCBmH+qI0azEyHw8bdC/zu2R97yFoSfOXyeZz0TuDGABKP1c87aK00MeyNWQuiUDHgfOQH9QzPrZy0ilvAgWluqS0xCZpOCySpRe/fIzQfpDjsH6BzsYML19awu3OAaV5id2cXC0kTbqAwGU5hjEblK6maWxBISO0NpyvVZwUaQYGrVUEmeWwk4zhCw9EQ21vbuPzPNg6PX+PCjYtI2hYnj06R/NnGnS9v4dcnv6CcVLAqli7VhlvAnESHCwlCL+IJxkIUyahF3+knH01x5dY6JmsDjD/tI+ta7D76D2+eH6H3sofOrSZeLj7F6t0OGq0MZSHHdDiy6htQ7GtE2NbzGQlK+uziWMozQhKVwsJKhsb5DMWdMcM9eTvB/sPX6G534a1HmU/hjxwaSwlGe2MYq2dIahEeDj93PuiakWEu43EZHsszUsW8xNsXA2SpRaYMpkcFkiSF9imsSTB8cYoin8BNgMHeUBIn+OPNKMBKgjWTfy8J1P0PtkhyvCqJI5tYPP39FZ789hyLyxlMw2P4boS0Wo3oTVwrnsOzcUGtDHQJvQ9XlT48hqmifJhtOXa5ozD/9UqRpnPOt2kAAAAAElFTkSuQmCC">
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/socket.io/4.0.1/socket.io.js"></script>
-    <link rel="stylesheet" href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css" />
-    <script src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js"></script>
-    <link rel="stylesheet" href="https://unpkg.com/leaflet.markercluster@1.5.3/dist/MarkerCluster.css" />
-    <link rel="stylesheet" href="https://unpkg.com/leaflet.markercluster@1.5.3/dist/MarkerCluster.Default.css" />
-    <script src="https://unpkg.com/leaflet.markercluster@1.5.3/dist/leaflet.markercluster.js"></script>
+    <link rel="icon" type="image/png" href="/favicon.png?v={{ image_versions.favicon }}">
+    <link rel="preload" as="style" href="{{ vendor['leaflet.css'] }}" />
+    <script src="{{ vendor['socket.io.msgpack.js'] if msgpack else vendor['socket.io.js'] }}"></script>
+    <link rel="stylesheet" href="{{ vendor['leaflet.css'] }}" />
+    <script src="{{ vendor['leaflet.js'] }}"></script>
+    <link rel="stylesheet" href="{{ vendor['MarkerCluster.css'] }}" />
+    <link rel="stylesheet" href="{{ vendor['MarkerCluster.Default.css'] }}" />
+    <script src="{{ vendor['leaflet.markercluster.js'] }}"></script>
     <style>
         * { margin: 0; padding: 0; box-sizing: border-box; }
 
+        :root {
+            --accent: #00d4ff;
+            --border-dim: #2a2a4a;
+            --mono: 'Monaco', 'Consolas', monospace;
+            --row-font: 0.8em;
+        }
+
         body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             background: #0f0f1a;
@@ -61,7 +347,7 @@ DASHBOARD_HTML = """
             display: flex;
             justify-content: space-between;
             align-items: center;
-            border-bottom: 1px solid #2a2a4a;
+            border-bottom: 1px solid var(--border-dim);
             z-index: 1000;
             flex-shrink: 0;
         }
@@ -72,12 +358,12 @@ DASHBOARD_HTML = """
             gap: 12px;
         }
 
-        .logo-icon { height: 48px; flex-shrink: 0; border-radius: 8px; }
+        .logo-icon { height: 48px; width: auto; flex-shrink: 0; border-radius: 8px; }
 
         .logo h1 {
             font-size: 1.4em;
             font-weight: 600;
-            background: linear-gradient(135deg, #00d4ff, #00ff88);
+            background: linear-gradient(135deg, var(--accent), #00ff88);
             -webkit-background-clip: text;
             -webkit-text-fill-color: transparent;
         }
@@ -100,7 +386,7 @@ DASHBOARD_HTML = """
 
         .header-stat .value {
             font-weight: 600;
-            color: #00d4ff;
+            color: var(--accent);
         }
 
         .weather-stat .weather-loc {
@@ -109,18 +395,34 @@ DASHBOARD_HTML = """
         }
 
         .status-dot {
+            position: relative;
             width: 8px;
             height: 8px;
             border-radius: 50%;
             background: #00ff88;
             animation: pulse 2s infinite;
         }
+        /* Expanding ring, scaled and faded rather than an animated box-shadow */
+        .status-dot::after {
+            content: '';
+            position: absolute;
+            inset: 0;
+            border-radius: 50%;
+            background: rgba(0,255,136,0.4);
+            animation: pulse-ring 2s infinite;
+            will-change: transform, opacity;
+        }
 
         .status-dot.offline { background: #ff4757; animation: none; }
+        .status-dot.offline::after { display: none; }
 
         @keyframes pulse {
-            0%, 100% { opacity: 1; box-shadow: 0 0 0 0 rgba(0,255,136,0.4); }
-            50% { opacity: 0.8; box-shadow: 0 0 0 8px rgba(0,255,136,0); }
+            0%, 100% { opacity: 1; }
+            50% { opacity: 0.8; }
+        }
+        @keyframes pulse-ring {
+            0% { transform: scale(1); opacity: 1; }
+            50%, 100% { transform: scale(3); opacity: 0; }
         }
 
         /* Main Layout */
@@ -178,7 +480,7 @@ DASHBOARD_HTML = """
         .map-stat-value {
             font-size: 1.8em;
             font-weight: 700;
-            color: #00d4ff;
+            color: var(--accent);
             line-height: 1.2;
         }
 
@@ -194,7 +496,7 @@ DASHBOARD_HTML = """
         .tabs {
             display: flex;
             background: rgba(255,255,255,0.03);
-            border-bottom: 1px solid #2a2a4a;
+            border-bottom: 1px solid var(--border-dim);
             overflow: hidden;
             flex-shrink: 0;
         }
@@ -207,7 +509,7 @@ DASHBOARD_HTML = """
         }
         .tab-count {
             font-size: 0.7em;
-            color: #00d4ff;
+            color: var(--accent);
             font-weight: 700;
         }
 
@@ -238,15 +540,15 @@ DASHBOARD_HTML = """
             font-size: 0.85em;
             font-weight: 500;
             color: #666;
-            transition: all 0.2s;
+            transition: background-color 0.2s, color 0.2s, border-color 0.2s;
             border-bottom: 2px solid transparent;
             line-height: 1.3;
         }
 
         .tab:hover { color: #aaa; background: rgba(255,255,255,0.02); }
         .tab.active {
-            color: #00d4ff;
-            border-bottom-color: #00d4ff;
+            color: var(--accent);
+            border-bottom-color: var(--accent);
             background: rgba(0,212,255,0.05);
         }
 
@@ -273,8 +575,12 @@ DASHBOARD_HTML = """
             margin-bottom: 8px;
             background: rgba(255,255,255,0.03);
             border-radius: 10px;
-            border-left: 3px solid #00d4ff;
+            border-left: 3px solid var(--accent);
             transition: transform 0.2s, background 0.2s;
+            /* Skip layout/paint for rows scrolled out of view; 'auto' remembers
+               each row's last rendered height so the scrollbar stays stable */
+            content-visibility: auto;
+            contain-intrinsic-size: auto 88px;
         }
 
         .message-item:hover {
@@ -308,7 +614,7 @@ DASHBOARD_HTML = """
 
         .message-from {
             font-weight: 600;
-            color: #00d4ff;
+            color: var(--accent);
             font-size: 0.9em;
         }
 
@@ -358,7 +664,7 @@ DASHBOARD_HTML = """
             font-size: 0.85em;
             font-weight: 600;
             cursor: pointer;
-            transition: all 0.2s;
+            transition: background-color 0.2s, border-color 0.2s, color 0.2s;
         }
 
         .msg-view-btn:first-child { border-radius: 6px 0 0 6px; }
@@ -366,8 +672,8 @@ DASHBOARD_HTML = """
 
         .msg-view-btn.active {
             background: rgba(0,212,255,0.15);
-            border-color: #00d4ff;
-            color: #00d4ff;
+            border-color: var(--accent);
+            color: var(--accent);
         }
 
         /* DM Conversations list */
@@ -385,8 +691,10 @@ DASHBOARD_HTML = """
             background: rgba(255,255,255,0.03);
             border-radius: 8px;
             cursor: pointer;
-            transition: all 0.2s;
+            transition: background-color 0.2s, transform 0.2s;
             border-left: 3px solid #ff9f43;
+            content-visibility: auto;
+            contain-intrinsic-size: auto 56px;
         }
 
         .dm-conv-item:hover {
@@ -520,7 +828,7 @@ DASHBOARD_HTML = """
         .chat-input-container {
             padding: 12px;
             background: rgba(0,0,0,0.3);
-            border-top: 1px solid #2a2a4a;
+            border-top: 1px solid var(--border-dim);
         }
 
         .chat-input-wrapper {
@@ -531,7 +839,7 @@ DASHBOARD_HTML = """
         .chat-input {
             flex: 1;
             background: rgba(255,255,255,0.05);
-            border: 1px solid #2a2a4a;
+            border: 1px solid var(--border-dim);
             border-radius: 8px;
             padding: 10px 14px;
             color: #e0e0e0;
@@ -541,7 +849,7 @@ DASHBOARD_HTML = """
         }
 
         .chat-input:focus {
-            border-color: #00d4ff;
+            border-color: var(--accent);
         }
 
         .chat-input::placeholder {
@@ -552,7 +860,7 @@ DASHBOARD_HTML = """
             background: #1a1a2e;
             border: 1px solid #333;
             border-radius: 8px;
-            color: #00d4ff;
+            color: var(--accent);
             padding: 8px 4px;
             font-size: 0.75em;
             font-weight: 600;
@@ -562,11 +870,11 @@ DASHBOARD_HTML = """
         }
 
         .channel-select:focus {
-            border-color: #00d4ff;
+            border-color: var(--accent);
         }
 
         .chat-send-btn {
-            background: linear-gradient(135deg, #00d4ff, #00ff88);
+            background: linear-gradient(135deg, var(--accent), #00ff88);
             border: none;
             border-radius: 8px;
             padding: 10px 20px;
@@ -627,7 +935,7 @@ DASHBOARD_HTML = """
         }
 
         .node-search:focus {
-            border-color: #00d4ff;
+            border-color: var(--accent);
         }
 
         .node-search::placeholder {
@@ -646,7 +954,7 @@ DASHBOARD_HTML = """
         }
 
         .node-sort:focus {
-            border-color: #00d4ff;
+            border-color: var(--accent);
         }
 
         .node-list {
@@ -663,7 +971,9 @@ DASHBOARD_HTML = """
             background: rgba(255,255,255,0.03);
             border-radius: 10px;
             cursor: pointer;
-            transition: all 0.2s;
+            transition: background-color 0.2s, transform 0.2s;
+            content-visibility: auto;
+            contain-intrinsic-size: auto 88px;
         }
 
         .node-item:hover {
@@ -675,13 +985,13 @@ DASHBOARD_HTML = """
             width: 40px;
             height: 40px;
             border-radius: 10px;
-            background: linear-gradient(135deg, #00d4ff33, #00ff8833);
+            background: linear-gradient(135deg, var(--accent)33, #00ff8833);
             display: flex;
             align-items: center;
             justify-content: center;
             font-weight: 700;
             font-size: 0.85em;
-            color: #00d4ff;
+            color: var(--accent);
             margin-right: 12px;
         }
 
@@ -695,7 +1005,7 @@ DASHBOARD_HTML = """
             font-weight: 700;
             cursor: pointer;
             margin-left: 8px;
-            transition: all 0.2s;
+            transition: background-color 0.2s, border-color 0.2s, color 0.2s;
         }
 
         .node-trace-btn:hover {
@@ -714,7 +1024,7 @@ DASHBOARD_HTML = """
         .node-id {
             font-size: 0.75em;
             color: #555;
-            font-family: 'Monaco', 'Consolas', monospace;
+            font-family: var(--mono);
         }
 
         .node-stats { text-align: right; }
@@ -761,17 +1071,17 @@ DASHBOARD_HTML = """
         }
         .filter-btn {
             background: rgba(255,255,255,0.05);
-            border: 1px solid #2a2a4a;
+            border: 1px solid var(--border-dim);
             border-radius: 4px;
             padding: 3px 10px;
             color: #888;
             font-size: 0.72em;
             font-weight: 600;
             cursor: pointer;
-            transition: all 0.15s;
+            transition: background-color 0.15s, border-color 0.15s, color 0.15s;
         }
         .filter-btn:hover { background: rgba(0,212,255,0.1); color: #aaa; }
-        .filter-btn.active { background: rgba(0,212,255,0.2); border-color: #00d4ff; color: #00d4ff; }
+        .filter-btn.active { background: rgba(0,212,255,0.2); border-color: var(--accent); color: var(--accent); }
         .filter-btn:disabled { opacity: 0.4; cursor: not-allowed; }
 
         /* Range buttons for messages and map */
@@ -780,7 +1090,7 @@ DASHBOARD_HTML = """
             gap: 4px;
             padding: 4px 12px;
             background: rgba(0,0,0,0.2);
-            border-bottom: 1px solid #2a2a4a;
+            border-bottom: 1px solid var(--border-dim);
         }
         .map-range-bar {
             display: flex;
@@ -789,17 +1099,17 @@ DASHBOARD_HTML = """
         }
         .range-btn {
             background: rgba(255,255,255,0.05);
-            border: 1px solid #2a2a4a;
+            border: 1px solid var(--border-dim);
             border-radius: 4px;
             padding: 2px 8px;
             color: #888;
             font-size: 0.65em;
             font-weight: 600;
             cursor: pointer;
-            transition: all 0.15s;
+            transition: background-color 0.15s, border-color 0.15s, color 0.15s;
         }
         .range-btn:hover { background: rgba(0,212,255,0.1); color: #aaa; }
-        .range-btn.active { background: rgba(0,212,255,0.2); border-color: #00d4ff; color: #00d4ff; }
+        .range-btn.active { background: rgba(0,212,255,0.2); border-color: var(--accent); color: var(--accent); }
         .range-btn:disabled { opacity: 0.4; cursor: not-allowed; }
 
         /* Key Metrics - 4 across */
@@ -817,7 +1127,7 @@ DASHBOARD_HTML = """
         .stat-mini-value {
             font-size: 1.4em;
             font-weight: 700;
-            background: linear-gradient(135deg, #00d4ff, #00ff88);
+            background: linear-gradient(135deg, var(--accent), #00ff88);
             -webkit-background-clip: text;
             -webkit-text-fill-color: transparent;
             line-height: 1.2;
@@ -838,7 +1148,7 @@ DASHBOARD_HTML = """
             padding: 5px 4px;
             text-align: center;
         }
-        .stat-micro-value { font-size: 0.95em; font-weight: 600; color: #00d4ff; line-height: 1.2; }
+        .stat-micro-value { font-size: 0.95em; font-weight: 600; color: var(--accent); line-height: 1.2; }
         .stat-micro-label { font-size: 0.55em; color: #555; text-transform: uppercase; letter-spacing: 0.3px; }
 
         /* Collapsible Sections */
@@ -857,7 +1167,7 @@ DASHBOARD_HTML = """
             user-select: none;
             transition: color 0.15s;
         }
-        .collapsible-header:hover { color: #00d4ff; }
+        .collapsible-header:hover { color: var(--accent); }
         .collapsible-header .collapse-arrow {
             display: inline-block;
             transition: transform 0.2s;
@@ -907,7 +1217,7 @@ DASHBOARD_HTML = """
             border-radius: 4px;
         }
         .health-metric-label { font-size: 0.55em; color: #666; display: block; }
-        .health-metric-value { font-size: 1em; font-weight: 700; color: #00d4ff; }
+        .health-metric-value { font-size: 1em; font-weight: 700; color: var(--accent); }
         .health-metric-unit { font-size: 0.6em; color: #555; }
 
         /* Top Nodes */
@@ -931,7 +1241,7 @@ DASHBOARD_HTML = """
             text-overflow: ellipsis;
             white-space: nowrap;
         }
-        .top-node-count { color: #00d4ff; font-weight: 600; }
+        .top-node-count { color: var(--accent); font-weight: 600; }
         .top-node-batt { color: #666; font-size: 0.85em; }
 
         /* Packet Types (horizontal bars) */
@@ -971,14 +1281,14 @@ DASHBOARD_HTML = """
         }
         .packet-bar-fill {
             height: 100%;
-            background: linear-gradient(90deg, #00d4ff, #00ff88);
+            background: linear-gradient(90deg, var(--accent), #00ff88);
             border-radius: 3px;
             transition: width 0.3s ease;
         }
         .packet-count {
             font-size: 0.68em;
             font-weight: 600;
-            color: #00d4ff;
+            color: var(--accent);
             width: 40px;
             text-align: right;
             flex-shrink: 0;
@@ -1003,7 +1313,7 @@ DASHBOARD_HTML = """
             display: flex;
             justify-content: space-between;
         }
-        .chart-range-label { color: #00d4ff; font-weight: 600; }
+        .chart-range-label { color: var(--accent); font-weight: 600; }
         .chart-wrapper {
             flex: 1;
             display: flex;
@@ -1028,31 +1338,23 @@ DASHBOARD_HTML = """
         }
         .chart-container {
             flex: 1;
-            display: flex;
-            align-items: flex-end;
-            gap: 2px;
             position: relative;
             min-height: 60px;
         }
-        .chart-bar {
-            flex: 1;
-            background: linear-gradient(to top, #00d4ff, #00ff88);
-            border-radius: 2px 2px 0 0;
-            min-height: 2px;
-            transition: height 0.3s ease;
+        /* Bars are painted on one canvas; the tooltip is a single reused div */
+        #activity-canvas {
+            position: absolute;
+            inset: 0;
+            width: 100%;
+            height: 100%;
             cursor: pointer;
-            position: relative;
         }
-        .chart-bar:hover { opacity: 0.8; }
-        .chart-bar:hover::after {
-            content: attr(data-tooltip);
+        .chart-tooltip {
             position: absolute;
-            bottom: calc(100% + 4px);
-            left: 50%;
             transform: translateX(-50%);
             background: #1a1a2e;
-            border: 1px solid #2a2a4a;
-            color: #00d4ff;
+            border: 1px solid var(--border-dim);
+            color: var(--accent);
             font-size: 0.6em;
             padding: 2px 5px;
             border-radius: 3px;
@@ -1060,10 +1362,16 @@ DASHBOARD_HTML = """
             pointer-events: none;
             z-index: 10;
         }
-        .chart-bar.current-hour {
-            background: linear-gradient(to top, #00ff88, #00ffcc);
-            box-shadow: 0 0 6px rgba(0,255,136,0.4);
+        .chart-empty {
+            position: absolute;
+            inset: 0;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            color: #555;
+            font-size: 0.75em;
         }
+        .chart-tooltip[hidden], .chart-empty[hidden] { display: none; }
         .chart-x-axis {
             display: flex;
             justify-content: space-between;
@@ -1100,11 +1408,14 @@ DASHBOARD_HTML = """
             z-index: 100;
             height: 70px;
             box-sizing: border-box;
-            transform: translateY(100%);
+            /* translate3d keeps the bar on its own layer at rest as well as
+               mid-slide, so map pans don't re-raster it */
+            transform: translate3d(0, 100%, 0);
             transition: transform 0.3s ease;
+            contain: layout paint;
         }
         .timeline-visible .timeline-container {
-            transform: translateY(0);
+            transform: translate3d(0, 0, 0);
         }
         .timeline-info {
             display: flex;
@@ -1113,7 +1424,7 @@ DASHBOARD_HTML = """
             margin-bottom: 6px;
         }
         #timeline-date {
-            color: #00d4ff;
+            color: var(--accent);
             font-weight: bold;
             font-size: 14px;
         }
@@ -1133,11 +1444,12 @@ DASHBOARD_HTML = """
             -webkit-appearance: none;
             width: 24px;
             height: 24px;
-            background: #00d4ff;
+            background: var(--accent);
             border-radius: 50%;
             cursor: pointer;
             box-shadow: 0 0 10px rgba(0,212,255,0.5);
             transition: transform 0.1s;
+            will-change: transform;
         }
         .timeline-slider::-webkit-slider-thumb:hover {
             transform: scale(1.2);
@@ -1145,7 +1457,7 @@ DASHBOARD_HTML = """
         .timeline-slider::-moz-range-thumb {
             width: 24px;
             height: 24px;
-            background: #00d4ff;
+            background: var(--accent);
             border-radius: 50%;
             cursor: pointer;
             border: none;
@@ -1166,7 +1478,8 @@ DASHBOARD_HTML = """
             cursor: pointer;
             font-weight: bold;
             font-size: 12px;
-            transition: all 0.2s;
+            transition: background-color 0.2s, transform 0.2s;
+            will-change: transform;
         }
         .sync-now-btn:hover {
             background: #ffb732;
@@ -1203,6 +1516,7 @@ DASHBOARD_HTML = """
             align-items: center;
             justify-content: center;
             z-index: 1000;
+            transform: translateZ(0);
         }
         .dm-modal.hidden { display: none; }
         .dm-modal-content {
@@ -1211,8 +1525,9 @@ DASHBOARD_HTML = """
             border-radius: 12px;
             width: 400px;
             max-width: 90%;
-            border: 1px solid #00d4ff;
+            border: 1px solid var(--accent);
             box-shadow: 0 0 30px rgba(0,212,255,0.3);
+            contain: layout paint;
         }
         .dm-header {
             display: flex;
@@ -1222,7 +1537,7 @@ DASHBOARD_HTML = """
             color: #e0e0e0;
         }
         .dm-header strong {
-            color: #00d4ff;
+            color: var(--accent);
         }
         .dm-close-btn {
             background: transparent;
@@ -1242,37 +1557,70 @@ DASHBOARD_HTML = """
             margin-top: 10px;
             width: 100%;
             padding: 10px;
-            background: #00d4ff;
+            background: var(--accent);
             color: #0a0a0f;
             border: none;
             border-radius: 6px;
             cursor: pointer;
             font-weight: bold;
             font-size: 14px;
-            transition: all 0.2s;
+            transition: background-color 0.2s;
         }
         .dm-btn:hover {
             background: #33ddff;
         }
 
         /* ==================== NODE ANIMATIONS ON PACKET ==================== */
+        /* Layer hint: set a frame before the animation class, dropped at cleanup */
+        .node-animating > div:first-child,
+        .rippling > .ripple-ring {
+            will-change: transform;
+        }
+        /* The dot scales; the glow is a pre-rendered gradient behind it that
+           only fades and scales, so neither animation repaints */
+        .node-msg-throb::before,
+        .node-data-glow::before {
+            content: '';
+            position: absolute;
+            top: -15px; left: -15px;
+            width: 60px; height: 60px;
+            border-radius: 50%;
+            z-index: -1;
+            pointer-events: none;
+            opacity: 0;
+            will-change: transform, opacity;
+        }
         /* 10s throbbing green/cyan glow for TEXT messages (2s x 5 iterations) */
-        .node-msg-throb div {
+        .node-msg-throb > div:first-child {
             animation: msg-throb 2s ease-in-out 5;
         }
+        .node-msg-throb::before {
+            background: radial-gradient(circle, rgba(0,212,255,0.7) 25%, rgba(0,255,136,0.3) 45%, transparent 70%);
+            animation: msg-glow 2s ease-in-out 5;
+        }
         @keyframes msg-throb {
-            0%   { box-shadow: 0 0 4px 2px rgba(0,255,136,0.3); transform: scale(1); }
-            50%  { box-shadow: 0 0 18px 8px rgba(0,212,255,0.7); transform: scale(1.35); }
-            100% { box-shadow: 0 0 4px 2px rgba(0,255,136,0.3); transform: scale(1); }
+            0%, 100% { transform: scale(1); }
+            50%      { transform: scale(1.35); }
+        }
+        @keyframes msg-glow {
+            0%, 100% { opacity: 0.3; transform: scale(0.6); }
+            50%      { opacity: 1; transform: scale(1.1); }
         }
         /* 3s subtle grey pulse for non-message data packets (1.5s x 2 iterations) */
-        .node-data-glow div {
+        .node-data-glow > div:first-child {
             animation: data-glow 1.5s ease-in-out 2;
         }
+        .node-data-glow::before {
+            background: radial-gradient(circle, rgba(150,150,150,0.4) 25%, transparent 60%);
+            animation: data-halo 1.5s ease-in-out 2;
+        }
         @keyframes data-glow {
-            0%   { box-shadow: 0 0 2px 1px rgba(150,150,150,0.2); transform: scale(1); }
-            50%  { box-shadow: 0 0 10px 4px rgba(150,150,150,0.4); transform: scale(1.1); }
-            100% { box-shadow: 0 0 2px 1px rgba(150,150,150,0.2); transform: scale(1); }
+            0%, 100% { transform: scale(1); }
+            50%      { transform: scale(1.1); }
+        }
+        @keyframes data-halo {
+            0%, 100% { opacity: 0.3; transform: scale(0.6); }
+            50%      { opacity: 1; transform: scale(0.85); }
         }
 
         /* Pond ripple rings — must escape marker bounds */
@@ -1286,26 +1634,63 @@ DASHBOARD_HTML = """
             font-size: 10px;
             font-weight: 600;
             color: #e0e0e0;
-            text-shadow: 0 0 3px #000, 0 0 6px #000, 1px 1px 2px #000;
+            text-shadow: 0 0 3px #000;
             pointer-events: none;
             line-height: 1;
         }
+        /* Pre-rendered label bitmap; the canvas adds LABEL_PAD px around the text */
+        img.marker-label { top: 22px; display: block; }
+        /* Full-size ring centred on the dot, grown with scale() so each frame
+           is composited without layout */
         .ripple-ring {
             position: absolute;
-            top: 12px; left: 12px;
-            width: 0; height: 0;
-            border: 3px solid #00d4ff;
+            top: -45px; left: -45px;
+            width: 120px; height: 120px;
+            box-sizing: border-box;
+            border: 3px solid var(--accent);
             border-radius: 50%;
             pointer-events: none;
             opacity: 0;
+            transform: scale(0);
+            contain: strict;
+            display: none;
         }
         @keyframes pond-ripple {
-            0%   { width: 0; height: 0; top: 12px; left: 12px; opacity: 0.9; border-width: 3px; }
-            100% { width: 120px; height: 120px; top: -48px; left: -48px; opacity: 0; border-width: 1px; }
+            0%   { transform: scale(0); opacity: 0.9; }
+            100% { transform: scale(1); opacity: 0; }
+        }
+        /* The rings live in every marker; .rippling on the marker starts them */
+        .rippling > .ripple-ring { display: block; }
+        .rippling > .ripple-ring-1 { animation: pond-ripple 1.5s ease-out 0s 5; }
+        .rippling > .ripple-ring-2 { animation: pond-ripple 1.5s ease-out 0.5s 5; }
+        .rippling > .ripple-ring-3 { animation: pond-ripple 1.5s ease-out 1.0s 5; }
+
+        /* Burst badge: packets coalesced into the marker's running animation */
+        .custom-marker[data-count]::after {
+            content: attr(data-count);
+            position: absolute;
+            top: -10px; left: 22px;
+            padding: 0 4px;
+            border-radius: 8px;
+            background: var(--accent);
+            color: #0a0a0f;
+            font-size: 9px;
+            font-weight: 700;
+            line-height: 14px;
+            pointer-events: none;
+        }
+
+        /* While the user drags, scrolls or scrubs, background animations
+           hold still and the message throb runs shorter */
+        body.interacting .node-data-glow > div:first-child,
+        body.interacting .node-data-glow::before,
+        body.interacting .ripple-ring {
+            animation-play-state: paused;
+        }
+        body.interacting .node-msg-throb > div:first-child,
+        body.interacting .node-msg-throb::before {
+            animation-iteration-count: 3;
         }
-        .ripple-ring-1 { animation: pond-ripple 1.5s ease-out 0s 5; }
-        .ripple-ring-2 { animation: pond-ripple 1.5s ease-out 0.5s 5; }
-        .ripple-ring-3 { animation: pond-ripple 1.5s ease-out 1.0s 5; }
 
         /* ==================== NETWORK TAB ==================== */
         .network-panel {
@@ -1332,15 +1717,25 @@ DASHBOARD_HTML = """
             justify-content: space-between;
             align-items: center;
         }
-        .network-section-header:hover { color: #00d4ff; }
+        .network-section-header:hover { color: var(--accent); }
         .network-section-header .section-arrow {
             display: inline-block;
             transition: transform 0.2s;
             font-size: 0.8em;
         }
         .network-section-header.collapsed .section-arrow { transform: rotate(-90deg); }
-        .network-section-body { padding: 0 12px 10px; }
+        .network-section-body {
+            padding: 0 12px 10px;
+            /* Sections below the fold of the network tab skip layout/paint */
+            content-visibility: auto;
+            contain-intrinsic-size: auto 200px;
+        }
         .network-section-body.hidden { display: none; }
+        .network-list {
+            max-height: 240px;
+            overflow-y: auto;
+            overscroll-behavior: contain;
+        }
 
         /* Topology canvas */
         #topology-canvas {
@@ -1354,7 +1749,7 @@ DASHBOARD_HTML = """
         .trace-all-btn {
             background: rgba(0, 212, 255, 0.15);
             border: 1px solid rgba(0, 212, 255, 0.3);
-            color: #00d4ff;
+            color: var(--accent);
             font-size: 0.85em;
             padding: 2px 8px;
             border-radius: 4px;
@@ -1369,15 +1764,19 @@ DASHBOARD_HTML = """
         .trace-all-btn.cancel:hover { background: rgba(255, 71, 87, 0.3); }
 
         /* Traceroute list */
+        .traceroute-item, .alert-item {
+            content-visibility: auto;
+            contain-intrinsic-size: auto 40px;
+        }
         .traceroute-item {
             padding: 6px 0;
             border-bottom: 1px solid rgba(255,255,255,0.05);
-            font-size: 0.8em;
+            font-size: var(--row-font);
         }
         .traceroute-item:last-child { border-bottom: none; }
         .traceroute-route {
-            color: #00d4ff;
-            font-family: 'Monaco', 'Consolas', monospace;
+            color: var(--accent);
+            font-family: var(--mono);
             font-size: 0.9em;
         }
         .traceroute-time { color: #555; font-size: 0.85em; }
@@ -1388,18 +1787,18 @@ DASHBOARD_HTML = """
             display: flex;
             justify-content: space-between;
             padding: 4px 0;
-            font-size: 0.8em;
+            font-size: var(--row-font);
             border-bottom: 1px solid rgba(255,255,255,0.05);
         }
         .sf-item:last-child { border-bottom: none; }
         .sf-node { color: #ccc; }
-        .sf-stat { color: #00d4ff; font-weight: 600; }
+        .sf-stat { color: var(--accent); font-weight: 600; }
 
         /* Alert list */
         .alert-item {
             padding: 6px 0;
             border-bottom: 1px solid rgba(255,255,255,0.05);
-            font-size: 0.8em;
+            font-size: var(--row-font);
         }
         .alert-item:last-child { border-bottom: none; }
         .alert-text { color: #ffa502; }
@@ -1411,11 +1810,11 @@ DASHBOARD_HTML = """
             display: flex;
             justify-content: space-between;
             padding: 4px 0;
-            font-size: 0.8em;
+            font-size: var(--row-font);
             border-bottom: 1px solid rgba(255,255,255,0.05);
         }
         .pax-item:last-child { border-bottom: none; }
-        .pax-counts { color: #00d4ff; }
+        .pax-counts { color: var(--accent); }
 
         /* Signal sparkline in popups */
         .sparkline-container { margin-top: 8px; }
@@ -1424,17 +1823,17 @@ DASHBOARD_HTML = """
         /* Map trail toggle */
         .map-trail-btn {
             background: rgba(255,255,255,0.05);
-            border: 1px solid #2a2a4a;
+            border: 1px solid var(--border-dim);
             border-radius: 4px;
             padding: 3px 10px;
             color: #888;
             font-size: 0.72em;
             font-weight: 600;
             cursor: pointer;
-            transition: all 0.15s;
+            transition: background-color 0.15s, border-color 0.15s, color 0.15s;
         }
         .map-trail-btn:hover { background: rgba(0,212,255,0.1); color: #aaa; }
-        .map-trail-btn.active { background: rgba(0,212,255,0.2); border-color: #00d4ff; color: #00d4ff; }
+        .map-trail-btn.active { background: rgba(0,212,255,0.2); border-color: var(--accent); color: var(--accent); }
 
         .map-follow-label {
             display: flex;
@@ -1448,18 +1847,19 @@ DASHBOARD_HTML = """
             font-size: 0.72em;
             font-weight: 600;
             cursor: pointer;
-            transition: all 0.15s;
+            transition: background-color 0.15s, border-color 0.15s, color 0.15s;
         }
         .map-follow-label:hover { background: rgba(0,212,255,0.1); color: #aaa; }
-        .map-follow-label.active { background: rgba(0,212,255,0.2); border-color: #00d4ff; color: #00d4ff; }
-        .map-follow-label input[type="checkbox"] { accent-color: #00d4ff; cursor: pointer; }
+        .map-follow-label.active { background: rgba(0,212,255,0.2); border-color: var(--accent); color: var(--accent); }
+        .map-follow-label input[type="checkbox"] { accent-color: var(--accent); cursor: pointer; }
 
         /* Leaflet popup customization */
         .leaflet-popup-content-wrapper {
             background: rgba(15, 15, 26, 0.95);
-            border: 1px solid #2a2a4a;
+            border: 1px solid var(--border-dim);
             border-radius: 10px;
             color: #e0e0e0;
+            contain: layout paint;
         }
 
         .leaflet-popup-tip { background: rgba(15, 15, 26, 0.95); }
@@ -1467,7 +1867,7 @@ DASHBOARD_HTML = """
         .node-popup { min-width: 240px; }
 
         .node-popup h4 {
-            color: #00d4ff;
+            color: var(--accent);
             margin-bottom: 4px;
             font-size: 1.1em;
         }
@@ -1475,7 +1875,7 @@ DASHBOARD_HTML = """
         .node-popup-id {
             font-size: 0.75em;
             color: #666;
-            font-family: 'Monaco', 'Consolas', monospace;
+            font-family: var(--mono);
             margin-bottom: 8px;
         }
 
@@ -1494,6 +1894,7 @@ DASHBOARD_HTML = """
         }
 
         .node-popup-row:last-child { border-bottom: none; }
+        .node-popup [hidden] { display: none; }
 
         .node-popup-label { color: #888; }
         .node-popup-value { color: #fff; font-weight: 500; }
@@ -1511,10 +1912,10 @@ DASHBOARD_HTML = """
             cursor: pointer;
             font-size: 0.8em;
             font-weight: 600;
-            transition: all 0.15s;
+            transition: background-color 0.15s, border-color 0.15s, color 0.15s;
         }
         .node-popup-actions .btn-dm {
-            background: #00d4ff;
+            background: var(--accent);
             color: #0a0a0f;
         }
         .node-popup-actions .btn-dm:hover { background: #33ddff; }
@@ -1525,10 +1926,10 @@ DASHBOARD_HTML = """
         .node-popup-actions .btn-trace:hover { background: #33ff99; }
         .node-popup-actions .btn-detail {
             background: transparent;
-            border: 1px solid #2a2a4a;
+            border: 1px solid var(--border-dim);
             color: #aaa;
         }
-        .node-popup-actions .btn-detail:hover { border-color: #00d4ff; color: #00d4ff; }
+        .node-popup-actions .btn-detail:hover { border-color: var(--accent); color: var(--accent); }
         .node-popup-actions .btn-center {
             background: rgba(255,255,255,0.08);
             color: #aaa;
@@ -1544,8 +1945,8 @@ DASHBOARD_HTML = """
         }
         .node-popup-traceroutes.visible { display: block; }
         .popup-tr-item {
-            color: #00d4ff;
-            font-family: 'Monaco', 'Consolas', monospace;
+            color: var(--accent);
+            font-family: var(--mono);
             font-size: 0.85em;
             padding: 2px 0;
         }
@@ -1566,6 +1967,8 @@ DASHBOARD_HTML = """
             flex-wrap: wrap;
             gap: 6px 12px;
             max-width: 280px;
+            contain: layout paint;
+            transform: translateZ(0);
         }
         .map-hop-legend-title {
             width: 100%;
@@ -1591,7 +1994,7 @@ DASHBOARD_HTML = """
         .legend-toggle {
             background: rgba(0, 212, 255, 0.15);
             border: 1px solid rgba(0, 212, 255, 0.3);
-            color: #00d4ff;
+            color: var(--accent);
             font-size: 0.6em;
             padding: 2px 6px;
             border-radius: 4px;
@@ -1643,24 +2046,38 @@ DASHBOARD_HTML = """
             gap: 6px;
         }
         .update-info span { color: #888; }
-        .update-info #refresh-mode { color: #00d4ff; font-size: 0.95em; }
+        .update-info #refresh-mode { color: var(--accent); font-size: 0.95em; }
         .update-info .historical { color: #ffa502; }
         .header-divider { color: #444; }
         .timeline-toggle-btn {
             background: rgba(255,255,255,0.05);
-            border: 1px solid #2a2a4a;
+            border: 1px solid var(--border-dim);
             border-radius: 12px;
             padding: 3px 10px;
             color: #888;
             font-size: 1em;
             cursor: pointer;
-            transition: all 0.15s;
+            transition: background-color 0.15s, border-color 0.15s, color 0.15s;
         }
         .timeline-toggle-btn:hover { background: rgba(0,212,255,0.1); color: #aaa; }
         .timeline-visible .timeline-toggle-btn {
             background: rgba(0,212,255,0.2);
-            border-color: #00d4ff;
-            color: #00d4ff;
+            border-color: var(--accent);
+            color: var(--accent);
+        }
+
+        /* Backdrop blur resamples the map under the overlay on every repaint;
+           weak GPUs and reduced-transparency users get a solid panel instead */
+        body.low-gpu .map-stat,
+        body.low-gpu .map-hop-legend {
+            backdrop-filter: none;
+            background: rgba(15, 15, 26, 0.96);
+        }
+        @media (prefers-reduced-transparency: reduce) {
+            .map-stat, .map-hop-legend {
+                backdrop-filter: none;
+                background: rgba(15, 15, 26, 0.96);
+            }
         }
 
         @media (max-width: 900px) {
@@ -1672,40 +2089,60 @@ DASHBOARD_HTML = """
             .sidebar { grid-row: 2; }
         }
 
-        /* MarkerCluster overrides for dark theme */
-        .marker-cluster-small {
-            background-color: rgba(0,212,255,0.3);
-        }
-        .marker-cluster-small div {
-            background-color: rgba(0,212,255,0.6);
-        }
-        .marker-cluster-medium {
-            background-color: rgba(0,170,255,0.3);
-        }
-        .marker-cluster-medium div {
-            background-color: rgba(0,170,255,0.6);
-        }
-        .marker-cluster-large {
-            background-color: rgba(85,119,255,0.3);
-        }
-        .marker-cluster-large div {
-            background-color: rgba(85,119,255,0.6);
-        }
+        /* MarkerCluster overrides for dark theme. The size classes only set
+           colour variables; one rule per layer reads them. */
+        .marker-cluster-small { --cl-rgb: 0,212,255; }
+        .marker-cluster-medium { --cl-rgb: 0,170,255; }
+        .marker-cluster-large { --cl-rgb: 85,119,255; }
         .marker-cluster div {
             width: 30px; height: 30px; margin-left: 5px; margin-top: 5px;
             text-align: center; border-radius: 15px;
             font: 12px 'Segoe UI', sans-serif; color: #fff; font-weight: 700;
             line-height: 30px;
+            background-color: rgba(var(--cl-rgb), 0.6);
         }
         .marker-cluster {
             background-clip: padding-box; border-radius: 20px;
+            background-color: rgba(var(--cl-rgb), 0.3);
+            contain: layout paint;
         }
     </style>
 </head>
 <body>
+    <!-- Row prototypes, cloned by the list renderers -->
+    <template id="tpl-message">
+        <div class="message-item">
+            <div class="message-header">
+                <span class="message-from"></span>
+                <span class="dm-badge">DM</span>
+                <span class="message-time"></span>
+            </div>
+            <div class="message-text"></div>
+            <div class="message-meta">
+                <span class="message-snr"></span>
+                <span class="message-rssi"></span>
+            </div>
+        </div>
+    </template>
+    <template id="tpl-node">
+        <div class="node-item">
+            <div class="node-avatar"></div>
+            <div class="node-info">
+                <div class="node-name"></div>
+                <div class="node-id"></div>
+            </div>
+            <div class="node-stats">
+                <div class="node-signal"></div>
+                <div class="node-lastseen"></div>
+            </div>
+            <button class="node-trace-btn" title="Request traceroute">TR</button>
+        </div>
+    </template>
+
     <div class="header">
         <div class="logo">
-            <img class="logo-icon" src="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAEYAAABACAYAAACndwGZAAAS0klEQVR42u2aeXCdZ3XGf++33FVX+2o7XqVrrY6txbLsLHYSHAIJiUnSJKShQwt0KFDolBYYWgptp5ShLaFl6AxtBwK0pcMSEkJZEoKz2I4sW46txVq9yLJl7brS1V2/7zv945PlSHZIIiuEzujoD+l+uvddnvec5zznvBdWbMVWbMVWbMVWbMVWbMVWbMVWbMVWbMVWbMVWbMVW7JJV1W2T/8/rV8s1UHVdrWypriIvLxelFCKAuDNMTkxx7PgJOo61vu75SmsrpK/1pHqrgDGWY5B7H3pQ1l63msEL5zlw+BCtLx6e39C2XY0SXl9Kblb2/PvL6ipEaQpBwIbeqwBwNVDKaisE3QW898ibC9o1D/7xT/ypzMRm+I+vfV0B7Lr9ZllTshrTMInFY3R39dJx9GW1qW6zmH4TJ+3Q09y5LJsqq68UpaCnpVP9VgHzwT/6sExMj/P973xX3XTHLbKzoREHh0g0QspKEwwGyM3Mo7Ong5dPttH3UtebdspldRUC0Ht0eTxpyYPcve9eycgM8p+PfUvdce9dctuePfzkFz/l2SefVqVNmyWjyMfk5DQhMgmZmRx65oXfCF+U1lVI3zKAs+QB/vjjH5d/fvRRtaWxTu65805+/PRTxCXG3pveRk5OLpoByXiaFw8f5OL5YTRLo6u1fX6+LXW1cuJoqyqrr5DXwxdl9ZWidPdvJy28FjGX1VdK75Glh9iSyPfeBx6Uc+cHAWjYVkdzy2GOPX9Ufe6fPi+TU2M88b+PY6Vt6utrKSzMZ3hoBD3g7urW39krb/uznRiZJt96n5ITB4++rsUv3uS+P98njR/dStcTp/nmR76pXu394foq6TnS8YYB0pYCTGFhPv2nTwPg83rpG+7jnb9/l4yNjvPT539OzT1buPFju+mb6qfrbBeZa4Kk0il2PnCz7P3ybijSEK8QyPYv2dUz1gdJazZ1D1fwV8986lU1U8+RDhXeXiW/EWCUpjhx5KjacfNNkpEfJC5xSjJLGDh7lqLwKnY8UM+O22uofscWDNMkOp6gsKSIfV/aS8cvujnz8gVSSZuZi7NLBmZ6MErQ46Pjf3rwbvDywe98QADKGq8Eoedwhyp7g+AsCZivfeVfXNcMCcOTo1w4PKhO9Z1mfHICK2ERi8xiWzbTFyIkJ9Oc/NUJdesndjF5aoLun5zEl+0lMhmlo/WYKmuslHBDpZTVVsirCb2y+koJN1ZKuLFKwnMbT4wl8Ps9jI9O8tTnn2XT2zdy90f2SW9zhyq/oeaKsXoPd6iy+tcPzpIF3uYd1TI5McUL+w9S0bRFBobOYQRNsvNCPP1v+1lXtIHciXxOvtim9n36PklnC83/foTiqjxyV+Vwvv2iu+DX0DSvRrKzkQQzsSShTdkkjp+i78le9nxsB0989XG6XmxTZfWVIiK8MkP1HnHB6X0dnKMtFZjul9pV98E21d96UllJC2/ISzDfT2omzYXWEZ797n4CKsieu26T2n1V9P+8l3gyjqa8BLODpCbS15ROpwYiRCNxQnkhcq/LZKD9FLPpBPf/xQNyiXz7jp68gl96j3SocMNre47GMpjSFWZQJzGZIjacQBKAaLx0rIXbbr2VdCzN9NAEnoCJLYLmBZmxr2nO9kPHVGImRVZRJobuwTHTdD/fy9pbr7uCX8qbFoZWT0uHCjdWy5teKxkBk9hIip6WdhWurZKu1jZV0bRVzkXOMdgzTHwoApkWakLhzTSxxSIdcz2mbHuliAaarkBd+q3AAXGcy1JLBCftcsX8xEnwFnrQNRPMJOc7zrN65zq23rRdXn7+cr3WdahNbd5RI90vtc0/62luV+U7aqTrFc+W1WM276iRzudeVj0trnjrae1Q4foaUV7h9IFuNeIfJIcCdKVjejSCuUEccUhZLjBGloFmustQouh6rl117W9T6VkLZWguLhqIrlBeRfiGKindUSkAhmjoXg1RYDuQiichJRRXFlwl9NvU5kVe0vVSm9pcf3XPuSZgwg1VC07hkul+jc79xxVA1i2ZpHNSZI4VIppFRlYGIiBzKlY0sC0b0aH7QLu6+ZE9csen7pDcgiy69rcpPeBW4WILSnOlgtIVVY21Ypo6tuagGRqOJWgehRWzyFgVuup67bRDWd1CfhH1JnBMT8uV7F7eVCMnXzg+/zwjM0TvRDc56UKY8uALmGBBRknABTGpkV+YS3ZGlkuqIxEa31/NPY/u5t6/3CedP29ToYwgpq3T/Vy76n6+XfUe6FCGVwevwrHsOc9SCGClLHTTnb5810Ju6WvtVEpXi/bQrjY3Xpnel8wx4e3V0nO4fcEsmxurpevQQg/yOSb+XJOR8SEK0mtJkyQzEMDAdZk19cXUva8cJ+Kw/Q8rZfrMDImhOIkMjS0Pl+Ek75a1e4r45RcP07hvh2SvyiQyEMXRFI5PcCwH3dBRhkIsIa0sYjNxN1QOtKnwzmrpOXh5nT2H21V5U7V0Hbr8rLv5Sq/XltYHqboClPD2aulubr9iguR4ktUbV3FBP0V+Xh7TxxP89LP7Ge8e4/6/vVuyCgMkphKI7lCwMZuyt6/DyDBQlmDNptn63jLMDJNdH9vKLZ9rYNdHt7Lt4UpsyyIRSyAAtoNmgKZpeENeJs5OXfaIg+1qsRruOtR+hdgLL/KaJXnM1QTSYqDKGiqlt6VTjXVPsq5pFZpHMSj9xA86rP7dbDbVXoedcrDsNFbcQhDSKQuVFJSmMHQDpSCdsDB9GrnXhbCTwtR4lMHjQ4RyMzBtAyftEIvGsD0WwawQmaEAU32RhYtzrsIhxqKQWuQ1b9hjwleR1eHtVzK78ik2NVbI6cPnyCgOEAxlMxOYYEqbwOvxMnVxmuRMGitmo6HQlHJ3oEAhc68VSoGm3P97DAN/jkn9B6rY9nApXY/3IXEBj00qZlFYXsLs2RgdzccWbLK3pUNtXqRlul9qV2WLhF55w+X3vGFgFpfwZbVXhlVZU5WIBaZfZ+z8OKMnxjFSXoYOR1hXX0woy4vp0UFz0PS5rKNwm7kiiCOIY4MImq7QNQ1N09A0hXKE6NAMgRIvvmyDtv9uZ6JvhplTKcp2bOD4Dzvcw1pEvN2H2lRp7UIgdH3h9h3bWT6Bt5jlS2srRWkgDoi4Ieb/sldq7t7Ehg82kF0eQmzAwgVEACVoKFCaK+jEmdN1gsLVMjJ344BSeLwGTlIovXUVqUSagsFMZrrj7P+7F3n620+rsp3VIs6V8uRStnqljllw6K2XD/2aBd4lYTcPlNe9OtFMje7n2lXd3gbZ+8UmKu/byOrrS1ApHSyFZdvIHHqadilsNJQCpRSars2Do+kamgaO47hgKYVp6CjAF/IQWhNkzW2FFN6YPdfhc0++bOfCEL9acti8iAbCde7raxR4V1GNc/tRcyNvum0tDg7jQxGiU7N4dC+mboISHByUAh0DTSkcW+bvokRAzf3YtltX6WiIJTiOjaZpmJoHTTQMpTHcM47jUzS95wbpb+lUmu7yU2ltpSyUFAtDTBbtoOeoC941ASP2wlHLmuZieC4iSusrpO2HvcRG43h8BraA5diIAo/mITaVBE2b+8Al+a9wRFyQUDiOYDuCYzPvUYjCEXCUIIA/4MWf7SHaE+PQf72oyhqrRMQNU+VduEVZhMRij1+WUOptXUjESnfrP6W54dR35KR6xyd3kV+RTXLawppNMx2fxtEdUhFBxXR8GT6isVls5eAL+HFsBwE03UQEbHHAcRVuIp3ASoKOF9t2iCcTxKeSxGeS+ENeSveu5v6/vld6mzsuK1z918sKgNKrZNolAxNeVHOU1l3qwLn8kJxOcdPDu6WgPBctaZAYSzE5FCGQ5cWf4aXrmX66nziNpB0y8gJIGvZ/5QizF5N4vV7iqRhig6l7iU7FiU7F8GYZJJJpLr48Sl5BJp4MD2NDk0wORAhlZTA9MkNRfQ5Vu7aKnbTdQwI2LVrrYnGnlGJxpl1yVnKd+BWDG8qtyJSbdc+0dqvyXRslQQrDb+DxGRz+RhupmQ1cODKK5oW8mmye/vuDhHIziM3ESSQSnH5ukPzKagLKj9hCIMvH8e91YXltNuqrObV/kPG2CabPRTFXm/Q/P0Du+gwy12egmTq6R2F4DRLJFJhqPuUv7ln/ujuk3tYOtWyXYOGmKrl0RJqmsC2boCfAHZ/dxcjYJCcf76Ns5yranzpD3ImztqEEdEUw5MOb5yEQ8pC5KkTzYyfI9GZSccMGElqaMy2DzIxFCRb4mB1NYkdt8sozGewYY3YozvZ91YwOTRKdibP5HRuJdET4wWefVOFd1SLO3BcLBHpfkZHCDdXyatyy7N92CDe5GWpOsKJ0hZ206W3uVNv3NsnmO9ciYhFNzOLNN0nMplGOMNUTpeLmzRRvLSQaT5KIzDBybISxsxE0W8PINVl1YwlF+dl0/qif2dQsgSIfmkdH1yF2KsXG2g0MNA9w6sAF2g8dV6Xbq0TpypVDIijUAm4J11VJz9Ff3/c1lguYS3lPlJtixRaMoDv8tneVY/g0XvhZC3nVATImghhBH4YH8rdlMdQ1Qm5NHoaukVdYQGB3BnnxKKZmEvT5UX6dyNlZZqNRsip8pGMKSTkk0xZj1jiRH8zQ9Mg2LvZMzoe12C4g6lJ4L0jJr90MN5YTl3lVjxtV8+oz22GofYz7ah5g1YZinvjZk3QP9lGwLhfJc7BjgkzZ+At8jA5ECGZ7KSooYno0SiKWpiA3wOCZC8RmU2QNZDPcPkTk/CwleSV8+OE/4dmxX3L+9EU8OeZ8GIi4pYZaYlAso8dc4t45haaBEqhsvF4y1gYY6LjAu/fdQ3FJMe9/7x/Mr/bL//BVGUuOMZkcJNhtk5UXJJjnR9MVZmEWEz1TTKs4CTvJ+2s/xGw8yke+/yEF8M5PvFPe++DDnBk4RUviAPnh7FeQqzNXWMuSoNFYZpM599EMjZPPtamK3RvIyg8SKsngsR8/hsf08jdf+ILcsHuPfPIzn5F33XUPETXG1MA0eq5BzvosbIG0ZaNMjZJtRUyPzJJMpomkpiguKeHGW/bI/Q89JJ/+zCfpau/hxNQxMnMyKd6Sx/W768RK2q56dhvJb+1XzUq3V7oFsq5QGtiWg1f38uCX9qIFYbBrjHP9A1Ql6nlo3yPYloNNmq9841HOJvrY/Xs7yarMIjmTmmdwpUAzwDRN+p86w9GftfHI7Y+wd+defL4A7Z0d/OsTj7LurkLiEYfs9QHOPjPMD//6R6qsqVqcOWWuBPpa3tjF/vKFkjPXyRdXMPU3n1TltTVipwWf8mA6BmuvX83zv3qGI48dJDOYxcjYMP4MH5vKN+LL9zB6ZgTT4yUjO4ToCidpMzUewR/0kluRzYYzq/ne8cf4cfcP8BsBpq0JPGEv3lCQxPg0ftOc1yiOfYnnrixdfqPA9B3pVKXbKwVx0yRAdnEII0eRtC3SVppAQSZr1q8mlZglOTtNwfpCcoryKFmTwzP/+AJ6vrC2oRjdF0Dz6CjLIjoSpfeZQcLbNrJ2+2qMMyajw8PYmTGyVYiiilXYCPHYLMmkj4y1PpcjlFtnAfS3dqq3lGNEcBczd0Dh29Yza8WJJKM4hoOKK7beXkPxhvWEt1XR8O5tJOJJzLCP9Q3rmD1mc/zb/UxeHCMVnebskSGOf70P74yXwu2FJHOFYFGIm95zA9et38iq6g1satjEzOAMtsdieHiSwCoPO++7UXqb29UlFf7WZiXmO5PYSYfyuhopuT4fO26TSiXJ35TD9Kk4TrFiw841KE1jqneKrEAAn+Gh+p7NVL07TMeTPZx67jTxVXFUxMNtX9xNcTgXSTkk0jZn2iLYAbiu6To8AQ8XTgyRiscJ5PtJRFPYIZvCyuy5U1dzPZy3OCv1H+1Uas51PQGTUy+eQ+KC3+/D4zXJ3ZTBYPMF0mMWKGFsdBp/rhePaTA9FWV2Jk79QzVcf2c1I+0xbvz0dgo35jATiROdTqDFQPcoYpE4mqYYPjHCxd4hsta799eBbD+TvVGmL8bm67mlhNGbk67FrV5PvNCq+g8MEiz04/f4wQLDp1NUnsVAywDR8VlCIT+x6SRjFyJ4Aia6rTE1OkNgY4Dqt4exNGF6YhaPbqA5ivYfdeNVJqGAn7PHzjHYfZa8DVk4tqDrOqbXAA2e/fovrznbLjswfa2dypkLbG+mB103UbgNJitho0whryrEVPcU6ek0mDDSMoqKC5pfQ3k1dE0jkUjhDXgwPDqeTA/TvdMUl+ejAhqDrReIDI8TWO0jGUuC47Y7DWWge9wtbaytkL7DHeq3Bhi4XArMXIiRmIzjiAUKHGxSyTSGx6CoIofISITkWJJ19cUc/uYJRrvHkYhN30/OcOLxTgaPDGHYGp2P9zBydpy11xdztnmQaGKKzJIAknawHAtH3BYpukNsKLEsCu3/ANLKl+X2CljVAAAAAElFTkSuQmCC" alt="LoRaLlama">
+            <img class="logo-icon" src="/logo.png?v={{ image_versions.logo }}" alt="LoRaLlama"
+                 width="70" height="64" fetchpriority="low" decoding="async">
             <h1>LoRaLlama Dashboard</h1>
         </div>
         <div class="header-stats">
@@ -1751,7 +2188,7 @@ DASHBOARD_HTML = """
         <div class="map-section">
             <div id="map"></div>
             <div class="map-overlay">
-                <div class="map-stat map-range-bar">
+                <div class="map-stat map-range-bar" data-toolbar="map-range">
                     <button class="range-btn map-range-btn active" data-range="all">ALL</button>
                     <button class="range-btn map-range-btn" data-range="7d">7D</button>
                     <button class="range-btn map-range-btn" data-range="24h">24H</button>
@@ -1798,12 +2235,12 @@ DASHBOARD_HTML = """
                 <div class="tab-header-info">
                     <span>0</span> messages
                 </div>
-                <div class="msg-view-toggle">
+                <div class="msg-view-toggle" data-toolbar="msg-view">
                     <button class="msg-view-btn active" data-view="all">All</button>
                     <button class="msg-view-btn" data-view="dms">DMs</button>
                 </div>
                 <div id="msg-view-all" style="display:flex;">
-                    <div class="msg-range-bar">
+                    <div class="msg-range-bar" data-toolbar="msg-range">
                         <button class="range-btn msg-range-btn active" data-range="all">ALL</button>
                         <button class="range-btn msg-range-btn" data-range="24h">24H</button>
                         <button class="range-btn msg-range-btn" data-range="6h">6H</button>
@@ -1876,7 +2313,7 @@ DASHBOARD_HTML = """
             <div class="tab-content" id="tab-stats">
                 <div class="stats-panel">
                     <!-- Filter Bar -->
-                    <div class="stats-filter-bar">
+                    <div class="stats-filter-bar" data-toolbar="stats-range">
                         <span class="filter-label">Range:</span>
                         <button class="filter-btn" data-range="1h">1H</button>
                         <button class="filter-btn" data-range="6h">6H</button>
@@ -1962,7 +2399,7 @@ DASHBOARD_HTML = """
                                 <div class="hop-seg hop-6" style="width:12.5%">6</div>
                                 <div class="hop-seg hop-7" style="width:12.5%">7</div>
                             </div>
-                            <div class="hop-legend" id="hop-legend"></div>
+                            <div class="hop-legend" id="hop-legend"><span></span><span></span><span></span><span></span><span></span></div>
                             <div class="health-metrics-row">
                                 <div class="health-metric">
                                     <span class="health-metric-label">Avg SNR</span>
@@ -2007,7 +2444,11 @@ DASHBOARD_HTML = """
                         <div class="chart-wrapper">
                             <div class="chart-y-axis" id="chart-y-axis"><span>0</span></div>
                             <div class="chart-body">
-                                <div class="chart-container" id="activity-chart"></div>
+                                <div class="chart-container" id="activity-chart">
+                                    <canvas id="activity-canvas"></canvas>
+                                    <div class="chart-tooltip" id="chart-tooltip" hidden></div>
+                                    <div class="chart-empty" id="chart-empty" hidden>No activity data</div>
+                                </div>
                                 <div class="chart-x-axis" id="chart-x-axis"></div>
                             </div>
                         </div>
@@ -2039,7 +2480,7 @@ DASHBOARD_HTML = """
                                 <button class="trace-all-btn cancel" id="trace-cancel-btn" onclick="event.stopPropagation(); cancelTraceAll()" style="display:none">Cancel</button>
                             </span>
                         </div>
-                        <div class="network-section-body" id="traceroutes-list">
+                        <div class="network-section-body network-list" id="traceroutes-list">
                             <div style="color:#555;font-size:0.8em">Loading...</div>
                         </div>
                     </div>
@@ -2049,7 +2490,7 @@ DASHBOARD_HTML = """
                         <div class="network-section-header" onclick="toggleNetSection(this)">
                             <span><span class="section-arrow">▼</span> Store & Forward</span>
                         </div>
-                        <div class="network-section-body" id="sf-stats-list">
+                        <div class="network-section-body network-list" id="sf-stats-list">
                             <div style="color:#555;font-size:0.8em">Loading...</div>
                         </div>
                     </div>
@@ -2059,7 +2500,7 @@ DASHBOARD_HTML = """
                         <div class="network-section-header" onclick="toggleNetSection(this)">
                             <span><span class="section-arrow">▼</span> Sensor Alerts</span>
                         </div>
-                        <div class="network-section-body" id="alerts-list">
+                        <div class="network-section-body network-list" id="alerts-list">
                             <div style="color:#555;font-size:0.8em">Loading...</div>
                         </div>
                     </div>
@@ -2069,7 +2510,7 @@ DASHBOARD_HTML = """
                         <div class="network-section-header" onclick="toggleNetSection(this)">
                             <span><span class="section-arrow">▼</span> Paxcounter</span>
                         </div>
-                        <div class="network-section-body" id="pax-list">
+                        <div class="network-section-body network-list" id="pax-list">
                             <div style="color:#555;font-size:0.8em">Loading...</div>
                         </div>
                     </div>
@@ -2112,6 +2553,113 @@ DASHBOARD_HTML = """
     </div>
 
     <script>
+        // ==================== ELEMENT REGISTRY ====================
+        // Elements the live-update paths write on every tick, looked up once.
+        // Keys are the camelCased ids: els.statRx is #stat-rx.
+        const els = {};
+        [
+            'status-dot', 'status-text', 'connection-bar', 'last-update', 'header-packets', 'header-messages',
+            'header-nodes', 'tab-messages-count', 'tab-nodes-count', 'tab-active-count', 'tab-gps-count', 'stat-rx',
+            'stat-tx', 'stat-nodes', 'stat-active', 'stat-packets', 'stat-telemetry', 'stat-positions',
+            'stat-dbsize', 'stat-waypoints', 'stat-traceroutes', 'stat-rangetests', 'stat-alerts', 'stat-avg-snr',
+            'stat-ch-util', 'stat-air-tx', 'hop-bar', 'hop-legend', 'top-nodes-content', 'packet-types',
+            'chart-range-label', 'chart-y-axis', 'chart-x-axis', 'activity-canvas', 'chart-tooltip', 'chart-empty',
+            'msg-view-all', 'msg-view-dms', 'message-list', 'node-list', 'channel-select', 'timeline-date',
+            'refresh-mode', 'sync-now-btn',
+        ].forEach(id => { els[id.replace(/-(\\w)/g, (_, c) => c.toUpperCase())] = document.getElementById(id); });
+        Object.freeze(els);
+
+        // ==================== DOM BATCHING ====================
+        // Layout reads and DOM writes queued here run together on the next
+        // animation frame, all reads before any writes, so a burst of packets
+        // costs one style recalc instead of one per update. Work queued while
+        // a frame is flushing lands in the following frame.
+        const domQueue = { reads: [], writes: [], scheduled: false };
+
+        function flushDomQueue() {
+            const reads = domQueue.reads, writes = domQueue.writes;
+            domQueue.reads = [];
+            domQueue.writes = [];
+            domQueue.scheduled = false;
+            reads.forEach(fn => fn());
+            writes.forEach(fn => fn());
+        }
+
+        function scheduleDomFlush() {
+            if (domQueue.scheduled) return;
+            domQueue.scheduled = true;
+            requestAnimationFrame(flushDomQueue);
+        }
+
+        function measure(fn) { domQueue.reads.push(fn); scheduleDomFlush(); }
+        function mutate(fn) { domQueue.writes.push(fn); scheduleDomFlush(); }
+
+        // Batched textContent write that skips unchanged values; takes an
+        // element (usually from els) or an id
+        function setText(target, value) {
+            mutate(() => patchText(typeof target === 'string' ? document.getElementById(target) : target, value));
+        }
+
+        // Write-phase helper: only touch the text when the value changed. A
+        // lone text node is rewritten in place instead of being replaced.
+        function patchText(el, value) {
+            if (!el) return;
+            const text = String(value);
+            const node = el.firstChild;
+            if (node && node.nodeType === Node.TEXT_NODE && !node.nextSibling) {
+                if (node.data !== text) node.data = text;
+            } else if (el.textContent !== text) {
+                el.textContent = text;
+            }
+        }
+
+        // Bookkeeping nothing on screen waits for runs when the main thread
+        // is idle (within `timeout` ms at the latest)
+        function whenIdle(fn, timeout = 2000) {
+            if (window.requestIdleCallback) requestIdleCallback(fn, {timeout});
+            else setTimeout(fn, 0);
+        }
+
+        // ==================== INTERACTION STATE ====================
+        // body.interacting is set while pointer drags, wheel, scroll or the
+        // timeline scrubber are active and cleared after a short idle
+        const INTERACTION_IDLE_MS = 250;
+        let interactionTimer = null;
+
+        function markInteracting() {
+            if (!document.body.classList.contains('interacting')) {
+                document.body.classList.add('interacting');
+            }
+            clearTimeout(interactionTimer);
+            interactionTimer = setTimeout(() => document.body.classList.remove('interacting'), INTERACTION_IDLE_MS);
+        }
+
+        ['pointerdown', 'wheel', 'scroll'].forEach(type =>
+            document.addEventListener(type, markInteracting, {capture: true, passive: true}));
+        document.addEventListener('pointermove', (e) => { if (e.buttons) markInteracting(); },
+            {capture: true, passive: true});
+
+        // Drop backdrop blur on few-core machines, or when the first second of
+        // frames already runs well under 60fps.
+        const LOW_GPU_FRAME_MS = 25;
+
+        function detectLowGpu() {
+            if ((navigator.hardwareConcurrency || 8) <= 4) {
+                document.body.classList.add('low-gpu');
+                return;
+            }
+            let frames = 0, start = 0;
+            function sample(ts) {
+                if (!start) start = ts;
+                if (++frames < 60) return requestAnimationFrame(sample);
+                if (!document.hidden && (ts - start) / (frames - 1) > LOW_GPU_FRAME_MS) {
+                    document.body.classList.add('low-gpu');
+                }
+            }
+            requestAnimationFrame(sample);
+        }
+        detectLowGpu();
+
         // Initialize map
         const map = L.map('map', {
             center: [30.2672, -97.7431],  // Austin, TX (change to your location)
@@ -2126,6 +2674,51 @@ DASHBOARD_HTML = """
             maxZoom: 19
         }).addTo(map);
 
+        // Marker labels are drawn once per short name into a bitmap so the
+        // shadow blur isn't repainted for every visible marker on each pan.
+        const LABEL_PAD = 4;
+        const labelImages = new Map();
+        let labelCanvas = null;
+
+        function markerLabelHtml(label) {
+            if (!label) return '';
+            let img = labelImages.get(label);
+            if (img === undefined) {
+                img = renderLabelImage(label);
+                labelImages.set(label, img);
+            }
+            if (!img) return `<div class="marker-label">${escapeHtml(label)}</div>`;
+            return `<img class="marker-label" src="${img.src}" width="${img.width}" height="${img.height}" alt="${escapeHtml(label)}">`;
+        }
+
+        function renderLabelImage(label) {
+            labelCanvas = labelCanvas || document.createElement('canvas');
+            const ctx = labelCanvas.getContext('2d');
+            if (!ctx) return null;
+            const dpr = window.devicePixelRatio || 1;
+            const font = `600 10px ${getComputedStyle(document.body).fontFamily}`;
+            ctx.font = font;
+            const width = Math.ceil(ctx.measureText(label).width) + LABEL_PAD * 2;
+            const height = 10 + LABEL_PAD * 2;
+            labelCanvas.width = width * dpr;
+            labelCanvas.height = height * dpr;
+            ctx.scale(dpr, dpr);
+            ctx.font = font;
+            ctx.textBaseline = 'top';
+            ctx.fillStyle = '#e0e0e0';
+            ctx.shadowColor = '#000';
+            ctx.shadowBlur = 3 * dpr;
+            // Two passes darken the halo the way the stacked text-shadows did
+            ctx.fillText(label, LABEL_PAD, LABEL_PAD);
+            ctx.fillText(label, LABEL_PAD, LABEL_PAD);
+            return {src: labelCanvas.toDataURL(), width, height};
+        }
+
+        // Idle pond ripple rings, carried by every marker and started by .rippling
+        const RIPPLE_RINGS_HTML = '<div class="ripple-ring ripple-ring-1"></div>'
+            + '<div class="ripple-ring ripple-ring-2"></div>'
+            + '<div class="ripple-ring ripple-ring-3"></div>';
+
         // Custom marker icon - static colored circle (no permanent animation)
         function createMarkerIcon(color = '#00d4ff', label = '') {
             return L.divIcon({
@@ -2136,25 +2729,47 @@ DASHBOARD_HTML = """
                     border: 3px solid #fff;
                     border-radius: 50%;
                     box-shadow: 0 2px 10px rgba(0,0,0,0.5);
-                "></div>${label ? `<div class="marker-label">${label}</div>` : ''}`,
+                "></div>${markerLabelHtml(label)}${RIPPLE_RINGS_HTML}`,
                 iconSize: [24, 24],
                 iconAnchor: [12, 12]
             });
         }
 
-        // Node markers and cluster group
+        // One shared divIcon per colour and label; markers switching colour
+        // swap to a pooled icon instead of building a new one
+        const markerIcons = new Map();
+
+        function markerIcon(color, label) {
+            const key = color + '|' + label;
+            let icon = markerIcons.get(key);
+            if (!icon) {
+                icon = createMarkerIcon(color, label);
+                markerIcons.set(key, icon);
+            }
+            return icon;
+        }
+
+        // Node markers and cluster group. nodePositions mirrors each marker's
+        // lat/lng as plain numbers so diffing and follow mode never call into Leaflet.
         let nodeMarkers = {};
+        const nodePositions = new Map();
         let clusterGroup = L.markerClusterGroup({
             maxClusterRadius: 40,
             spiderfyOnMaxZoom: true,
             showCoverageOnHover: false,
             zoomToBoundsOnClick: true,
-            disableClusteringAtZoom: 15
+            disableClusteringAtZoom: 16,
+            removeOutsideVisibleBounds: true,
+            // Add large marker sets in slices so the first load doesn't freeze the page
+            chunkedLoading: true,
+            chunkInterval: 50,
+            chunkDelay: 20
         });
         map.addLayer(clusterGroup);
 
         // Cached nodes for search/sort
         let cachedNodes = [];
+        let cachedMessages = [];  // the live message list, which deltas merge into
         let nodeSearchTerm = '';
         let nodeSortBy = 'last_seen';
         let nodeSearchTimeout = null;
@@ -2166,23 +2781,89 @@ DASHBOARD_HTML = """
         let followMode = false;
         let followRestoreTimeout = null;
         let followSavedView = null;
-        let seenMessageIds = new Set();
+        // Message keys already shown, oldest first in seenMessageOrder; capped
+        // so a long-running tab doesn't keep every key it has ever seen
+        const SEEN_MESSAGE_LIMIT = 5000;
+        const seenMessageIds = new Set();
+        const seenMessageOrder = [];
         let initialMessageLoad = true;
+        let lastRenderedMessages = null;  // polled arrays keep their identity while unchanged
 
-        // Apply ripple ring DOM elements to a marker element
+        // Start the marker's built-in ripple rings
         function applyRippleRings(el) {
-            el.querySelectorAll('.ripple-ring').forEach(r => r.remove());
-            ['ripple-ring-1','ripple-ring-2','ripple-ring-3'].forEach(cls => {
-                const ring = document.createElement('div');
-                ring.className = 'ripple-ring ' + cls;
-                el.appendChild(ring);
+            el.classList.add('rippling');
+        }
+
+        // Promote the marker to its own layer, then start the animation on
+        // the next frame so the layer already exists when it begins
+        function startNodeAnimation(el, cls) {
+            mutate(() => {
+                el.classList.add('node-animating');
+                mutate(() => el.classList.add(cls));
+            });
+        }
+
+        // Packets from a node within ANIM_BURST_WINDOW_MS of the animation
+        // that opened the window join it as a count badge instead of each
+        // restarting the keyframes. A message still breaks into a data burst.
+        const ANIM_BURST_WINDOW_MS = 2000;
+        const nodeBursts = {};
+
+        function joinBurst(nodeId, type, marker) {
+            const now = Date.now();
+            const burst = nodeBursts[nodeId];
+            if (burst && now - burst.at < ANIM_BURST_WINDOW_MS && (burst.type === type || burst.type === 'message')) {
+                burst.count++;
+                const el = marker.getElement();
+                if (el) mutate(() => { el.dataset.count = '×' + burst.count; });
+                return true;
+            }
+            nodeBursts[nodeId] = {at: now, type, count: 1};
+            return false;
+        }
+
+        function clearBurstBadge(el) {
+            delete el.dataset.count;
+        }
+
+        // Follow mode fits the view at most once per frame, so a burst of
+        // messages becomes one zoom instead of competing animations
+        let followPending = false;
+
+        function scheduleFollow() {
+            if (followPending) return;
+            followPending = true;
+            requestAnimationFrame(() => {
+                followPending = false;
+                doFollowFit();
             });
         }
 
+        function doFollowFit() {
+            if (!followMode) return;
+            const bounds = L.latLngBounds([]);
+            let count = 0, last = null;
+            for (const nid of recentMessageNodes) {
+                const pos = nodePositions.get(nid);
+                if (!pos) continue;
+                bounds.extend(pos);
+                last = pos;
+                count++;
+            }
+            if (count === 1) {
+                map.setView(last, Math.max(map.getZoom(), 15), {animate: true});
+            } else if (count > 1) {
+                map.fitBounds(bounds, {padding: [60, 60], maxZoom: 17, animate: true});
+            }
+        }
+
         // Animate a node marker — 'message' for text msgs, 'data' for other packets
         function animateNode(nodeId, type) {
+            // Purely visual, so nothing to do while the page is in the background
+            if (document.hidden) return;
             const marker = nodeMarkers[nodeId];
             if (!marker) return;
+            if (joinBurst(nodeId, type, marker)) return;
 
             if (type === 'message') {
                 // Clear previous cleanup timeout
@@ -2204,16 +2885,7 @@ DASHBOARD_HTML = """
                         }
                     }, 30000);
 
-                    const latlngs = [];
-                    recentMessageNodes.forEach(nid => {
-                        const m = nodeMarkers[nid];
-                        if (m) latlngs.push(m.getLatLng());
-                    });
-                    if (latlngs.length === 1) {
-                        map.setView(latlngs[0], Math.max(map.getZoom(), 15), {animate: true});
-                    } else if (latlngs.length > 1) {
-                        map.fitBounds(L.latLngBounds(latlngs), {padding: [60, 60], maxZoom: 17, animate: true});
-                    }
+                    scheduleFollow();
                 }
 
                 // Try to apply visual now, or retry after a short delay (for follow-mode zoom unclustering)
@@ -2221,7 +2893,7 @@ DASHBOARD_HTML = """
                     const el = marker.getElement();
                     if (!el) return false;
                     el.classList.remove('node-data-glow');
-                    el.classList.add('node-msg-throb');
+                    startNodeAnimation(el, 'node-msg-throb');
                     applyRippleRings(el);
                     return true;
                 };
@@ -2234,10 +2906,10 @@ DASHBOARD_HTML = """
                 // Cleanup after 10s
                 rippleTimeouts[nodeId] = setTimeout(() => {
                     const el = marker.getElement();
-                    if (el) {
-                        el.classList.remove('node-msg-throb');
-                        el.querySelectorAll('.ripple-ring').forEach(r => r.remove());
-                    }
+                    if (el) mutate(() => {
+                        el.classList.remove('node-msg-throb', 'node-animating', 'rippling');
+                        clearBurstBadge(el);
+                    });
                     recentMessageNodes.delete(nodeId);
                     delete rippleTimeouts[nodeId];
                 }, 10000);
@@ -2246,10 +2918,14 @@ DASHBOARD_HTML = """
                 if (!el) return;
                 // Don't override an active message throb with a data glow
                 if (el.classList.contains('node-msg-throb')) return;
-                el.classList.add('node-data-glow');
-                setTimeout(() => {
+                startNodeAnimation(el, 'node-data-glow');
+                setTimeout(() => mutate(() => {
                     el.classList.remove('node-data-glow');
-                }, 3000);
+                    if (!el.classList.contains('node-msg-throb')) {
+                        el.classList.remove('node-animating');
+                        clearBurstBadge(el);
+                    }
+                }), 3000);
             }
         }
         let lastKnownUpdate = 0;
@@ -2257,61 +2933,188 @@ DASHBOARD_HTML = """
         let currentStatsRange = 'all';
         let currentMsgRange = 'all';
         let currentMapRange = 'all';
+        // Rows kept in the message list, whatever the range. Every fetch asks
+        // for this many, and live pushes trim the oldest rows beyond it, so the
+        // list never grows past a screenful or two (rows off screen also skip
+        // layout via content-visibility).
+        const MESSAGE_LIST_LIMIT = 50;
         let mapColorMode = 'recency';  // 'recency' or 'hops'
         let cachedMapNodes = [];
 
         // Socket connection
         const socket = io();
+        let lastSocketEventMs = Date.now();
 
         socket.on('connect', () => {
-            document.getElementById('status-dot').classList.remove('offline');
-            document.getElementById('status-text').textContent = 'Connected';
-            document.getElementById('connection-bar').classList.remove('show');
+            lastSocketEventMs = Date.now();
+            els.statusDot.classList.remove('offline');
+            els.statusText.textContent = 'Connected';
+            els.connectionBar.classList.remove('show');
             refreshData();
         });
 
         socket.on('disconnect', () => {
-            document.getElementById('status-dot').classList.add('offline');
-            document.getElementById('status-text').textContent = 'Disconnected';
-            document.getElementById('connection-bar').classList.add('show');
+            els.statusDot.classList.add('offline');
+            els.statusText.textContent = 'Disconnected';
+            els.connectionBar.classList.add('show');
         });
 
-        socket.on('stats_update', updateStats);
-        socket.on('new_message', (msg) => {
+        // Record a message key; false if it was already seen
+        function markSeen(key) {
+            if (seenMessageIds.has(key)) return false;
+            seenMessageIds.add(key);
+            seenMessageOrder.push(key);
+            if (seenMessageOrder.length > SEEN_MESSAGE_LIMIT) {
+                seenMessageIds.delete(seenMessageOrder.shift());
+            }
+            return true;
+        }
+
+        function onNewMessage(msg) {
+            // Already shown by a list refresh (or a repeated push)
+            if (!markSeen(messageKey(msg))) return;
             prependMessage(msg);
             // Throb the sending node on the map (10s animation for text messages)
             if (msg.from_id) animateNode(msg.from_id, 'message');
-            refreshData();
-        });
+        }
 
-        // Tab switching
-        document.querySelectorAll('.tab').forEach(tab => {
-            tab.addEventListener('click', () => {
-                document.querySelectorAll('.tab').forEach(t => t.classList.remove('active'));
-                document.querySelectorAll('.tab-content').forEach(c => c.classList.remove('active'));
-                tab.classList.add('active');
-                document.getElementById('tab-' + tab.dataset.tab).classList.add('active');
+        // All-time row counters pushed by the server as they change, keyed by
+        // table. A 'stats_delta' carries only the counters that moved, so new
+        // traffic updates the counts without refetching the stats payload.
+        const statsState = {};
+        let statsRenderPending = false;
+
+        function scheduleStatsRender() {
+            if (statsRenderPending) return;
+            statsRenderPending = true;
+            mutate(() => {
+                statsRenderPending = false;
+                renderStatsCounters();
             });
+        }
+
+        function renderStatsCounters() {
+            if ('raw_packets' in statsState) patchText(els.headerPackets, statsState.raw_packets);
+            if ('messages' in statsState) {
+                patchText(els.headerMessages, statsState.messages);
+                patchText(els.tabMessagesCount, statsState.messages);
+            }
+            // The stat cards only show all-time counts when no range is picked
+            if (currentStatsRange !== 'all') return;
+            const cards = {messages: els.statRx, sent_messages: els.statTx, raw_packets: els.statPackets,
+                           telemetry: els.statTelemetry, positions: els.statPositions};
+            for (const key in cards) {
+                if (key in statsState) patchText(cards[key], statsState[key]);
+            }
+        }
+
+        // Server coalesces events into one frame per tick; refresh once per frame
+        socket.on('batch', (events) => {
+            lastSocketEventMs = Date.now();
+            // Historical view is driven by the time slider, not live pushes
+            if (!isLiveMode) return;
+            // A backgrounded page only keeps its state current; the visibility
+            // handler below renders everything once it is shown again
+            const hidden = document.hidden;
+            let needsRefresh = false;
+            const nodeUpdates = [];
+            for (const ev of events) {
+                switch (ev.name) {
+                    case 'new_message':
+                        // The message arrives whole; counters follow in 'stats_delta'
+                        if (hidden) markSeen(messageKey(ev.data));
+                        else onNewMessage(ev.data);
+                        break;
+                    case 'stats_delta':
+                        Object.assign(statsState, ev.data);
+                        if (!hidden) scheduleStatsRender();
+                        break;
+                    case 'node_update':
+                        nodeUpdates.push(...ev.data);
+                        break;
+                    case 'db_update':
+                        lastKnownUpdate = ev.data.last_update;
+                        needsRefresh = true;
+                        break;
+                }
+            }
+            // Showing the page again refetches everything, so hidden pages drop these
+            if (nodeUpdates.length && !hidden) mergeNodes(nodeUpdates);
+            if (needsRefresh && !hidden) refreshData();
         });
 
-        // Stats filter bar
-        document.querySelectorAll('.filter-btn').forEach(btn => {
-            btn.addEventListener('click', () => {
-                document.querySelectorAll('.filter-btn').forEach(b => b.classList.remove('active'));
-                btn.classList.add('active');
-                currentStatsRange = btn.dataset.range;
-                refreshStatsPanel();
-            });
+        const MAP_RANGE_HOURS = {'1h': 1, '24h': 24, '7d': 168};
+
+        // Fold node rows into the current list, leaving out any that fall
+        // outside the selected map range, and render as a refresh would
+        function mergeNodes(updates, removed = []) {
+            const hours = MAP_RANGE_HOURS[currentMapRange];
+            const cutoff = hours ? Date.now() / 1000 - hours * 3600 : -Infinity;
+            const byId = new Map(cachedNodes.map(n => [n.node_id, n]));
+            for (const id of removed) byId.delete(id);
+            for (const node of updates) {
+                if (node.last_heard > cutoff) byId.set(node.node_id, node);
+            }
+            const nodes = [...byId.values()];
+            updateNodes(nodes);
+            updateMap(nodes);
+        }
+
+        // Messages that arrived while hidden show up in the list without ripples
+        document.addEventListener('visibilitychange', () => {
+            if (document.hidden || !isLiveMode) return;
+            map.invalidateSize();
+            scheduleStatsRender();
+            refreshData();
+        });
+
+        // Tab switching. Only the visible tab renders: an update for a hidden
+        // tab leaves its latest render in dirtyTabs, run when the tab is shown.
+        let activeTab = 'messages';
+        const dirtyTabs = new Map();
+
+        function deferUnlessActive(tab, render) {
+            if (activeTab === tab) return false;
+            dirtyTabs.set(tab, render);
+            return true;
+        }
+
+        function showTab(name) {
+            document.querySelectorAll('.tab').forEach(t => t.classList.toggle('active', t.dataset.tab === name));
+            document.querySelectorAll('.tab-content').forEach(c => c.classList.remove('active'));
+            document.getElementById('tab-' + name).classList.add('active');
+            activeTab = name;
+            const render = dirtyTabs.get(name);
+            if (render) {
+                dirtyTabs.delete(name);
+                render();
+            }
+        }
+
+        document.querySelectorAll('.tab').forEach(tab => {
+            tab.addEventListener('click', () => showTab(tab.dataset.tab));
         });
 
-        // Collapsible sections
+        // Collapsible sections. A collapsed body keeps only its latest pending
+        // render (see renderSection) and runs it when expanded.
         document.querySelectorAll('.collapsible-header').forEach(h => {
             h.addEventListener('click', () => {
                 h.classList.toggle('collapsed');
-                h.nextElementSibling.classList.toggle('hidden');
+                const body = h.nextElementSibling;
+                body.classList.toggle('hidden');
+                if (!body.classList.contains('hidden') && body._pendingRender) {
+                    const render = body._pendingRender;
+                    body._pendingRender = null;
+                    render();
+                }
             });
         });
 
+        function renderSection(body, render) {
+            if (body.classList.contains('hidden')) body._pendingRender = render;
+            else render();
+        }
+
         // Timeline toggle button — in historical mode, keep visible until sync
         document.getElementById('timeline-toggle').addEventListener('click', () => {
             if (document.body.classList.contains('historical-mode') && document.body.classList.contains('timeline-visible')) {
@@ -2321,40 +3124,53 @@ DASHBOARD_HTML = """
             setTimeout(() => { if (typeof map !== 'undefined') map.invalidateSize(); }, 350);
         });
 
-        // Message range buttons
-        document.querySelectorAll('.msg-range-btn').forEach(btn => {
-            btn.addEventListener('click', () => {
-                document.querySelectorAll('.msg-range-btn').forEach(b => b.classList.remove('active'));
-                btn.classList.add('active');
-                currentMsgRange = btn.dataset.range;
-                fetch('/api/messages?limit=50&range=' + currentMsgRange)
-                    .then(r => r.json())
-                    .then(updateMessages);
+        // One delegated click listener per button bar. The active button is
+        // tracked here instead of re-querying the bar on every click.
+        function bindButtonGroup(bar, selector, onSelect) {
+            let active = bar.querySelector(selector + '.active');
+            bar.addEventListener('click', e => {
+                const btn = e.target.closest(selector);
+                if (!btn || btn.disabled) return;
+                if (active !== btn) {
+                    if (active) active.classList.remove('active');
+                    btn.classList.add('active');
+                    active = btn;
+                }
+                onSelect(btn);
             });
-        });
+        }
 
-        // Message view toggle (All / DMs)
-        document.querySelectorAll('.msg-view-btn').forEach(btn => {
-            btn.addEventListener('click', () => {
-                document.querySelectorAll('.msg-view-btn').forEach(b => b.classList.remove('active'));
-                btn.classList.add('active');
+        // Button bars, keyed by their data-toolbar attribute: the button
+        // selector within the bar and what a click on one does
+        const TOOLBARS = {
+            'msg-view': ['.msg-view-btn', btn => {
                 const view = btn.dataset.view;
-                document.getElementById('msg-view-all').style.display = view === 'all' ? 'flex' : 'none';
-                document.getElementById('msg-view-dms').style.display = view === 'dms' ? 'flex' : 'none';
+                els.msgViewAll.style.display = view === 'all' ? 'flex' : 'none';
+                els.msgViewDms.style.display = view === 'dms' ? 'flex' : 'none';
                 if (view === 'dms') loadDMConversations();
-            });
-        });
-
-        // Map range buttons
-        document.querySelectorAll('.map-range-btn').forEach(btn => {
-            btn.addEventListener('click', () => {
-                document.querySelectorAll('.map-range-btn').forEach(b => b.classList.remove('active'));
-                btn.classList.add('active');
+            }],
+            'msg-range': ['.msg-range-btn', btn => {
+                currentMsgRange = btn.dataset.range;
+                fetch(`/api/messages?limit=${MESSAGE_LIST_LIMIT}&range=` + currentMsgRange)
+                    .then(r => r.json())
+                    .then(messages => { cachedMessages = messages; updateMessages(messages); });
+            }],
+            'map-range': ['.map-range-btn', btn => {
                 currentMapRange = btn.dataset.range;
                 fetch('/api/nodes?range=' + currentMapRange)
                     .then(r => r.json())
-                    .then(nodes => { updateNodes(nodes); updateMap(nodes, true); });
-            });
+                    .then(nodes => { updateNodes(nodes); updateMap(nodes); });
+            }],
+            'stats-range': ['.filter-btn', btn => {
+                currentStatsRange = btn.dataset.range;
+                refreshStatsPanel();
+            }],
+        };
+
+        // One tree walk finds every bar
+        document.querySelectorAll('[data-toolbar]').forEach(bar => {
+            const [selector, onSelect] = TOOLBARS[bar.dataset.toolbar];
+            bindButtonGroup(bar, selector, onSelect);
         });
 
         // Chat input handling
@@ -2371,27 +3187,36 @@ DASHBOARD_HTML = """
         });
 
         function updateCharCounter() {
-            const text = chatInput.value;
-            const bytes = new TextEncoder().encode(text).length;
-            charCounter.textContent = `${bytes} / 200 bytes`;
-
-            charCounter.classList.remove('warning', 'danger');
-            if (bytes > 180) {
-                charCounter.classList.add('danger');
-            } else if (bytes > 150) {
-                charCounter.classList.add('warning');
-            }
+            const bytes = byteLength(chatInput.value);
+            paintByteCounter(charCounter, bytes, `${bytes} / 200 bytes`);
+        }
+
+        // Shared by the chat and DM counters: touch the text and classes only
+        // when they change, since these run on every keystroke
+        const utf8 = new TextEncoder();
+        const NON_ASCII = /[^\\x00-\\x7f]/;
+
+        // UTF-8 size of text; plain ASCII is one byte per char, so only text
+        // with other characters pays for an encode
+        function byteLength(text) {
+            return NON_ASCII.test(text) ? utf8.encode(text).length : text.length;
+        }
+
+        function paintByteCounter(counter, bytes, text) {
+            patchText(counter, text);
+            counter.classList.toggle('danger', bytes > 180);
+            counter.classList.toggle('warning', bytes > 150 && bytes <= 180);
         }
 
         function getSelectedChannel() {
-            return parseInt(document.getElementById('channel-select').value) || 0;
+            return parseInt(els.channelSelect.value) || 0;
         }
 
         async function sendMessage() {
             const text = chatInput.value.trim();
             if (!text) return;
 
-            const bytes = new TextEncoder().encode(text).length;
+            const bytes = byteLength(text);
             if (bytes > 200) {
                 sendStatus.textContent = 'Message too long!';
                 sendStatus.classList.add('error');
@@ -2453,7 +3278,7 @@ DASHBOARD_HTML = """
         async function sendQuickTime() {
             try {
                 const now = new Date();
-                const msg = now.toLocaleString([], {month:'short', day:'numeric', hour:'2-digit', minute:'2-digit'});
+                const msg = formatDateTime(now);
                 await fetch('/api/send', {
                     method: 'POST',
                     headers: { 'Content-Type': 'application/json' },
@@ -2482,141 +3307,315 @@ DASHBOARD_HTML = """
         }
 
         // Data fetching - messages + nodes in parallel, stats panel refreshes separately
+        // ==================== POLLED API WORKER ====================
+        // The live endpoints are fetched and parsed in a worker, which keeps
+        // each endpoint's last body and answers {changed: false} when the new
+        // one is identical, so refreshes that change nothing cost the main
+        // thread no parsing and no re-render. For a combined payload like
+        // /api/dashboard it also lists which top-level sections changed.
+        const API_WORKER_SRC = `
+            const lastBody = {};
+            const lastSection = {};
+            self.onmessage = async (e) => {
+                const {id, urls, sections, reset} = e.data;
+                if (reset) {
+                    for (const key in lastBody) delete lastBody[key];
+                    for (const key in lastSection) delete lastSection[key];
+                    return;
+                }
+                try {
+                    const results = await Promise.all(urls.map(async (url) => {
+                        const resp = await fetch(url);
+                        const body = await resp.text();
+                        const path = new URL(url).pathname;
+                        if (lastBody[path] === body) return {changed: false};
+                        lastBody[path] = body;
+                        const data = JSON.parse(body);
+                        if (!sections) return {changed: true, data};
+                        const changedSections = [];
+                        for (const key in data) {
+                            const part = JSON.stringify(data[key]);
+                            if (lastSection[path + '#' + key] === part) continue;
+                            lastSection[path + '#' + key] = part;
+                            changedSections.push(key);
+                        }
+                        return {changed: true, data, sections: changedSections};
+                    }));
+                    self.postMessage({id, results});
+                } catch (err) {
+                    self.postMessage({id, error: String(err)});
+                }
+            };`;
+        const RELATIVE_TIME_REFRESH_MS = 60000;  // full refresh: keeps "5m ago" true and drops rows aged out of a range
+        let apiWorker = null;
+        let apiRequestId = 0;
+        const apiPending = {};
+        const polledData = {};
+        let lastLiveRender = 0;
+        try {
+            apiWorker = new Worker(URL.createObjectURL(new Blob([API_WORKER_SRC], {type: 'text/javascript'})));
+            apiWorker.onmessage = (e) => {
+                const pending = apiPending[e.data.id];
+                delete apiPending[e.data.id];
+                if (e.data.error) pending.reject(new Error(e.data.error));
+                else pending.resolve(e.data.results);
+            };
+        } catch (e) {
+            console.warn('[API] Worker unavailable, parsing on the main thread:', e);
+        }
+
+        // Fetch polled endpoints; resolves to [{changed, data}] in url order.
+        // With sections set, each result also carries the set of top-level
+        // keys whose contents changed (all of them without the worker).
+        async function fetchPolled(urls, sections = false) {
+            const absolute = urls.map(u => new URL(u, location.href).href);
+            const results = apiWorker
+                ? await new Promise((resolve, reject) => {
+                    const id = ++apiRequestId;
+                    apiPending[id] = {resolve, reject};
+                    apiWorker.postMessage({id, urls: absolute, sections});
+                })
+                : await Promise.all(absolute.map(u => fetch(u).then(r => r.json()).then(data => ({changed: true, data}))));
+            return results.map((r, i) => {
+                const path = new URL(absolute[i]).pathname;
+                if (r.changed) polledData[path] = r.data;
+                const result = {changed: r.changed, data: polledData[path]};
+                if (sections) {
+                    result.sections = new Set(!r.changed ? [] : r.sections || Object.keys(r.data));
+                }
+                return result;
+            });
+        }
+
+        // Forget the last bodies, e.g. after historical mode painted over them
+        function resetPolled() {
+            if (apiWorker) apiWorker.postMessage({reset: true});
+        }
+
+        // Messages, nodes and stats in one request; the range buttons still
+        // refetch their own endpoint for an isolated refresh. Between full
+        // refreshes only what changed past the page's cursor is fetched.
         async function refreshData() {
+            const stale = Date.now() - lastLiveRender >= RELATIVE_TIME_REFRESH_MS;
+            if (!stale) return refreshDelta();
+            lastLiveRender = Date.now();
             try {
-                const [messages, nodes] = await Promise.all([
-                    fetch('/api/messages?limit=50&range=' + currentMsgRange).then(r => r.json()),
-                    fetch('/api/nodes?range=' + currentMapRange).then(r => r.json()),
-                ]);
-
-                updateMessages(messages);
+                const [dashboard] = await fetchPolled([
+                    `/api/dashboard?limit=${MESSAGE_LIST_LIMIT}&msg_range=` + currentMsgRange +
+                    '&map_range=' + currentMapRange + '&stats_range=' + currentStatsRange,
+                ], true);
+                const {messages, nodes, stats} = dashboard.data;
+                const changed = dashboard.sections;
+
+                cachedMessages = messages;
+                // Message rows show absolute times, so only node rows need the stale re-render
+                if (changed.has('messages')) updateMessages(messages);
                 updateNodes(nodes);
                 updateMap(nodes);
                 updateLastUpdate();
 
-                // Stats panel handles its own fetching with range filter
-                refreshStatsPanel();
+                if (stats.error) console.error('[STATS] Error:', stats.error);
+                else if (changed.has('stats')) updateEnhancedStats(stats);
+            } catch (e) {
+                console.error('Refresh failed:', e);
+            }
+        }
+
+        // Newest message ids and node last_heard the page holds; the delta
+        // endpoint answers with what came after them (plus the rest of the
+        // newest node second, which mergeNodes dedupes by node_id)
+        function deltaCursor() {
+            let sinceId = 0, sinceSentId = 0, sinceHeard = 0;
+            for (const msg of cachedMessages) {
+                if (msg.direction === 'sent') sinceSentId = Math.max(sinceSentId, msg.id || 0);
+                else sinceId = Math.max(sinceId, msg.id || 0);
+            }
+            for (const node of cachedNodes) sinceHeard = Math.max(sinceHeard, node.last_heard || 0);
+            // A node clock running ahead mustn't park the cursor in the future
+            sinceHeard = Math.min(sinceHeard, Math.floor(Date.now() / 1000));
+            return `&since_id=${sinceId}&since_sent_id=${sinceSentId}&since_heard=${sinceHeard}`;
+        }
+
+        async function refreshDelta() {
+            try {
+                const [delta] = await fetchPolled([
+                    `/api/dashboard-delta?limit=${MESSAGE_LIST_LIMIT}&msg_range=` + currentMsgRange +
+                    '&map_range=' + currentMapRange + '&stats_range=' + currentStatsRange + deltaCursor(),
+                ], true);
+                const {messages, nodes, stats} = delta.data;
+                const changed = delta.sections;
+
+                if (changed.has('messages') && messages.added.length) mergeMessages(messages.added);
+                if (changed.has('nodes') && (nodes.added.length || nodes.updated.length || nodes.removed.length)) {
+                    mergeNodes([...nodes.added, ...nodes.updated], nodes.removed);
+                }
+                updateLastUpdate();
+
+                if (stats.error) console.error('[STATS] Error:', stats.error);
+                else if (changed.has('stats')) updateEnhancedStats(stats);
             } catch (e) {
                 console.error('Refresh failed:', e);
             }
         }
 
-        // updateStats - called by socket events and historical mode
+        // Add fetched messages to the list, newest first, keeping its length
+        function mergeMessages(added) {
+            const keys = new Set(cachedMessages.map(messageKey));
+            const fresh = added.filter(msg => !keys.has(messageKey(msg)));
+            if (!fresh.length) return;
+            cachedMessages = fresh.concat(cachedMessages)
+                .sort((a, b) => (a.timestamp < b.timestamp) - (a.timestamp > b.timestamp))
+                .slice(0, MESSAGE_LIST_LIMIT);
+            updateMessages(cachedMessages);
+        }
+
+        // updateStats - called by historical mode
         function updateStats(data) {
             // Always update header counters with all-time totals (header-nodes set by updateNodes from actual list)
-            document.getElementById('header-packets').textContent = data.total_packets || 0;
-            document.getElementById('header-messages').textContent = data.all_time_messages || data.total_messages || 0;
-            document.getElementById('tab-messages-count').textContent = data.all_time_messages || data.total_messages || 0;
-            document.getElementById('tab-active-count').textContent = data.active_nodes_24h || data.active_nodes || 0;
+            setText(els.headerPackets, data.total_packets || 0);
+            setText(els.headerMessages, data.all_time_messages || data.total_messages || 0);
+            setText(els.tabMessagesCount, data.all_time_messages || data.total_messages || 0);
+            setText(els.tabActiveCount, data.active_nodes_24h || data.active_nodes || 0);
 
             if (isLiveMode) {
                 // In live mode, trigger full stats panel refresh from API
                 refreshStatsPanel();
-            } else {
-                // In historical mode, directly update stat card values from the data we have
-                document.getElementById('stat-rx').textContent = data.total_messages || 0;
-                document.getElementById('stat-tx').textContent = data.sent_messages || 0;
-                document.getElementById('stat-nodes').textContent = data.total_nodes || 0;
-                document.getElementById('stat-active').textContent = data.active_nodes_24h || data.active_nodes || 0;
-                document.getElementById('stat-packets').textContent = data.total_packets || 0;
-                document.getElementById('stat-telemetry').textContent = data.telemetry_records || 0;
-                document.getElementById('stat-positions').textContent = data.position_records || 0;
-                // Update packet types if available
-                if (data.packet_types) {
-                    let html = '';
-                    const sorted = Object.entries(data.packet_types).sort((a, b) => b[1] - a[1]);
-                    const maxPkt = sorted.length > 0 ? sorted[0][1] : 1;
-                    for (const [type, count] of sorted.slice(0, 6)) {
-                        const shortType = type.replace('_APP', '').replace('MESSAGE', 'MSG');
-                        const barWidth = Math.max((count / maxPkt) * 100, 2);
-                        html += `<div class="packet-row">
-                            <span class="packet-type" title="${type}">${shortType}</span>
-                            <div class="packet-bar-track"><div class="packet-bar-fill" style="width:${barWidth}%"></div></div>
-                            <span class="packet-count">${count}</span>
-                        </div>`;
-                    }
-                    document.getElementById('packet-types').innerHTML = html || '';
-                }
+                return;
             }
+            // In historical mode, directly update stat card values from the data we have
+            const packetHtml = data.packet_types ? packetTypesHtml(data.packet_types) : null;
+            mutate(() => {
+                patchText(els.statRx, data.total_messages || 0);
+                patchText(els.statTx, data.sent_messages || 0);
+                patchText(els.statNodes, data.total_nodes || 0);
+                patchText(els.statActive, data.active_nodes_24h || data.active_nodes || 0);
+                patchText(els.statPackets, data.total_packets || 0);
+                patchText(els.statTelemetry, data.telemetry_records || 0);
+                patchText(els.statPositions, data.position_records || 0);
+                if (packetHtml !== null) patchHtml(els.packetTypes, packetHtml);
+            });
         }
 
         // Fetch enhanced stats from new endpoint
         async function refreshStatsPanel() {
             try {
-                const resp = await fetch('/api/stats-enhanced?range=' + currentStatsRange);
-                const data = await resp.json();
+                const [stats] = await fetchPolled(['/api/stats-enhanced?range=' + currentStatsRange]);
+                const data = stats.data;
                 if (data.error) { console.error('[STATS] Error:', data.error); return; }
-                updateEnhancedStats(data);
+                if (stats.changed) updateEnhancedStats(data);
             } catch (e) {
                 console.error('[STATS] Refresh failed:', e);
             }
         }
 
-        // Update all stats panel elements
+        const HOP_KEYS = Object.freeze([
+            { key: 'direct', label: 'Direct' },
+            { key: 'hop1', label: '1 Hop' },
+            { key: 'hop2', label: '2 Hops' },
+            { key: 'hop3', label: '3 Hops' },
+            { key: 'hop4', label: '4 Hops' },
+            { key: 'hop5', label: '5 Hops' },
+            { key: 'hop6', label: '6 Hops' },
+            { key: 'hop7', label: '7 Hops' }
+        ]);
+
+        // The five legend spans are fixed in the markup; 4+ sums the far hops
+        const HOP_LEGEND = Object.freeze([
+            { label: 'Direct', keys: ['direct'] },
+            { label: '1h', keys: ['hop1'] },
+            { label: '2h', keys: ['hop2'] },
+            { label: '3h', keys: ['hop3'] },
+            { label: '4+', keys: ['hop4', 'hop5', 'hop6', 'hop7'] }
+        ]);
+
+        // Rows arrive sorted, trimmed and sized by the server (_packet_type_rows)
+        function packetTypesHtml(rows) {
+            let html = '';
+            for (const row of rows) {
+                html += `<div class="packet-row">
+                    <span class="packet-type" title="${row.type}">${row.short_type}</span>
+                    <div class="packet-bar-track"><div class="packet-bar-fill" style="width:${row.pct}%"></div></div>
+                    <span class="packet-count">${row.count}</span>
+                </div>`;
+            }
+            return html;
+        }
+
+        // Write-phase helper: replace an element's markup only when it changed
+        function patchHtml(el, html) {
+            if (el._html === html) return;
+            el._html = html;
+            el.innerHTML = html;
+        }
+
+        // Update all stats panel elements. Every value and string is worked
+        // out first; the DOM is then written in one batch in the next frame.
         function updateEnhancedStats(data) {
             // Header stats - always show all-time totals (header-nodes set by updateNodes() from actual list length)
-            document.getElementById('header-packets').textContent = data.total_packets || 0;
-            document.getElementById('header-messages').textContent = data.all_time_messages || data.total_messages || 0;
-            document.getElementById('tab-messages-count').textContent = data.all_time_messages || data.total_messages || 0;
-            document.getElementById('tab-active-count').textContent = data.active_nodes || 0;
-
-            // Key metrics
-            document.getElementById('stat-rx').textContent = data.total_messages || 0;
-            document.getElementById('stat-tx').textContent = data.sent_messages || 0;
-            document.getElementById('stat-nodes').textContent = data.total_nodes || 0;
-            document.getElementById('stat-active').textContent = data.active_nodes || 0;
-
-            // Secondary metrics
-            document.getElementById('stat-packets').textContent = data.total_packets || 0;
-            document.getElementById('stat-telemetry').textContent = data.telemetry_records || 0;
-            document.getElementById('stat-positions').textContent = data.position_records || 0;
-            document.getElementById('stat-dbsize').textContent = data.database_size_mb || 0;
-
-            // Bottom micro stats
-            // Network health - hop distribution bar (8 segments)
+            setText(els.headerPackets, data.all_time_packets ?? data.total_packets ?? 0);
+            setText(els.headerMessages, data.all_time_messages || data.total_messages || 0);
+            setText(els.tabMessagesCount, data.all_time_messages || data.total_messages || 0);
+            setText(els.tabActiveCount, data.active_nodes || 0);
+            if (deferUnlessActive('stats', () => updateEnhancedStats(data))) return;
+
+            const metric = (v) => v !== null && v !== undefined ? v : '--';
+
+            // Network health - hop distribution bar (8 segments) and legend
             const hops = data.hop_distribution || {};
             const hopTotal = hops.total || 1;
-            const hopBar = document.getElementById('hop-bar');
-            if (hopBar) {
-                const pct = (v) => Math.max(((v || 0) / hopTotal) * 100, 0).toFixed(1);
-                const hopKeys = [
-                    { key: 'direct', label: 'Direct', cls: 'hop-0' },
-                    { key: 'hop1', label: '1 Hop', cls: 'hop-1' },
-                    { key: 'hop2', label: '2 Hops', cls: 'hop-2' },
-                    { key: 'hop3', label: '3 Hops', cls: 'hop-3' },
-                    { key: 'hop4', label: '4 Hops', cls: 'hop-4' },
-                    { key: 'hop5', label: '5 Hops', cls: 'hop-5' },
-                    { key: 'hop6', label: '6 Hops', cls: 'hop-6' },
-                    { key: 'hop7', label: '7 Hops', cls: 'hop-7' }
-                ];
-                hopBar.innerHTML = hopKeys.map(h => {
-                    const v = hops[h.key] || 0;
-                    return `<div class="hop-seg ${h.cls}" style="width:${pct(v)}%" title="${h.label}: ${v} nodes">${v > 0 ? v : ''}</div>`;
-                }).join('');
-            }
+            const hopCounts = HOP_KEYS.map(h => hops[h.key] || 0);
+            const hopWidths = hopCounts.map(v => Math.max((v / hopTotal) * 100, 0).toFixed(1) + '%');
+            const legendTexts = HOP_LEGEND.map(({label, keys}) =>
+                label + ': ' + keys.reduce((sum, key) => sum + (hops[key] || 0), 0));
+            const packetHtml = data.packet_types
+                ? packetTypesHtml(data.packet_types) || '<div style="color:#555;font-size:0.75em;padding:4px">No packet data</div>'
+                : null;
+
+            mutate(() => {
+                // Key metrics
+                patchText(els.statRx, data.total_messages || 0);
+                patchText(els.statTx, data.sent_messages || 0);
+                patchText(els.statNodes, data.total_nodes || 0);
+                patchText(els.statActive, data.active_nodes || 0);
+
+                // Secondary metrics
+                patchText(els.statPackets, data.total_packets || 0);
+                patchText(els.statTelemetry, data.telemetry_records || 0);
+                patchText(els.statPositions, data.position_records || 0);
+                patchText(els.statDbsize, data.database_size_mb || 0);
+
+                // The eight hop segments are fixed in the markup; only their width and count change
+                const segs = els.hopBar.children;
+                for (let i = 0; i < HOP_KEYS.length; i++) {
+                    segs[i].style.width = hopWidths[i];
+                    segs[i].title = `${HOP_KEYS[i].label}: ${hopCounts[i]} nodes`;
+                    patchText(segs[i], hopCounts[i] > 0 ? hopCounts[i] : '');
+                }
+                const legend = els.hopLegend.children;
+                for (let i = 0; i < HOP_LEGEND.length; i++) patchText(legend[i], legendTexts[i]);
 
-            // Hop legend text below bar
-            const hopLegend = document.getElementById('hop-legend');
-            if (hopLegend) {
-                hopLegend.innerHTML = `
-                    <span>Direct: ${hops.direct || 0}</span>
-                    <span>1h: ${hops.hop1 || 0}</span>
-                    <span>2h: ${hops.hop2 || 0}</span>
-                    <span>3h: ${hops.hop3 || 0}</span>
-                    <span>4+: ${(hops.hop4||0)+(hops.hop5||0)+(hops.hop6||0)+(hops.hop7||0)}</span>
-                `;
-            }
+                // Health metrics
+                patchText(els.statAvgSnr, metric(data.avg_snr));
+                patchText(els.statChUtil, metric(data.avg_channel_util));
+                patchText(els.statAirTx, metric(data.avg_air_tx));
+
+                // Top nodes
+                renderSection(els.topNodesContent, () => renderTopNodes(els.topNodesContent, data.top_nodes));
+
+                // Packet types (horizontal bars)
+                if (packetHtml !== null) patchHtml(els.packetTypes, packetHtml);
+
+                patchText(els.chartRangeLabel, currentStatsRange.toUpperCase());
+            });
 
-            // Health metrics
-            document.getElementById('stat-avg-snr').textContent = data.avg_snr !== null && data.avg_snr !== undefined ? data.avg_snr : '--';
-            document.getElementById('stat-ch-util').textContent = data.avg_channel_util !== null && data.avg_channel_util !== undefined ? data.avg_channel_util : '--';
-            document.getElementById('stat-air-tx').textContent = data.avg_air_tx !== null && data.avg_air_tx !== undefined ? data.avg_air_tx : '--';
+            // Activity chart
+            updateEnhancedChart(data.activity, data.activity_bucket);
+        }
 
-            // Top nodes
-            const topContainer = document.getElementById('top-nodes-content');
-            if (data.top_nodes && data.top_nodes.length > 0) {
+        function renderTopNodes(container, topNodes) {
+            if (topNodes && topNodes.length > 0) {
                 let html = '';
-                for (const node of data.top_nodes) {
+                for (const node of topNodes) {
                     const dotColor = getHopColor(node.hops);
                     const battText = node.battery !== null && node.battery !== undefined ? node.battery + '%' : '--';
                     html += `<div class="top-node-row">
@@ -2626,37 +3625,16 @@ DASHBOARD_HTML = """
                         <span class="top-node-batt">🔋${battText}</span>
                     </div>`;
                 }
-                topContainer.innerHTML = html;
+                container.innerHTML = html;
             } else {
-                topContainer.innerHTML = '<div style="color:#555;font-size:0.75em;padding:4px">No message data</div>';
+                container.innerHTML = '<div style="color:#555;font-size:0.75em;padding:4px">No message data</div>';
             }
+        }
 
-            // Packet types (horizontal bars)
-            if (data.packet_types) {
-                let html = '';
-                const sorted = Object.entries(data.packet_types).sort((a, b) => b[1] - a[1]);
-                const maxPkt = sorted.length > 0 ? sorted[0][1] : 1;
-                for (const [type, count] of sorted.slice(0, 6)) {
-                    const shortType = type.replace('_APP', '').replace('MESSAGE', 'MSG');
-                    const barWidth = Math.max((count / maxPkt) * 100, 2);
-                    html += `<div class="packet-row">
-                        <span class="packet-type" title="${type}">${shortType}</span>
-                        <div class="packet-bar-track"><div class="packet-bar-fill" style="width:${barWidth}%"></div></div>
-                        <span class="packet-count">${count}</span>
-                    </div>`;
-                }
-                document.getElementById('packet-types').innerHTML = html ||
-                    '<div style="color:#555;font-size:0.75em;padding:4px">No packet data</div>';
-            }
-
-            // Activity chart
-            updateEnhancedChart(data.activity, data.activity_bucket);
-            document.getElementById('chart-range-label').textContent = currentStatsRange.toUpperCase();
-        }
+        // Channels currently offered beyond CH 0, as a sorted key string
+        let channelsInSelect = '';
 
         function updateChannelSelect(messages) {
-            const select = document.getElementById('channel-select');
-            const currentVal = select.value;
             const seen = new Set();
             if (messages) {
                 for (const msg of messages) {
@@ -2664,110 +3642,218 @@ DASHBOARD_HTML = """
                     if (ch !== undefined && ch !== null && ch > 0) seen.add(ch);
                 }
             }
-            // Remove all options except CH 0
-            while (select.options.length > 1) select.remove(1);
-            // Add seen channels sorted
-            for (const ch of [...seen].sort((a, b) => a - b)) {
+            const channels = [...seen].sort((a, b) => a - b);
+            const key = channels.join(',');
+            if (key === channelsInSelect) return;
+            channelsInSelect = key;
+
+            // Rebuild everything after CH 0 in one swap
+            const select = els.channelSelect;
+            const currentVal = select.value;
+            const frag = document.createDocumentFragment();
+            frag.appendChild(select.options[0]);
+            for (const ch of channels) {
                 const opt = document.createElement('option');
                 opt.value = ch;
                 opt.textContent = 'CH ' + ch;
-                select.add(opt);
+                frag.appendChild(opt);
             }
+            select.replaceChildren(frag);
             // Restore selection if still valid
-            if ([...select.options].some(o => o.value === currentVal)) {
-                select.value = currentVal;
-            } else {
-                select.value = '0';
-            }
+            select.value = seen.has(Number(currentVal)) ? currentVal : '0';
         }
 
         function updateMessages(messages) {
-            const container = document.getElementById('message-list');
+            if (messages === lastRenderedMessages) return;
+            // New-message ripples play on the map whichever tab is showing
+            animateNewMessages(messages);
+            if (deferUnlessActive('messages', () => updateMessages(messages))) return;
+            lastRenderedMessages = messages;
+            const container = els.messageList;
             if (!messages || messages.length === 0) {
                 container.innerHTML = '<div class="empty-state"><div class="empty-state-icon">💬</div><div>No messages yet</div></div>';
                 return;
             }
 
-            let html = '';
-            for (const msg of messages) {
-                // Support both 'direction' (from live API) and 'is_sent' (from historical API)
-                const isSent = msg.direction === 'sent' || msg.is_sent === true;
-                const isDM = isSent ? (msg.to_id && msg.to_id !== '^all') : (msg.to_id && msg.to_id !== '^all' && msg.to_id !== '!ffffffff');
-                const time = formatTime(msg.timestamp);
-                const fromLabel = isSent
-                    ? 'Assistant → ' + (msg.to_id === '^all' ? 'Broadcast' : msg.to_id || 'Unknown')
-                    : (msg.from_name || msg.from_id || 'Unknown');
-
-                html += `<div class="message-item ${isSent ? 'sent' : ''}${isDM ? ' dm' : ''}">
-                    <div class="message-header">
-                        <span class="message-from">${escapeHtml(fromLabel)}</span>
-                        ${isDM ? '<span class="dm-badge">DM</span>' : ''}
-                        <span class="message-time">${time}</span>
-                    </div>
-                    <div class="message-text">${escapeHtml(msg.text || '')}</div>
-                    ${!isSent && msg.snr ? `<div class="message-meta">
-                        <span>📶 ${msg.snr}dB</span>
-                        <span>📻 ${msg.rssi}dBm</span>
-                    </div>` : ''}
-                </div>`;
-            }
-            container.innerHTML = html;
+            patchMessageList(container, messages);
             updateChannelSelect(messages);
+        }
 
-            // Detect new messages and trigger ripple animations
-            const currentIds = new Set();
+        // Detect new messages and trigger ripple animations
+        function animateNewMessages(messages) {
+            if (!messages || messages.length === 0) return;
             for (const msg of messages) {
-                const msgKey = (msg.from_id || '') + '|' + msg.timestamp;
-                currentIds.add(msgKey);
-                if (!initialMessageLoad && !seenMessageIds.has(msgKey) && msg.from_id) {
+                if (markSeen(messageKey(msg)) && !initialMessageLoad && msg.from_id) {
                     animateNode(msg.from_id, 'message');
                 }
             }
-            seenMessageIds = currentIds;
             initialMessageLoad = false;
         }
 
+        function messageKey(msg) {
+            return (msg.from_id || '') + '|' + msg.timestamp;
+        }
+
+        // A message never changes once stored, so a row can be reused for as
+        // long as its key (plus the resolved sender name) matches
+        function messageRowKey(msg) {
+            return messageKey(msg) + '|' + (msg.from_name || '') + '|' + (msg.is_sent || msg.direction === 'sent' ? 's' : '');
+        }
+
+        // Reconcile the list against messages: existing rows are moved into
+        // place, only unseen messages get a new row, and leftovers are dropped
+        function patchMessageList(container, messages) {
+            const existing = new Map();
+            for (const el of container.children) {
+                if (el._key) existing.set(el._key, el);
+            }
+            let cursor = container.firstElementChild;
+            for (const msg of messages) {
+                const key = messageRowKey(msg);
+                let row = existing.get(key);
+                existing.delete(key);  // a duplicate key further down gets its own row
+                if (!row) {
+                    row = buildMessageItem(msg);
+                    row._key = key;
+                }
+                if (row === cursor) cursor = cursor.nextElementSibling;
+                else container.insertBefore(row, cursor);
+            }
+            while (cursor) {
+                const next = cursor.nextElementSibling;
+                cursor.remove();
+                cursor = next;
+            }
+        }
+
+        // Row prototypes from the <template>s at the top of <body>: rows are
+        // cloned and filled via textContent/classList rather than reparsed HTML
+        const messageRowTemplate = document.getElementById('tpl-message').content.firstElementChild;
+        const nodeRowTemplate = document.getElementById('tpl-node').content.firstElementChild;
+
+        function buildMessageItem(msg) {
+            // Support both 'direction' (from live API) and 'is_sent' (from historical API)
+            const isSent = msg.direction === 'sent' || msg.is_sent === true;
+            const isDM = isSent ? (msg.to_id && msg.to_id !== '^all') : (msg.to_id && msg.to_id !== '^all' && msg.to_id !== '!ffffffff');
+            const fromLabel = isSent
+                ? 'Assistant → ' + (msg.to_id === '^all' ? 'Broadcast' : msg.to_id || 'Unknown')
+                : (msg.from_name || msg.from_id || 'Unknown');
+
+            const item = messageRowTemplate.cloneNode(true);
+            if (isSent) item.classList.add('sent');
+            if (isDM) item.classList.add('dm');
+            else item.querySelector('.dm-badge').remove();
+            item.querySelector('.message-from').textContent = fromLabel;
+            item.querySelector('.message-time').textContent = formatTime(msg.timestamp);
+            item.querySelector('.message-text').textContent = msg.text || '';
+            if (!isSent && msg.snr) {
+                item.querySelector('.message-snr').textContent = `📶 ${msg.snr}dB`;
+                item.querySelector('.message-rssi').textContent = `📻 ${msg.rssi}dBm`;
+            } else {
+                item.querySelector('.message-meta').remove();
+            }
+            return item;
+        }
+
+        function buildNodeItem(node) {
+            const hops = node.hops_used ?? node.hops_away ?? null;
+            const item = nodeRowTemplate.cloneNode(true);
+            item.dataset.nodeId = node.node_id;
+            item.dataset.lat = node.latitude || 0;
+            item.dataset.lon = node.longitude || 0;
+            item.querySelector('.node-avatar').textContent = node.short_name || '??';
+            item.querySelector('.node-name').textContent = node.long_name || 'Unknown';
+            item.querySelector('.node-id').textContent = node.node_id;
+            const signal = item.querySelector('.node-signal');
+            if (hops !== null) {
+                const hopClass = getHopClass(hops);
+                if (hopClass) signal.classList.add(hopClass);
+                signal.textContent = getHopLabel(hops);
+            } else {
+                signal.remove();
+            }
+            item.querySelector('.node-lastseen').textContent = timeSince(node.last_heard);
+            if (!(hops !== null && hops > 0)) item.querySelector('.node-trace-btn').remove();
+            return item;
+        }
+
+        // Everything on a node row except the last-seen label, which ages
+        // without the node changing and is refreshed in place instead
+        function nodeRowKey(node) {
+            return [node.node_id, node.short_name, node.long_name, node.hops_used ?? node.hops_away,
+                    node.latitude, node.longitude].join('|');
+        }
+
+        // Same reconciliation as patchMessageList, keyed by node id: a row is
+        // rebuilt only when its content changed, otherwise moved into place
+        function patchNodeList(container, nodes) {
+            const existing = new Map();
+            for (const el of container.children) {
+                if (el._key) existing.set(el.dataset.nodeId, el);
+            }
+            let cursor = container.firstElementChild;
+            for (const node of nodes) {
+                const key = nodeRowKey(node);
+                let row = existing.get(node.node_id);
+                existing.delete(node.node_id);
+                if (!row || row._key !== key) {
+                    row = buildNodeItem(node);
+                    row._key = key;
+                    row._lastSeen = row.querySelector('.node-lastseen');
+                } else {
+                    patchText(row._lastSeen, timeSince(node.last_heard));
+                }
+                if (row === cursor) cursor = cursor.nextElementSibling;
+                else container.insertBefore(row, cursor);
+            }
+            while (cursor) {
+                const next = cursor.nextElementSibling;
+                cursor.remove();
+                cursor = next;
+            }
+        }
+
         function prependMessage(msg) {
-            const container = document.getElementById('message-list');
-            const time = formatTime(msg.timestamp);
-
-            const div = document.createElement('div');
-            div.className = 'message-item';
-            div.innerHTML = `
-                <div class="message-header">
-                    <span class="message-from">${escapeHtml(msg.from_name || 'Unknown')}</span>
-                    <span class="message-time">${time}</span>
-                </div>
-                <div class="message-text">${escapeHtml(msg.text || '')}</div>
-            `;
+            const container = els.messageList;
+            const item = buildMessageItem(msg);
+            item._key = messageRowKey(msg);
 
             if (container.querySelector('.empty-state')) {
-                container.innerHTML = '';
+                container.replaceChildren();
             }
-            container.insertBefore(div, container.firstChild);
+            container.insertBefore(item, container.firstChild);
 
-            // Keep max 50
-            while (container.children.length > 50) {
+            while (container.children.length > MESSAGE_LIST_LIMIT) {
                 container.removeChild(container.lastChild);
             }
         }
 
+        // Lowercased long name, short name and id, joined once per fetch so a
+        // keystroke is a plain substring scan. The newline can't be typed into
+        // the search box, so a term never matches across two fields.
+        function indexNodeSearch(node) {
+            node._search = [node.long_name, node.short_name, node.node_id]
+                .map(v => (v || '').toLowerCase()).join('\\n');
+        }
+
         function updateNodes(nodes, fromCache) {
             // If fresh data (not from cache), store it and update header with total
             if (!fromCache && nodes) {
+                nodes.forEach(indexNodeSearch);
                 cachedNodes = nodes;
-                document.getElementById('header-nodes').textContent = nodes.length;
+                setText(els.headerNodes, nodes.length);
+            }
+            if (deferUnlessActive('nodes', () => updateNodes(cachedNodes, true))) {
+                // The count on the tab itself stays live
+                if (!nodeSearchTerm) setText(els.tabNodesCount, cachedNodes.length);
+                return;
             }
 
             // Apply search filter
             let filtered = (fromCache ? nodes : cachedNodes).slice();
             if (nodeSearchTerm) {
                 const term = nodeSearchTerm.toLowerCase();
-                filtered = filtered.filter(n =>
-                    (n.long_name || '').toLowerCase().includes(term) ||
-                    (n.short_name || '').toLowerCase().includes(term) ||
-                    (n.node_id || '').toLowerCase().includes(term)
-                );
+                filtered = filtered.filter(n => n._search.includes(term));
             }
 
             // Apply sort
@@ -2784,86 +3870,86 @@ DASHBOARD_HTML = """
                 filtered.sort((a, b) => (b.last_heard || 0) - (a.last_heard || 0));
             }
 
-            const container = document.getElementById('node-list');
+            const container = els.nodeList;
             let gpsCount = 0;
 
             if (!filtered || filtered.length === 0) {
                 container.innerHTML = nodeSearchTerm
                     ? '<div class="empty-state"><div class="empty-state-icon">🔍</div><div>No nodes match search</div></div>'
                     : '<div class="empty-state"><div class="empty-state-icon">👥</div><div>No nodes discovered</div></div>';
-                document.getElementById('tab-gps-count').textContent = '0';
-                if (!fromCache) document.getElementById('tab-nodes-count').textContent = '0';
+                els.tabGpsCount.textContent = '0';
+                if (!fromCache) els.tabNodesCount.textContent = '0';
                 return;
             }
 
-            let html = '';
             for (const node of filtered) {
                 if (node.latitude && node.longitude) gpsCount++;
-
-                const shortName = node.short_name || '??';
-                const hops = node.hops_used ?? node.hops_away ?? null;
-                const hopClass = getHopClass(hops);
-                const lastSeen = timeSince(node.last_heard);
-
-                html += `<div class="node-item" data-node-id="${node.node_id}" onclick="focusNode('${node.node_id}', ${node.latitude || 0}, ${node.longitude || 0})">
-                    <div class="node-avatar">${escapeHtml(shortName)}</div>
-                    <div class="node-info">
-                        <div class="node-name">${escapeHtml(node.long_name || 'Unknown')}</div>
-                        <div class="node-id">${node.node_id}</div>
-                    </div>
-                    <div class="node-stats">
-                        ${hops !== null ? `<div class="node-signal ${hopClass}">${getHopLabel(hops)}</div>` : ''}
-                        <div class="node-lastseen">${lastSeen}</div>
-                    </div>
-                    ${hops !== null && hops > 0 ? `<button class="node-trace-btn" title="Request traceroute" onclick="event.stopPropagation(); requestTraceroute('${node.node_id}')">TR</button>` : ''}
-                </div>`;
             }
-            container.innerHTML = html;
-            document.getElementById('tab-gps-count').textContent = gpsCount;
-            document.getElementById('tab-nodes-count').textContent = filtered.length;
+            patchNodeList(container, filtered);
+            els.tabGpsCount.textContent = gpsCount;
+            els.tabNodesCount.textContent = filtered.length;
         }
 
-        function updateMap(nodes, clearExisting = false) {
+        // Diffs against the markers already on the map: new nodes are added in one
+        // chunked batch, missing ones removed in one batch, and existing markers only
+        // get setLatLng/setIcon when their position or look actually changed. The
+        // loop only reads; the Leaflet calls are queued into one mutate().
+        // Per-node fingerprint of what its marker last showed
+        const markerState = new Map();
+
+        function updateMap(nodes) {
             if (!nodes) return;
             cachedMapNodes = nodes;
 
-            // In historical mode or when requested, clear all existing markers first
-            if (clearExisting || !isLiveMode) {
-                clusterGroup.clearLayers();
-                nodeMarkers = {};
-            }
-
             const bounds = [];
+            const seen = new Set();
+            const added = [];
+            const changed = [];  // [marker, latlng or null, icon or null, nodeId]
+            const now = Date.now();
 
             for (const node of nodes) {
                 if (!node.latitude || !node.longitude) continue;
                 if (node.latitude === 0 && node.longitude === 0) continue;
 
                 // Get node status (color based on recency)
-                const status = getNodeStatus(node);
+                const status = cachedNodeStatus(node, now);
 
                 // Skip offline/stale nodes on the map
                 if (status.stale) continue;
 
                 bounds.push([node.latitude, node.longitude]);
+                seen.add(node.node_id);
+
+                // Steady state: nothing the marker shows has changed, so only
+                // hand it the fresh node object (an open popup still patches)
+                const hash = node.latitude + '|' + node.longitude + '|' + status.color + '|' +
+                             (node.short_name || '') + '|' + node.last_heard;
+                const current = nodeMarkers[node.node_id];
+                if (current && markerState.get(node.node_id) === hash && !current.isPopupOpen()) {
+                    current.nodeData = node;
+                    current.nodeStatus = status;
+                    continue;
+                }
+                markerState.set(node.node_id, hash);
 
                 // Update or create marker
-                if (nodeMarkers[node.node_id]) {
-                    nodeMarkers[node.node_id].setLatLng([node.latitude, node.longitude]);
-                    nodeMarkers[node.node_id].setIcon(createMarkerIcon(status.color, escapeHtml(node.short_name || '')));
-                    // Re-apply ripple animation if setIcon wiped the DOM
-                    if (recentMessageNodes.has(node.node_id)) {
-                        const el = nodeMarkers[node.node_id].getElement();
-                        if (el) {
-                            el.classList.add('node-msg-throb');
-                            applyRippleRings(el);
-                        }
+                const iconKey = status.color + '|' + (node.short_name || '');
+                const existing = nodeMarkers[node.node_id];
+                const pos = nodePositions.get(node.node_id);
+                const moved = !pos || pos.lat !== node.latitude || pos.lng !== node.longitude;
+                if (moved) nodePositions.set(node.node_id, {lat: node.latitude, lng: node.longitude});
+                if (existing) {
+                    const icon = existing.iconKey !== iconKey ? markerIcon(status.color, node.short_name || '') : null;
+                    if (icon) existing.iconKey = iconKey;
+                    if (moved || icon) {
+                        changed.push([existing, moved ? [node.latitude, node.longitude] : null, icon, node.node_id]);
                     }
                 } else {
                     const marker = L.marker([node.latitude, node.longitude], {
-                        icon: createMarkerIcon(status.color, escapeHtml(node.short_name || ''))
+                        icon: markerIcon(status.color, node.short_name || '')
                     });
-                    clusterGroup.addLayer(marker);
+                    marker.iconKey = iconKey;
+                    added.push(marker);
                     nodeMarkers[node.node_id] = marker;
                 }
 
@@ -2875,63 +3961,52 @@ DASHBOARD_HTML = """
                 }
                 lastHeardCache[node.node_id] = node.last_heard;
 
-                // Update popup content (always refresh to show latest data)
-                const safeName = escapeHtml(node.long_name || node.short_name || 'Unknown');
-                const hops = node.hops_used ?? node.hops_away ?? null;
-                const hopColorDot = `<span style="display:inline-block;width:8px;height:8px;border-radius:50%;background:${getHopColor(hops)};margin-right:4px;vertical-align:middle;"></span>`;
-                const voltText = node.voltage ? ` (${node.voltage}V)` : '';
-                const popupContent = `<div class="node-popup">
-                    <h4>${safeName}</h4>
-                    <div class="node-popup-id">${node.node_id}</div>
-                    ${status.reason ? `<div class="node-popup-row" style="color: ${status.color}">
-                        <span>⚠️ ${status.reason}</span>
-                    </div>` : ''}
-                    <div class="node-popup-section">
-                    ${hops !== null ? `<div class="node-popup-row">
-                        <span class="node-popup-label">Hops</span>
-                        <span class="node-popup-value">${hopColorDot}${getHopLabel(hops)}</span>
-                    </div>` : ''}
-                    ${node.snr !== null && node.snr !== undefined ? `<div class="node-popup-row">
-                        <span class="node-popup-label">SNR</span>
-                        <span class="node-popup-value">${node.snr} dB</span>
-                    </div>` : ''}
-                    ${node.battery_level ? `<div class="node-popup-row">
-                        <span class="node-popup-label">Battery</span>
-                        <span class="node-popup-value">${node.battery_level}%${voltText}</span>
-                    </div>` : ''}
-                    ${node.hw_model ? `<div class="node-popup-row">
-                        <span class="node-popup-label">Hardware</span>
-                        <span class="node-popup-value">${node.hw_model}</span>
-                    </div>` : ''}
-                    ${node.role ? `<div class="node-popup-row">
-                        <span class="node-popup-label">Role</span>
-                        <span class="node-popup-value">${node.role}</span>
-                    </div>` : ''}
-                    ${node.channel_utilization ? `<div class="node-popup-row">
-                        <span class="node-popup-label">Ch Util</span>
-                        <span class="node-popup-value">${node.channel_utilization}%</span>
-                    </div>` : ''}
-                    ${node.air_util_tx ? `<div class="node-popup-row">
-                        <span class="node-popup-label">Air TX</span>
-                        <span class="node-popup-value">${node.air_util_tx}%</span>
-                    </div>` : ''}
-                    </div>
-                    <div class="sparkline-container" id="spark-${node.node_id}"></div>
-                    <div class="node-popup-traceroutes" id="tr-${node.node_id}"></div>
-                    <div class="node-popup-actions">
-                        <button class="btn-dm" onclick="openDM('${node.node_id}', '${safeName.replace(/'/g, "\\\\'")}')">DM</button>
-                        ${hops !== null && hops > 0 ? `<button class="btn-trace" onclick="requestTraceroute('${node.node_id}')">Trace</button>` : ''}
-                        <button class="btn-detail" onclick="showNodeDetail('${node.node_id}')">Detail</button>
-                        <button class="btn-center" onclick="map.setView([${node.latitude},${node.longitude}],15)">Center</button>
-                    </div>
-                </div>`;
-
-                nodeMarkers[node.node_id].bindPopup(popupContent);
+                // Popup DOM is built on first open and patched in place afterwards
+                const marker = nodeMarkers[node.node_id];
+                marker.nodeData = node;
+                marker.nodeStatus = status;
+                if (!marker.getPopup()) {
+                    const nodeId = node.node_id;
+                    marker.bindPopup(() => renderNodePopup(nodeId));
+                    // Load sparkline and traceroutes when popup opens
+                    marker.on('popupopen', () => {
+                        loadPopupSparkline(nodeId);
+                        loadPopupTraceroutes(nodeId);
+                    });
+                } else if (marker.isPopupOpen()) {
+                    const view = popupViews[node.node_id];
+                    mutate(() => patchNodePopup(view, node, status));
+                }
+            }
 
-                // Load sparkline and traceroutes when popup opens
-                nodeMarkers[node.node_id].off('popupopen').on('popupopen', () => {
-                    loadPopupSparkline(node.node_id);
-                    loadPopupTraceroutes(node.node_id);
+            const removed = [];
+            for (const nodeId in nodeMarkers) {
+                if (!seen.has(nodeId)) {
+                    removed.push(nodeMarkers[nodeId]);
+                    delete nodeMarkers[nodeId];
+                    markerState.delete(nodeId);
+                    delete popupViews[nodeId];
+                    nodePositions.delete(nodeId);
+                }
+            }
+            // Every Leaflet write goes out in the next frame's write phase
+            if (removed.length || added.length || changed.length) {
+                mutate(() => {
+                    if (removed.length) clusterGroup.removeLayers(removed);
+                    if (added.length) clusterGroup.addLayers(added);
+                    for (const [marker, latlng, icon, nodeId] of changed) {
+                        if (latlng) marker.setLatLng(latlng);
+                        if (!icon) continue;
+                        marker.setIcon(icon);
+                        // Re-apply ripple animation if setIcon wiped the DOM
+                        if (recentMessageNodes.has(nodeId)) {
+                            const el = marker.getElement();
+                            if (el) {
+                                startNodeAnimation(el, 'node-msg-throb');
+                                applyRippleRings(el);
+                            }
+                        }
+                    }
                 });
             }
 
@@ -2942,6 +4017,89 @@ DASHBOARD_HTML = """
             }
         }
 
+        // One popup element per node; refs point at the leaves patchNodePopup writes
+        const popupViews = {};
+        const POPUP_ROWS = [
+            ['hops', 'Hops'], ['snr', 'SNR'], ['battery', 'Battery'], ['hw', 'Hardware'],
+            ['role', 'Role'], ['chUtil', 'Ch Util'], ['airTx', 'Air TX']
+        ];
+
+        function renderNodePopup(nodeId) {
+            const marker = nodeMarkers[nodeId];
+            const view = popupViews[nodeId] || (popupViews[nodeId] = buildNodePopup(nodeId));
+            patchNodePopup(view, marker.nodeData, marker.nodeStatus);
+            return view.el;
+        }
+
+        function buildNodePopup(nodeId) {
+            const el = document.createElement('div');
+            el.className = 'node-popup';
+            el.dataset.nodeId = nodeId;
+            el.innerHTML = `<h4></h4>
+                <div class="node-popup-id"></div>
+                <div class="node-popup-row" data-ref="warn"><span></span></div>
+                <div class="node-popup-section">${POPUP_ROWS.map(([key, label]) => `<div class="node-popup-row" data-ref="${key}">
+                    <span class="node-popup-label">${label}</span>
+                    <span class="node-popup-value"></span>
+                </div>`).join('')}</div>
+                <div class="sparkline-container" id="spark-${escapeHtml(nodeId)}"></div>
+                <div class="node-popup-traceroutes" id="tr-${escapeHtml(nodeId)}"></div>
+                <div class="node-popup-actions">
+                    <button class="btn-dm" data-action="dm">DM</button>
+                    <button class="btn-trace" data-action="trace">Trace</button>
+                    <button class="btn-detail" data-action="detail">Detail</button>
+                    <button class="btn-center" data-action="center">Center</button>
+                </div>`;
+
+            const refs = {
+                name: el.querySelector('h4'),
+                id: el.querySelector('.node-popup-id'),
+                warn: el.querySelector('[data-ref="warn"]'),
+                trace: el.querySelector('.btn-trace'),
+                rows: {}
+            };
+            for (const [key] of POPUP_ROWS) {
+                const row = el.querySelector(`[data-ref="${key}"]`);
+                refs.rows[key] = {row, value: row.querySelector('.node-popup-value')};
+            }
+            const hopsValue = refs.rows.hops.value;
+            hopsValue.innerHTML = '<span style="display:inline-block;width:8px;height:8px;border-radius:50%;margin-right:4px;vertical-align:middle;"></span><span></span>';
+            refs.hopDot = hopsValue.firstChild;
+            refs.rows.hops.value = hopsValue.lastChild;
+            return {el, refs};
+        }
+
+        function patchNodePopup(view, node, status) {
+            if (!view) return;
+            const {refs} = view;
+            const hops = node.hops_used ?? node.hops_away ?? null;
+            const voltText = node.voltage ? ` (${node.voltage}V)` : '';
+            const values = {
+                hops: hops !== null ? getHopLabel(hops) : null,
+                snr: node.snr !== null && node.snr !== undefined ? `${node.snr} dB` : null,
+                battery: node.battery_level ? `${node.battery_level}%${voltText}` : null,
+                hw: node.hw_model || null,
+                role: node.role || null,
+                chUtil: node.channel_utilization ? `${node.channel_utilization}%` : null,
+                airTx: node.air_util_tx ? `${node.air_util_tx}%` : null
+            };
+
+            patchText(refs.name, node.long_name || node.short_name || 'Unknown');
+            patchText(refs.id, node.node_id);
+            refs.warn.hidden = !status.reason;
+            if (status.reason) {
+                refs.warn.style.color = status.color;
+                patchText(refs.warn.firstChild, `⚠️ ${status.reason}`);
+            }
+            for (const [key] of POPUP_ROWS) {
+                const {row, value} = refs.rows[key];
+                row.hidden = values[key] === null;
+                if (values[key] !== null) patchText(value, values[key]);
+            }
+            refs.hopDot.style.background = getHopColor(hops);
+            refs.trace.hidden = !(hops !== null && hops > 0);
+        }
+
         function focusNode(nodeId, lat, lon) {
             if (lat && lon && lat !== 0 && lon !== 0) {
                 map.setView([lat, lon], 14);
@@ -2953,12 +4111,7 @@ DASHBOARD_HTML = """
 
         // Switch to Nodes tab and scroll to a specific node
         function showNodeDetail(nodeId) {
-            // Switch to nodes tab
-            document.querySelectorAll('.tab').forEach(t => t.classList.remove('active'));
-            document.querySelectorAll('.tab-content').forEach(c => c.classList.remove('active'));
-            const nodesTab = document.querySelector('.tab[data-tab="nodes"]');
-            if (nodesTab) nodesTab.classList.add('active');
-            document.getElementById('tab-nodes').classList.add('active');
+            showTab('nodes');
             // Close popup
             map.closePopup();
             // Scroll to node in list
@@ -2979,10 +4132,16 @@ DASHBOARD_HTML = """
             try {
                 const resp = await fetch('/api/signal-trends?node_id=' + encodeURIComponent(nodeId) + '&hours=24');
                 const data = await resp.json();
-                const svg = buildSparklineSVG(data);
-                if (svg) {
-                    container.innerHTML = '<div class="sparkline-label">SNR (24h)</div>' + svg;
-                }
+                const values = (data || []).map(d => d.avg_snr).filter(v => v !== null);
+                if (values.length === 0) return;
+                mutate(() => {
+                    let canvas = container.querySelector('canvas');
+                    if (!canvas) {
+                        container.innerHTML = '<div class="sparkline-label">SNR (24h)</div><canvas></canvas>';
+                        canvas = container.querySelector('canvas');
+                    }
+                    drawSparkline(canvas, values);
+                });
             } catch (e) {
                 console.error('[SPARK] Failed:', e);
             }
@@ -3019,37 +4178,51 @@ DASHBOARD_HTML = """
 
         // Enhanced chart with axes, labels, tooltips, and current-hour highlight
         function updateEnhancedChart(data, bucketType) {
-            const container = document.getElementById('activity-chart');
-            const xAxis = document.getElementById('chart-x-axis');
-            const yAxis = document.getElementById('chart-y-axis');
+            const xAxis = els.chartXAxis;
+            const yAxis = els.chartYAxis;
 
             if (!data || data.length === 0) {
-                container.innerHTML = '<div style="color:#555;margin:auto;font-size:0.75em;">No activity data</div>';
+                chartState = null;
+                mutate(() => {
+                    const canvas = els.activityCanvas;
+                    canvas.getContext('2d').clearRect(0, 0, canvas.width, canvas.height);
+                    els.chartEmpty.hidden = false;
+                });
                 if (xAxis) xAxis.innerHTML = '';
                 if (yAxis) yAxis.innerHTML = '<span>0</span>';
                 return;
             }
 
-            const maxVal = Math.max(...data.map(d => d.count), 1);
             const currentHour = new Date().getHours().toString().padStart(2, '0');
+            const prev = chartState;
+            const n = data.length;
+            // Nothing moved since the last update: keep the chart and axes as they are
+            if (prev && prev.target.length === n && prev.bucketType === bucketType && prev.currentHour === currentHour &&
+                data.every((d, i) => d.count === prev.data[i].count && d.label === prev.data[i].label)) {
+                prev.data = data;
+                return;
+            }
+            let maxVal = 1;
+            for (const d of data) if (d.count > maxVal) maxVal = d.count;
 
             // Y-axis labels
             if (yAxis) {
                 yAxis.innerHTML = `<span>${maxVal}</span><span>${Math.round(maxVal / 2)}</span><span>0</span>`;
             }
 
-            // Bars with tooltips
-            let barsHtml = '';
-            for (const item of data) {
-                const height = Math.max((item.count / maxVal) * 100, 2);
-                const isCurrent = (bucketType === 'hour' && item.label === currentHour);
-                const tooltipLabel = bucketType === 'hour' ? item.label + ':00' : item.label;
-                barsHtml += `<div class="chart-bar ${isCurrent ? 'current-hour' : ''}"
-                    style="height:${height}%"
-                    data-tooltip="${tooltipLabel}: ${item.count}"
-                    title="${tooltipLabel} - ${item.count} msgs"></div>`;
-            }
-            container.innerHTML = barsHtml;
+            // Bars tween from their previous heights when the bucket count is
+            // unchanged. The height buffers are reused and only reallocated
+            // when the range changes the number of buckets.
+            const resized = !prev || prev.target.length !== n;
+            const from = resized ? new Float32Array(n) : prev.from;
+            const target = resized ? new Float32Array(n) : prev.target;
+            const heights = resized ? new Float32Array(n) : prev.heights;
+            for (let i = 0; i < n; i++) target[i] = Math.max(data[i].count / maxVal, 0.02);
+            from.set(resized ? target : heights);
+            heights.set(from);
+            chartState = {data, bucketType, currentHour, from, target, heights, start: performance.now()};
+            els.chartEmpty.hidden = true;
+            drawActivityChart();
 
             // X-axis labels (adaptive spacing)
             if (xAxis) {
@@ -3067,9 +4240,94 @@ DASHBOARD_HTML = """
             }
         }
 
+        // ==================== ACTIVITY CHART CANVAS ====================
+        const CHART_GAP = 2;
+        const CHART_TWEEN_MS = 300;
+        let chartState = null;
+        let chartFramePending = false;
+
+        function drawActivityChart() {
+            if (chartFramePending) return;
+            chartFramePending = true;
+            const canvas = els.activityCanvas;
+            measure(() => {
+                const width = canvas.clientWidth, height = canvas.clientHeight;
+                mutate(() => {
+                    chartFramePending = false;
+                    // Hidden tab: the resize observer redraws once it is shown
+                    if (!chartState || !width || !height) return;
+                    if (paintActivityChart(canvas, width, height)) requestAnimationFrame(drawActivityChart);
+                });
+            });
+        }
+
+        // Returns true while the height tween still has frames left
+        function paintActivityChart(canvas, width, height) {
+            const st = chartState;
+            const dpr = window.devicePixelRatio || 1;
+            if (canvas.width !== Math.round(width * dpr) || canvas.height !== Math.round(height * dpr)) {
+                canvas.width = Math.round(width * dpr);
+                canvas.height = Math.round(height * dpr);
+            }
+            const ctx = canvas.getContext('2d');
+            ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+            ctx.clearRect(0, 0, width, height);
+
+            const t = document.body.classList.contains('interacting') ? 1 :
+                Math.min((performance.now() - st.start) / CHART_TWEEN_MS, 1);
+            const ease = 1 - Math.pow(1 - t, 3);
+            const n = st.data.length;
+            for (let i = 0; i < n; i++) st.heights[i] = st.from[i] + (st.target[i] - st.from[i]) * ease;
+
+            const barW = (width - CHART_GAP * (n - 1)) / n;
+            st.data.forEach((item, i) => {
+                const isCurrent = (st.bucketType === 'hour' && item.label === st.currentHour);
+                const x = i * (barW + CHART_GAP);
+                const h = Math.max(st.heights[i] * height, 2);
+                const grad = ctx.createLinearGradient(0, height, 0, height - h);
+                grad.addColorStop(0, isCurrent ? '#00ff88' : '#00d4ff');
+                grad.addColorStop(1, isCurrent ? '#00ffcc' : '#00ff88');
+                ctx.fillStyle = grad;
+                ctx.shadowColor = isCurrent ? 'rgba(0,255,136,0.4)' : 'transparent';
+                ctx.shadowBlur = isCurrent ? 6 : 0;
+                ctx.beginPath();
+                if (ctx.roundRect) ctx.roundRect(x, height - h, barW, h, [2, 2, 0, 0]);
+                else ctx.rect(x, height - h, barW, h);
+                ctx.fill();
+            });
+            return t < 1;
+        }
+
+        function chartBarAt(offsetX, width) {
+            if (!chartState) return -1;
+            const n = chartState.data.length;
+            const slot = (width + CHART_GAP) / n;
+            const i = Math.floor(offsetX / slot);
+            return i >= 0 && i < n ? i : -1;
+        }
+
+        (function initActivityChart() {
+            const canvas = els.activityCanvas;
+            const tooltip = els.chartTooltip;
+            canvas.addEventListener('mousemove', (e) => {
+                const width = canvas.clientWidth, height = canvas.clientHeight;
+                const i = chartBarAt(e.offsetX, width);
+                if (i < 0) { tooltip.hidden = true; return; }
+                const item = chartState.data[i];
+                const label = chartState.bucketType === 'hour' ? item.label + ':00' : item.label;
+                const slot = (width + CHART_GAP) / chartState.data.length;
+                tooltip.textContent = `${label}: ${item.count}`;
+                tooltip.style.left = (i * slot + (slot - CHART_GAP) / 2) + 'px';
+                tooltip.style.bottom = (Math.max(chartState.target[i] * height, 2) + 4) + 'px';
+                tooltip.hidden = false;
+            });
+            canvas.addEventListener('mouseleave', () => { tooltip.hidden = true; });
+            if (window.ResizeObserver) new ResizeObserver(() => drawActivityChart()).observe(canvas);
+        })();
+
         function updateLastUpdate() {
             lastUpdateTime = Date.now();
-            document.getElementById('last-update').textContent = 'just now';
+            els.lastUpdate.textContent = 'just now';
         }
 
         function getHopClass(hops) {
@@ -3096,40 +4354,41 @@ DASHBOARD_HTML = """
             return hops + (hops === 1 ? ' hop' : ' hops');
         }
 
-        // Recency-based color: green → cyan → blue → purple → pink
-        function getRecencyColor(node) {
-            if (!node.last_heard) return '#666666';
-            let lastHeard;
-            if (typeof node.last_heard === 'number') {
-                lastHeard = new Date(node.last_heard * 1000);
-            } else {
-                lastHeard = new Date(node.last_heard);
-                if (isNaN(lastHeard.getTime())) lastHeard = new Date(node.last_heard + 'Z');
+        // Recency buckets by minutes since last heard: green → cyan → blue → purple → pink.
+        // Past the last bucket (24h) a node is stale and left off the map.
+        const RECENCY_BUCKETS = [
+            {mins: 15, color: '#00ff88'},    // bright green — just heard
+            {mins: 60, color: '#00d4ff'},    // cyan — recent
+            {mins: 360, color: '#5577ff'},   // blue — hours ago
+            {mins: 720, color: '#8855dd'},   // purple — half day
+            {mins: 1440, color: '#cc44aa'},  // pink — stale (12-24h)
+        ];
+
+        function recencyBucket(mins) {
+            if (mins > 1440) return -1;
+            for (let i = 0; i < RECENCY_BUCKETS.length - 1; i++) {
+                if (mins < RECENCY_BUCKETS[i].mins) return i;
             }
-            const mins = (Date.now() - lastHeard.getTime()) / 60000;
-            if (mins < 15) return '#00ff88';    // bright green — just heard
-            if (mins < 60) return '#00d4ff';    // cyan — recent
-            if (mins < 360) return '#5577ff';   // blue — hours ago
-            if (mins < 720) return '#8855dd';   // purple — half day
-            return '#cc44aa';                   // pink — stale (12-24h)
+            return RECENCY_BUCKETS.length - 1;
         }
 
-        function getNodeStatus(node) {
+        // last_heard is Unix seconds from the live API or an ISO string from history
+        function lastHeardMs(value) {
+            if (typeof value === 'number') return value * 1000;
+            const t = new Date(value).getTime();
+            return isNaN(t) ? new Date(value + 'Z').getTime() : t;
+        }
+
+        // `until` is when the recency bucket next changes; the status holds until then
+        function getNodeStatus(node, now = Date.now()) {
             // 1. Offline 24h+ = hidden (filtered in updateMap), but fallback grey
-            if (node.last_heard) {
-                let lastHeard;
-                if (typeof node.last_heard === 'number') {
-                    lastHeard = new Date(node.last_heard * 1000);
-                } else {
-                    lastHeard = new Date(node.last_heard);
-                    if (isNaN(lastHeard.getTime())) lastHeard = new Date(node.last_heard + 'Z');
-                }
-                const hoursSince = (Date.now() - lastHeard.getTime()) / 3600000;
-                if (hoursSince > 24) {
-                    return { color: '#444444', reason: 'Offline 24h+', stale: true };
-                }
-            } else {
-                return { color: '#444444', reason: 'Never heard', stale: true };
+            if (!node.last_heard) {
+                return { color: '#444444', reason: 'Never heard', stale: true, until: Infinity };
+            }
+            const heard = lastHeardMs(node.last_heard);
+            const bucket = recencyBucket((now - heard) / 60000);
+            if (bucket < 0) {
+                return { color: '#444444', reason: 'Offline 24h+', stale: true, until: Infinity };
             }
 
             // 2. Low battery warning (still uses recency color, just adds reason)
@@ -3141,8 +4400,26 @@ DASHBOARD_HTML = """
             // 3. Color based on current mode
             const color = mapColorMode === 'hops'
                 ? getHopColor(node.hops_used ?? node.hops_away ?? null)
-                : getRecencyColor(node);
-            return { color: color, reason: reason, stale: false };
+                : RECENCY_BUCKETS[bucket].color;
+            return { color: color, reason: reason, stale: false, until: heard + RECENCY_BUCKETS[bucket].mins * 60000 };
+        }
+
+        // Map refreshes reuse each node's status until something it depends on
+        // changes or its recency bucket runs out
+        const nodeStatusCache = new Map();
+
+        function cachedNodeStatus(node, now) {
+            const hops = node.hops_used ?? node.hops_away ?? null;
+            const hit = nodeStatusCache.get(node.node_id);
+            if (hit && now < hit.status.until && hit.lastHeard === node.last_heard &&
+                hit.battery === node.battery_level && hit.hops === hops && hit.mode === mapColorMode) {
+                return hit.status;
+            }
+            const status = getNodeStatus(node, now);
+            nodeStatusCache.set(node.node_id, {
+                status, lastHeard: node.last_heard, battery: node.battery_level, hops, mode: mapColorMode
+            });
+            return status;
         }
 
         function toggleMapColorMode() {
@@ -3164,12 +4441,31 @@ DASHBOARD_HTML = """
                 hopsItems.style.display = 'none';
             }
             // Re-render map markers with new colors
-            if (cachedMapNodes.length) updateMap(cachedMapNodes, true);
+            if (cachedMapNodes.length) updateMap(cachedMapNodes);
         }
 
         // Fixed timestamp parsing - handles Unix timestamps and ISO strings
+        // Labels only change once a minute, so a row re-rendered within the same
+        // minute (or sharing a timestamp with another row) reuses its string
+        const timeSinceCache = new Map();
+        let timeSinceMinute = 0;
+
         function timeSince(timestamp) {
             if (!timestamp) return 'Never';
+            const minute = Math.floor(Date.now() / 60000);
+            if (minute !== timeSinceMinute) {
+                timeSinceCache.clear();
+                timeSinceMinute = minute;
+            }
+            let label = timeSinceCache.get(timestamp);
+            if (label === undefined) {
+                label = formatTimeSince(timestamp);
+                timeSinceCache.set(timestamp, label);
+            }
+            return label;
+        }
+
+        function formatTimeSince(timestamp) {
 
             let date;
 
@@ -3198,18 +4494,33 @@ DASHBOARD_HTML = """
             return Math.floor(seconds / 86400) + 'd ago';
         }
 
+        // Built once: constructing an Intl formatter costs far more than format()
+        const TIME_FORMAT = new Intl.DateTimeFormat([], {hour: '2-digit', minute: '2-digit'});
+        const DATE_TIME_FORMAT = new Intl.DateTimeFormat([], {
+            month: 'short', day: 'numeric',
+            hour: '2-digit', minute: '2-digit'
+        });
+
         function formatTime(timestamp) {
             if (!timestamp) return '';
             const date = new Date(timestamp);
             if (isNaN(date.getTime())) return '';
-            return date.toLocaleTimeString([], {hour: '2-digit', minute: '2-digit'});
+            return TIME_FORMAT.format(date);
         }
 
+        // String-based so list renderers don't create a throwaway element per
+        // field; quotes are escaped too, so values are safe inside attributes.
+        // Most names and texts need no escaping, so a test pass returns those
+        // as they are without building a new string.
+        const HTML_ESCAPES = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'};
+        const HTML_ESCAPE_TEST = /[&<>"']/;
+        const HTML_ESCAPE_ALL = /[&<>"']/g;
+        const escapeChar = ch => HTML_ESCAPES[ch];
+
         function escapeHtml(text) {
             if (!text) return '';
-            const div = document.createElement('div');
-            div.textContent = text;
-            return div.innerHTML;
+            const str = typeof text === 'string' ? text : String(text);
+            return HTML_ESCAPE_TEST.test(str) ? str.replace(HTML_ESCAPE_ALL, escapeChar) : str;
         }
 
         // ==================== TIMELINE SCRUBBER ====================
@@ -3245,10 +4556,7 @@ DASHBOARD_HTML = """
         }
 
         function formatDateTime(date) {
-            return date.toLocaleString([], {
-                month: 'short', day: 'numeric',
-                hour: '2-digit', minute: '2-digit'
-            });
+            return DATE_TIME_FORMAT.format(date);
         }
 
         // Build local ISO string (matches how Python stores timestamps with datetime.now().isoformat())
@@ -3258,44 +4566,66 @@ DASHBOARD_HTML = """
                  + 'T' + pad(date.getHours()) + ':' + pad(date.getMinutes()) + ':' + pad(date.getSeconds());
         }
 
-        // Timeline slider event - debounced so it waits until user stops dragging
+        // Timeline slider: the date label follows the thumb on every input
+        // event, but the historical fetch + full re-render only runs once the
+        // user lets go (or pauses, with TIMELINE_CONTINUOUS)
+        const TIMELINE_CONTINUOUS = false;  // also seek when a drag pauses
+        const TIMELINE_SEEK_DELAY = 200;    // ms of quiet before seeking mid-drag
         let timelineDebounceTimer = null;
-        document.getElementById('timeline-slider').addEventListener('input', (e) => {
+        let timelineTarget = null;
+        let historicalRequestSeq = 0;
+
+        function scheduleTimelineSeek(delay) {
+            if (timelineDebounceTimer) clearTimeout(timelineDebounceTimer);
+            timelineDebounceTimer = setTimeout(async () => {
+                timelineDebounceTimer = null;
+                if (isLiveMode || !timelineTarget) return;
+                els.refreshMode.textContent = 'Historical view';
+                await loadHistoricalData(toLocalISO(timelineTarget));
+            }, delay);
+        }
+
+        function enterHistoricalMode() {
+            isLiveMode = false;
+            document.body.classList.add('historical-mode');
+            els.syncNowBtn.classList.remove('hidden');
+            els.timelineDate.classList.add('historical');
+            // Disable all range/filter buttons in historical mode
+            document.querySelectorAll('.filter-btn, .range-btn').forEach(b => b.disabled = true);
+        }
+
+        const timelineSlider = document.getElementById('timeline-slider');
+        timelineSlider.addEventListener('input', (e) => {
+            markInteracting();
             const pct = e.target.value / 1000;
-            const targetTime = timelineMin + (timelineMax - timelineMin) * pct;
-            const targetDate = new Date(targetTime);
 
             if (pct >= 0.995) {
                 // Close to end = return to live mode
                 if (timelineDebounceTimer) clearTimeout(timelineDebounceTimer);
-                syncToNow();
+                timelineTarget = null;
+                if (!isLiveMode) syncToNow();
                 return;
             }
 
             // Update UI immediately (responsive feel)
-            isLiveMode = false;
-            document.body.classList.add('historical-mode');
-            document.getElementById('sync-now-btn').classList.remove('hidden');
-            document.getElementById('timeline-date').textContent = '📅 ' + formatDateTime(targetDate);
-            document.getElementById('timeline-date').classList.add('historical');
-            document.getElementById('refresh-mode').textContent = 'Loading...';
-            // Disable all range/filter buttons in historical mode
-            document.querySelectorAll('.filter-btn').forEach(b => b.disabled = true);
-            document.querySelectorAll('.range-btn').forEach(b => b.disabled = true);
+            if (isLiveMode) enterHistoricalMode();
+            timelineTarget = new Date(timelineMin + (timelineMax - timelineMin) * pct);
+            els.timelineDate.textContent = '📅 ' + formatDateTime(timelineTarget);
+            els.refreshMode.textContent = 'Loading...';
 
-            // Debounce the actual data fetch - wait 300ms after user stops dragging
-            if (timelineDebounceTimer) clearTimeout(timelineDebounceTimer);
-            timelineDebounceTimer = setTimeout(async () => {
-                document.getElementById('refresh-mode').textContent = 'Historical view';
-                await loadHistoricalData(toLocalISO(targetDate));
-            }, 300);
+            if (TIMELINE_CONTINUOUS) scheduleTimelineSeek(TIMELINE_SEEK_DELAY);
         });
+        // 'change' fires on release (and per keyboard step), so seek promptly
+        timelineSlider.addEventListener('change', () => scheduleTimelineSeek(50));
 
         async function loadHistoricalData(timestamp) {
             console.log('[TIMELINE] Loading historical data for:', timestamp);
+            const seq = ++historicalRequestSeq;
             try {
                 const resp = await fetch('/api/historical?at=' + encodeURIComponent(timestamp));
                 const data = await resp.json();
+                // A newer seek, or a return to live, supersedes this response
+                if (seq !== historicalRequestSeq || isLiveMode) return;
                 console.log('[TIMELINE] Received:', data.messages?.length || 0, 'messages,', data.nodes?.length || 0, 'nodes');
 
                 if (data.error) {
@@ -3311,7 +4641,7 @@ DASHBOARD_HTML = """
                 updateNodes(data.nodes || []);
 
                 // 3. Map markers (clear old ones for historical)
-                updateMap(data.nodes || [], true);
+                updateMap(data.nodes || []);
 
                 // 4. Full stats (header, tabs, sidebar stats, packet types)
                 if (data.stats) {
@@ -3324,7 +4654,7 @@ DASHBOARD_HTML = """
                 }
 
                 // 6. Update the last-update indicator
-                document.getElementById('last-update').textContent = 'historical';
+                els.lastUpdate.textContent = 'historical';
 
             } catch (e) {
                 console.error('[TIMELINE] Failed to load:', e);
@@ -3333,19 +4663,21 @@ DASHBOARD_HTML = """
 
         function syncToNow() {
             isLiveMode = true;
+            historicalRequestSeq++;
             document.body.classList.remove('historical-mode');
             document.body.classList.remove('timeline-visible');
-            document.getElementById('sync-now-btn').classList.add('hidden');
-            document.getElementById('timeline-date').textContent = '🟢 Live';
-            document.getElementById('timeline-date').classList.remove('historical');
+            els.syncNowBtn.classList.add('hidden');
+            els.timelineDate.textContent = '🟢 Live';
+            els.timelineDate.classList.remove('historical');
             document.getElementById('timeline-slider').value = 1000;
-            document.getElementById('refresh-mode').textContent = 'Smart refresh';
+            els.refreshMode.textContent = 'Smart refresh';
             setTimeout(() => { if (typeof map !== 'undefined') map.invalidateSize(); }, 350);
 
             // Re-enable all filter/range buttons
-            document.querySelectorAll('.filter-btn').forEach(b => b.disabled = false);
-            document.querySelectorAll('.range-btn').forEach(b => b.disabled = false);
+            document.querySelectorAll('.filter-btn, .range-btn').forEach(b => b.disabled = false);
 
+            resetPolled();
+            lastLiveRender = 0;  // historical rows replaced the live lists, so no delta
             refreshData();  // Load current live data
         }
 
@@ -3435,7 +4767,7 @@ DASHBOARD_HTML = """
             }
 
             // Refresh network tab and route lines
-            if (networkTabActive) refreshNetworkTab();
+            if (activeTab === 'network') refreshNetworkTab();
             if (trailsEnabled) loadTrails();
         }
 
@@ -3483,7 +4815,7 @@ DASHBOARD_HTML = """
                     const shortName = (c.name || '??').substring(0, 4);
                     const total = (c.received_count || 0) + (c.sent_count || 0);
                     const time = formatTime(c.last_timestamp);
-                    html += `<div class="dm-conv-item" onclick="openDMThread('${c.node_id}', '${escapeHtml(c.name).replace(/'/g, "\\'")}')">
+                    html += `<div class="dm-conv-item" data-node-id="${escapeHtml(c.node_id)}" data-name="${escapeHtml(c.name)}">
                         <div class="dm-conv-avatar">${escapeHtml(shortName)}</div>
                         <div class="dm-conv-info">
                             <div class="dm-conv-name">${escapeHtml(c.name)}</div>
@@ -3501,6 +4833,12 @@ DASHBOARD_HTML = """
             }
         }
 
+        // One delegated listener for every conversation row, however often the list is rebuilt
+        document.getElementById('dm-conversations').addEventListener('click', (e) => {
+            const item = e.target.closest('.dm-conv-item');
+            if (item) openDMThread(item.dataset.nodeId, item.dataset.name);
+        });
+
         async function openDMThread(nodeId, nodeName) {
             document.getElementById('dm-conversations').style.display = 'none';
             document.getElementById('dm-thread').style.display = 'flex';
@@ -3557,24 +4895,15 @@ DASHBOARD_HTML = """
         }
 
         function updateDMByteCounter() {
-            const text = document.getElementById('dm-input').value;
-            const bytes = new TextEncoder().encode(text).length;
-            const counter = document.getElementById('dm-byte-counter');
-            counter.textContent = (200 - bytes) + ' bytes left';
-
-            counter.classList.remove('warning', 'danger');
-            if (bytes > 180) {
-                counter.classList.add('danger');
-            } else if (bytes > 150) {
-                counter.classList.add('warning');
-            }
+            const bytes = byteLength(document.getElementById('dm-input').value);
+            paintByteCounter(document.getElementById('dm-byte-counter'), bytes, (200 - bytes) + ' bytes left');
         }
 
         async function sendDM() {
             const text = document.getElementById('dm-input').value.trim();
             if (!text || !dmTargetId) return;
 
-            const bytes = new TextEncoder().encode(text).length;
+            const bytes = byteLength(text);
             if (bytes > 200) {
                 alert('Message too long! Max 200 bytes.');
                 return;
@@ -3622,12 +4951,18 @@ DASHBOARD_HTML = """
 
         // ==================== NODE SEARCH & SORT ====================
 
+        // Trailing debounce: only the last keystroke of a burst re-filters, and
+        // edits that leave the trimmed term unchanged don't re-render at all
+        const NODE_SEARCH_DELAY = 220;
+
         document.getElementById('node-search').addEventListener('input', (e) => {
             clearTimeout(nodeSearchTimeout);
             nodeSearchTimeout = setTimeout(() => {
-                nodeSearchTerm = e.target.value.trim();
+                const term = e.target.value.trim();
+                if (term === nodeSearchTerm) return;
+                nodeSearchTerm = term;
                 updateNodes(cachedNodes, true);
-            }, 200);
+            }, NODE_SEARCH_DELAY);
         });
 
         document.getElementById('node-sort').addEventListener('change', (e) => {
@@ -3635,20 +4970,60 @@ DASHBOARD_HTML = """
             updateNodes(cachedNodes, true);
         });
 
+        // One delegated handler for every node row and its traceroute button
+        els.nodeList.addEventListener('click', (e) => {
+            const item = e.target.closest('.node-item');
+            if (!item) return;
+            if (e.target.closest('.node-trace-btn')) {
+                requestTraceroute(item.dataset.nodeId);
+            } else {
+                focusNode(item.dataset.nodeId, parseFloat(item.dataset.lat), parseFloat(item.dataset.lon));
+            }
+        });
+
+        // Popup action buttons, delegated from the map container. Actions read
+        // the latest data off the marker, so popups never need rebinding.
+        const POPUP_ACTIONS = {
+            dm: (nodeId, node) => openDM(nodeId, node.long_name || node.short_name || 'Unknown'),
+            trace: nodeId => requestTraceroute(nodeId),
+            detail: nodeId => showNodeDetail(nodeId),
+            center: (nodeId, node) => map.setView([node.latitude, node.longitude], 15),
+        };
+
+        document.getElementById('map').addEventListener('click', (e) => {
+            const btn = e.target.closest('.node-popup [data-action]');
+            if (!btn) return;
+            const nodeId = btn.closest('.node-popup').dataset.nodeId;
+            const marker = nodeMarkers[nodeId];
+            if (marker) POPUP_ACTIONS[btn.dataset.action](nodeId, marker.nodeData);
+        });
+
         // ==================== REFRESH & INTERVALS ====================
 
-        // Smart refresh - check for updates every 5 seconds (only in live mode)
-        setInterval(() => {
-            if (isLiveMode) {
-                checkForUpdates();
-            }
-        }, 5000);
+        // Smart refresh - a fallback for when the socket isn't pushing changes,
+        // rescheduled after each check. A dropped socket is polled every 5s; a
+        // connected one that has gone quiet gets a slow check in case pushes
+        // stalled, and one that is still delivering isn't polled at all.
+        const POLL_FAST_MS = 5000;
+        const POLL_SLOW_MS = 30000;
+        const SOCKET_QUIET_MS = 15000;
+
+        function scheduleFallbackPoll() {
+            setTimeout(async () => {
+                const quiet = Date.now() - lastSocketEventMs > SOCKET_QUIET_MS;
+                if (isLiveMode && !document.hidden && (!socket.connected || quiet)) {
+                    await checkForUpdates();
+                }
+                scheduleFallbackPoll();
+            }, socket.connected ? POLL_SLOW_MS : POLL_FAST_MS);
+        }
+        scheduleFallbackPoll();
 
         // Update "last update" display
         setInterval(() => {
-            if (isLiveMode) {
+            if (isLiveMode && !document.hidden) {
                 const seconds = Math.floor((Date.now() - lastUpdateTime) / 1000);
-                document.getElementById('last-update').textContent = seconds < 5 ? 'just now' : seconds + 's ago';
+                els.lastUpdate.textContent = seconds < 5 ? 'just now' : seconds + 's ago';
             }
         }, 1000);
 
@@ -3663,32 +5038,58 @@ DASHBOARD_HTML = """
             95: '⛈️', 96: '⛈️', 99: '⛈️'
         };
 
+        // Last good reading is kept in localStorage so a reload paints it
+        // immediately; the network refresh then runs off the hot refresh loop.
+        const WEATHER_CACHE_KEY = 'weatherCache';
+        const WEATHER_REFRESH_MS = 900000; // 15 minutes
+
+        function paintWeather(data) {
+            const emoji = weatherCodeEmoji[data.weather_code] || '🌡️';
+            setText('header-weather-icon', emoji);
+            setText('header-weather-temp', Math.round(data.temp) + '°F');
+            setText('header-weather-loc', data.location || '');
+            const tooltip = `${data.description} | Feels like ${Math.round(data.feels_like)}°F | Humidity ${data.humidity}% | Wind ${Math.round(data.wind_speed)}mph ${data.wind_dir}`;
+            mutate(() => { document.getElementById('header-weather-stat').title = tooltip; });
+        }
+
         async function fetchWeather() {
             try {
                 const resp = await fetch('/api/weather');
                 const data = await resp.json();
                 if (data.error) throw new Error(data.error);
+                paintWeather(data);
+                const at = Date.now();
+                whenIdle(() => {
+                    try {
+                        localStorage.setItem(WEATHER_CACHE_KEY, JSON.stringify({at, data}));
+                    } catch (e) { /* storage full or disabled */ }
+                });
+            } catch (e) {
+                // Keep a cached reading on screen rather than blanking it
+                if (loadCachedWeather()) return;
+                setText('header-weather-icon', '--');
+                setText('header-weather-temp', '--');
+                setText('header-weather-loc', '');
+                mutate(() => { document.getElementById('header-weather-stat').title = 'Weather unavailable'; });
+            }
+        }
 
-                const emoji = weatherCodeEmoji[data.weather_code] || '🌡️';
-                document.getElementById('header-weather-icon').textContent = emoji;
-                document.getElementById('header-weather-temp').textContent = Math.round(data.temp) + '°F';
-                document.getElementById('header-weather-loc').textContent = data.location || '';
-
-                const tooltip = `${data.description} | Feels like ${Math.round(data.feels_like)}°F | Humidity ${data.humidity}% | Wind ${Math.round(data.wind_speed)}mph ${data.wind_dir}`;
-                document.getElementById('header-weather-stat').title = tooltip;
+        function loadCachedWeather() {
+            try {
+                const cached = JSON.parse(localStorage.getItem(WEATHER_CACHE_KEY));
+                if (!cached || Date.now() - cached.at > 4 * WEATHER_REFRESH_MS) return false;
+                paintWeather(cached.data);
+                return true;
             } catch (e) {
-                document.getElementById('header-weather-icon').textContent = '--';
-                document.getElementById('header-weather-temp').textContent = '--';
-                document.getElementById('header-weather-loc').textContent = '';
-                document.getElementById('header-weather-stat').title = 'Weather unavailable';
+                return false;
             }
         }
 
+        loadCachedWeather();
         fetchWeather();
-        setInterval(fetchWeather, 900000); // Refresh every 15 minutes
+        setInterval(fetchWeather, WEATHER_REFRESH_MS);
 
         // ==================== NETWORK TAB ====================
-        let networkTabActive = false;
 
         function toggleNetSection(header) {
             header.classList.toggle('collapsed');
@@ -3699,12 +5100,7 @@ DASHBOARD_HTML = """
         // Refresh network tab when activated
         document.querySelectorAll('.tab').forEach(tab => {
             tab.addEventListener('click', () => {
-                if (tab.dataset.tab === 'network') {
-                    networkTabActive = true;
-                    refreshNetworkTab();
-                } else {
-                    networkTabActive = false;
-                }
+                if (tab.dataset.tab === 'network') refreshNetworkTab();
             });
         });
 
@@ -3714,8 +5110,8 @@ DASHBOARD_HTML = """
                     fetch('/api/topology').then(r => r.json()),
                     fetch('/api/traceroutes?limit=10').then(r => r.json()),
                     fetch('/api/store-forward-stats').then(r => r.json()),
-                    fetch('/api/detection-alerts?limit=10').then(r => r.json()),
-                    fetch('/api/paxcounter?limit=20').then(r => r.json())
+                    fetch('/api/detection-alerts?limit=8').then(r => r.json()),
+                    fetch('/api/paxcounter?limit=10').then(r => r.json())
                 ]);
 
                 renderTopology(topology);
@@ -3728,117 +5124,229 @@ DASHBOARD_HTML = """
             }
         }
 
-        function renderTopology(data) {
-            const canvas = document.getElementById('topology-canvas');
-            if (!canvas) return;
-            const ctx = canvas.getContext('2d');
-
-            canvas.width = canvas.offsetWidth;
-            canvas.height = Math.max(canvas.offsetHeight, 250);
+        // Patch a list's rows in place: rows whose markup is unchanged keep
+        // their element, changed rows are swapped, and surplus rows dropped.
+        const rowScratch = document.createElement('template');
+
+        function renderRows(container, rows) {
+            mutate(() => {
+                const current = container.children;
+                rows.forEach((html, i) => {
+                    const existing = current[i];
+                    if (existing && existing._html === html) return;
+                    rowScratch.innerHTML = html;
+                    const el = rowScratch.content.firstElementChild;
+                    el._html = html;
+                    if (existing) container.replaceChild(el, existing);
+                    else container.appendChild(el);
+                });
+                while (current.length > rows.length) container.lastElementChild.remove();
+            });
+        }
 
-            const nodes = data.nodes || [];
-            const edges = data.edges || [];
+        // ==================== TOPOLOGY WORKER ====================
+        // Layout and drawing run in a worker on the canvas's OffscreenCanvas.
+        // The page posts only what changed since the last update (nodes added
+        // or renamed, nodes removed, the edge list when it differs); positions
+        // stay in the worker, so a refresh relaxes the existing layout instead
+        // of scattering it again. Without OffscreenCanvas the same source runs
+        // on the main thread against the canvas element.
+        const TOPOLOGY_WORKER_SRC = `
+            const PAD = 30;
+            let canvas = null, ctx = null;
+            let width = 0, height = 0;
+            const nodes = new Map();
+            let edges = [];
+
+            function resize(w, h) {
+                if (width && height) {
+                    for (const n of nodes.values()) {
+                        n.x = n.x * w / width;
+                        n.y = n.y * h / height;
+                    }
+                }
+                width = canvas.width = w;
+                height = canvas.height = h;
+            }
 
-            document.getElementById('topology-count').textContent = nodes.length + ' nodes, ' + edges.length + ' links';
+            // Simple force-directed layout with iterative relaxation.
+            // New nodes start on a circle at their index, as a fresh layout would.
+            function layout() {
+                const list = [...nodes.values()];
+                const r = Math.min(width - PAD*2, height - PAD*2) * 0.35;
+                list.forEach((n, i) => {
+                    if (n.placed) return;
+                    const angle = (2 * Math.PI * i) / list.length;
+                    n.x = width/2 + r * Math.cos(angle) + (Math.random()-0.5)*20;
+                    n.y = height/2 + r * Math.sin(angle) + (Math.random()-0.5)*20;
+                    n.placed = true;
+                });
 
-            if (nodes.length === 0 || edges.length === 0) {
-                ctx.fillStyle = '#555';
-                ctx.font = '12px sans-serif';
-                ctx.textAlign = 'center';
-                ctx.fillText(edges.length === 0 ? 'No link data — run traceroutes to build topology' : 'No topology data',
-                    canvas.width/2, canvas.height/2);
-                return;
+                // Run force simulation (simple spring model, 60 iterations)
+                for (let iter = 0; iter < 60; iter++) {
+                    // Repulsion between all nodes
+                    for (let i = 0; i < list.length; i++) {
+                        for (let j = i+1; j < list.length; j++) {
+                            const a = list[i], b = list[j];
+                            const dx = b.x - a.x, dy = b.y - a.y;
+                            const dist = Math.sqrt(dx*dx + dy*dy) || 1;
+                            const force = 800 / (dist * dist);
+                            a.vx -= dx/dist * force; a.vy -= dy/dist * force;
+                            b.vx += dx/dist * force; b.vy += dy/dist * force;
+                        }
+                    }
+                    // Attraction along edges
+                    for (const [from, to] of edges) {
+                        const a = nodes.get(from), b = nodes.get(to);
+                        if (!a || !b) continue;
+                        const dx = b.x - a.x, dy = b.y - a.y;
+                        const dist = Math.sqrt(dx*dx + dy*dy) || 1;
+                        const force = (dist - 60) * 0.05;
+                        a.vx += dx/dist * force; a.vy += dy/dist * force;
+                        b.vx -= dx/dist * force; b.vy -= dy/dist * force;
+                    }
+                    // Apply velocity with damping and clamp to canvas
+                    for (const n of list) {
+                        n.x += n.vx * 0.3; n.y += n.vy * 0.3;
+                        n.vx *= 0.8; n.vy *= 0.8;
+                        n.x = Math.max(PAD, Math.min(width - PAD, n.x));
+                        n.y = Math.max(PAD, Math.min(height - PAD, n.y));
+                    }
+                }
             }
 
-            // Simple force-directed layout with iterative relaxation
-            const nodeMap = {};
-            const pad = 30;
-            const layoutNodes = nodes.map((n, i) => {
-                const angle = (2 * Math.PI * i) / nodes.length;
-                const r = Math.min(canvas.width - pad*2, canvas.height - pad*2) * 0.35;
-                const pos = {
-                    id: n.node_id,
-                    name: n.short_name || n.long_name || n.node_id,
-                    x: canvas.width/2 + r * Math.cos(angle) + (Math.random()-0.5)*20,
-                    y: canvas.height/2 + r * Math.sin(angle) + (Math.random()-0.5)*20,
-                    vx: 0, vy: 0
-                };
-                nodeMap[n.node_id] = pos;
-                return pos;
-            });
+            function draw() {
+                ctx.clearRect(0, 0, width, height);
+                if (nodes.size === 0 || edges.length === 0) {
+                    ctx.fillStyle = '#555';
+                    ctx.font = '12px sans-serif';
+                    ctx.textAlign = 'center';
+                    ctx.fillText(edges.length === 0 ? 'No link data — run traceroutes to build topology' : 'No topology data',
+                        width/2, height/2);
+                    return;
+                }
 
-            // Run force simulation (simple spring model, 60 iterations)
-            for (let iter = 0; iter < 60; iter++) {
-                // Repulsion between all nodes
-                for (let i = 0; i < layoutNodes.length; i++) {
-                    for (let j = i+1; j < layoutNodes.length; j++) {
-                        const a = layoutNodes[i], b = layoutNodes[j];
-                        let dx = b.x - a.x, dy = b.y - a.y;
-                        let dist = Math.sqrt(dx*dx + dy*dy) || 1;
-                        let force = 800 / (dist * dist);
-                        a.vx -= dx/dist * force; a.vy -= dy/dist * force;
-                        b.vx += dx/dist * force; b.vy += dy/dist * force;
+                // Draw edges
+                for (const [fromId, toId, snr] of edges) {
+                    const from = nodes.get(fromId), to = nodes.get(toId);
+                    if (!from || !to) continue;
+                    let color = 'rgba(0,212,255,0.4)';
+                    if (snr !== null) {
+                        if (snr > 5) color = 'rgba(0,255,136,0.6)';
+                        else if (snr > 0) color = 'rgba(255,165,2,0.6)';
+                        else color = 'rgba(255,71,87,0.6)';
                     }
+                    ctx.beginPath();
+                    ctx.moveTo(from.x, from.y);
+                    ctx.lineTo(to.x, to.y);
+                    ctx.strokeStyle = color;
+                    ctx.lineWidth = 1.5;
+                    ctx.stroke();
                 }
-                // Attraction along edges
-                for (const edge of edges) {
-                    const a = nodeMap[edge.node_id], b = nodeMap[edge.neighbor_id];
-                    if (!a || !b) continue;
-                    let dx = b.x - a.x, dy = b.y - a.y;
-                    let dist = Math.sqrt(dx*dx + dy*dy) || 1;
-                    let force = (dist - 60) * 0.05;
-                    a.vx += dx/dist * force; a.vy += dy/dist * force;
-                    b.vx -= dx/dist * force; b.vy -= dy/dist * force;
-                }
-                // Apply velocity with damping and clamp to canvas
-                for (const n of layoutNodes) {
-                    n.x += n.vx * 0.3; n.y += n.vy * 0.3;
-                    n.vx *= 0.8; n.vy *= 0.8;
-                    n.x = Math.max(pad, Math.min(canvas.width - pad, n.x));
-                    n.y = Math.max(pad, Math.min(canvas.height - pad, n.y));
+
+                // Draw nodes
+                ctx.font = '8px sans-serif';
+                ctx.textAlign = 'center';
+                for (const node of nodes.values()) {
+                    ctx.beginPath();
+                    ctx.arc(node.x, node.y, 5, 0, Math.PI * 2);
+                    ctx.fillStyle = '#00d4ff';
+                    ctx.fill();
+                    ctx.strokeStyle = 'rgba(255,255,255,0.7)';
+                    ctx.lineWidth = 1;
+                    ctx.stroke();
+
+                    ctx.fillStyle = '#aaa';
+                    ctx.fillText(node.name, node.x, node.y + 14);
                 }
             }
 
-            // Draw edges
-            for (const edge of edges) {
-                const from = nodeMap[edge.node_id], to = nodeMap[edge.neighbor_id];
-                if (!from || !to) continue;
-                const snr = edge.snr;
-                let color = 'rgba(0,212,255,0.4)';
-                if (snr !== null && snr !== undefined) {
-                    if (snr > 5) color = 'rgba(0,255,136,0.6)';
-                    else if (snr > 0) color = 'rgba(255,165,2,0.6)';
-                    else color = 'rgba(255,71,87,0.6)';
+            self.onmessage = (e) => {
+                const msg = e.data;
+                if (msg.cmd === 'init') {
+                    canvas = msg.canvas;
+                    ctx = canvas.getContext('2d');
+                    return;
+                }
+                if (msg.width !== width || msg.height !== height) resize(msg.width, msg.height);
+                for (const id of msg.removed) nodes.delete(id);
+                for (const {id, name} of msg.added) {
+                    const node = nodes.get(id);
+                    if (node) node.name = name;
+                    else nodes.set(id, {id, name, x: 0, y: 0, vx: 0, vy: 0, placed: false});
+                }
+                if (msg.edges) edges = msg.edges;
+                if (msg.added.length || msg.removed.length || msg.edges) layout();
+                draw();
+            };`;
+        let topologyWorker = null;
+        const topologyNames = new Map();  // node id -> label the worker has
+        let topologyEdgesKey = null;
+        let topologySize = '';
+
+        function getTopologyWorker(canvas) {
+            if (topologyWorker) return topologyWorker;
+            if (canvas.transferControlToOffscreen) {
+                try {
+                    const worker = new Worker(URL.createObjectURL(new Blob([TOPOLOGY_WORKER_SRC], {type: 'text/javascript'})));
+                    const offscreen = canvas.transferControlToOffscreen();
+                    worker.postMessage({cmd: 'init', canvas: offscreen}, [offscreen]);
+                    return topologyWorker = worker;
+                } catch (e) {
+                    console.warn('[TOPOLOGY] Worker unavailable, drawing on the main thread:', e);
                 }
-                ctx.beginPath();
-                ctx.moveTo(from.x, from.y);
-                ctx.lineTo(to.x, to.y);
-                ctx.strokeStyle = color;
-                ctx.lineWidth = 1.5;
-                ctx.stroke();
             }
+            const local = {};
+            new Function('self', TOPOLOGY_WORKER_SRC)(local);
+            local.onmessage({data: {cmd: 'init', canvas}});
+            return topologyWorker = {postMessage: (data) => local.onmessage({data})};
+        }
 
-            // Draw nodes
-            for (const node of layoutNodes) {
-                ctx.beginPath();
-                ctx.arc(node.x, node.y, 5, 0, Math.PI * 2);
-                ctx.fillStyle = '#00d4ff';
-                ctx.fill();
-                ctx.strokeStyle = 'rgba(255,255,255,0.7)';
-                ctx.lineWidth = 1;
-                ctx.stroke();
+        function renderTopology(data) {
+            const canvas = document.getElementById('topology-canvas');
+            if (!canvas) return;
+            const nodes = data.nodes || [];
+            const edges = data.edges || [];
+            setText('topology-count', nodes.length + ' nodes, ' + edges.length + ' links');
 
-                ctx.fillStyle = '#aaa';
-                ctx.font = '8px sans-serif';
-                ctx.textAlign = 'center';
-                ctx.fillText(node.name, node.x, node.y + 14);
+            const seen = new Set();
+            const added = [];
+            for (const n of nodes) {
+                const name = n.short_name || n.long_name || n.node_id;
+                seen.add(n.node_id);
+                if (topologyNames.get(n.node_id) !== name) {
+                    topologyNames.set(n.node_id, name);
+                    added.push({id: n.node_id, name});
+                }
+            }
+            const removed = [];
+            for (const id of topologyNames.keys()) {
+                if (!seen.has(id)) removed.push(id);
             }
+            for (const id of removed) topologyNames.delete(id);
+            const edgeList = edges.map(e => [e.node_id, e.neighbor_id, e.snr ?? null]);
+            const edgesKey = JSON.stringify(edgeList);
+            const edgesChanged = edgesKey !== topologyEdgesKey;
+            topologyEdgesKey = edgesKey;
+
+            // Size from layout read in the read phase, post in the write phase
+            measure(() => {
+                const width = canvas.offsetWidth;
+                const height = Math.max(canvas.offsetHeight, 250);
+                const size = width + 'x' + height;
+                if (!added.length && !removed.length && !edgesChanged && size === topologySize) return;
+                topologySize = size;
+                mutate(() => getTopologyWorker(canvas).postMessage({
+                    cmd: 'graph', width, height, added, removed,
+                    edges: edgesChanged ? edgeList : null,
+                }));
+            });
         }
 
         function renderTraceroutes(data) {
             const container = document.getElementById('traceroutes-list');
             if (!data || !Array.isArray(data) || data.length === 0) {
-                container.innerHTML = '<div style="color:#555;font-size:0.8em">No traceroute data — request traceroutes from the map</div>';
+                renderRows(container, ['<div style="color:#555;font-size:0.8em">No traceroute data — request traceroutes from the map</div>']);
                 return;
             }
 
@@ -3865,7 +5373,7 @@ DASHBOARD_HTML = """
                 }
             }
 
-            let html = '';
+            const rows = [];
             for (const tr of unique.slice(0, 10)) {
                 const parts = [nodeName(tr.from_id)];
                 const route = tr.route || [];
@@ -3879,73 +5387,73 @@ DASHBOARD_HTML = """
                     ? tr.snr_towards.map(s => (s/4).toFixed(1) + 'dB').join(', ')
                     : '';
 
-                html += `<div class="traceroute-item">
+                rows.push(`<div class="traceroute-item">
                     <div class="traceroute-route">${escapeHtml(routeStr)}</div>
                     <div><span class="traceroute-time">${formatTime(tr.timestamp)}</span>
                     ${snrStr ? `<span class="traceroute-snr"> | ${snrStr}</span>` : ''}</div>
-                </div>`;
+                </div>`);
             }
-            container.innerHTML = html;
+            renderRows(container, rows);
         }
 
         function renderSFStats(data) {
             const container = document.getElementById('sf-stats-list');
             if (!data || data.length === 0) {
-                container.innerHTML = '<div style="color:#555;font-size:0.8em">No store & forward data</div>';
+                renderRows(container, ['<div style="color:#555;font-size:0.8em">No store & forward data</div>']);
                 return;
             }
 
-            let html = '';
+            const rows = [];
             for (const sf of data) {
-                html += `<div class="sf-item">
+                rows.push(`<div class="sf-item">
                     <span class="sf-node">${escapeHtml(sf.from_id || '?')}</span>
                     <span class="sf-stat">${sf.messages_saved || 0}/${sf.messages_max || '?'} msgs</span>
                     <span class="sf-stat">${sf.requests || 0} reqs</span>
-                </div>`;
+                </div>`);
             }
-            container.innerHTML = html;
+            renderRows(container, rows);
         }
 
         function renderAlerts(data) {
             const container = document.getElementById('alerts-list');
             if (!data || data.length === 0) {
-                container.innerHTML = '<div style="color:#555;font-size:0.8em">No sensor alerts</div>';
+                renderRows(container, ['<div style="color:#555;font-size:0.8em">No sensor alerts</div>']);
                 return;
             }
 
-            let html = '';
+            const rows = [];
             for (const alert of data.slice(0, 8)) {
-                html += `<div class="alert-item">
+                rows.push(`<div class="alert-item">
                     <div class="alert-text">${escapeHtml(alert.alert_text || '')}</div>
                     <div>
                         <span class="alert-from">${escapeHtml(alert.sensor_name || alert.from_id || '?')}</span>
                         <span class="alert-time"> | ${formatTime(alert.timestamp)}</span>
                     </div>
-                </div>`;
+                </div>`);
             }
-            container.innerHTML = html;
+            renderRows(container, rows);
         }
 
         function renderPaxcounter(data) {
             const container = document.getElementById('pax-list');
             if (!data || data.length === 0) {
-                container.innerHTML = '<div style="color:#555;font-size:0.8em">No paxcounter data</div>';
+                renderRows(container, ['<div style="color:#555;font-size:0.8em">No paxcounter data</div>']);
                 return;
             }
 
-            let html = '';
+            const rows = [];
             for (const pax of data.slice(0, 10)) {
-                html += `<div class="pax-item">
+                rows.push(`<div class="pax-item">
                     <span>${escapeHtml(pax.node_id || '?')}</span>
                     <span class="pax-counts">WiFi: ${pax.wifi_count || 0} | BLE: ${pax.ble_count || 0}</span>
                     <span style="color:#555;font-size:0.85em">${formatTime(pax.timestamp)}</span>
-                </div>`;
+                </div>`);
             }
-            container.innerHTML = html;
+            renderRows(container, rows);
         }
 
         // ==================== WAYPOINT MARKERS ====================
-        let waypointMarkers = [];
+        let waypointLayer = null;  // one group, added and removed as a unit
 
         function createWaypointIcon() {
             return L.divIcon({
@@ -3969,15 +5477,15 @@ DASHBOARD_HTML = """
                 const waypoints = await resp.json();
 
                 // Clear old markers
-                waypointMarkers.forEach(m => map.removeLayer(m));
-                waypointMarkers = [];
+                if (waypointLayer) map.removeLayer(waypointLayer);
+                const markers = [];
 
                 for (const wp of waypoints) {
                     if (!wp.latitude || !wp.longitude) continue;
 
                     const marker = L.marker([wp.latitude, wp.longitude], {
                         icon: createWaypointIcon()
-                    }).addTo(map);
+                    });
 
                     const expireStr = wp.expire ? new Date(wp.expire * 1000).toLocaleString() : 'Never';
                     marker.bindPopup(`<div class="node-popup">
@@ -3993,8 +5501,9 @@ DASHBOARD_HTML = """
                         </div>
                     </div>`);
 
-                    waypointMarkers.push(marker);
+                    markers.push(marker);
                 }
+                waypointLayer = L.layerGroup(markers).addTo(map);
             } catch (e) {
                 console.error('[WPT] Failed to load waypoints:', e);
             }
@@ -4002,7 +5511,7 @@ DASHBOARD_HTML = """
 
         // ==================== TRACEROUTE ROUTE LINES ====================
         let trailsEnabled = false;
-        let trailPolylines = [];
+        let trailLayer = null;
         const trailColors = ['#00d4ff', '#00ff88', '#ffa502', '#ff4757', '#a55eea', '#2ed573', '#ff6348', '#1e90ff'];
 
         function toggleTrails() {
@@ -4034,8 +5543,8 @@ DASHBOARD_HTML = """
         }
 
         function clearTrails() {
-            trailPolylines.forEach(p => map.removeLayer(p));
-            trailPolylines = [];
+            if (trailLayer) map.removeLayer(trailLayer);
+            trailLayer = null;
         }
 
         // Convert numeric hop ID to !hex node_id format
@@ -4071,6 +5580,8 @@ DASHBOARD_HTML = """
                     }
                 }
 
+                // Built off-map, then attached to the map in one step
+                const layers = [];
                 let colorIdx = 0;
                 for (const tr of uniqueTraces) {
                     // Build ordered chain: from_id → route hops → to_id
@@ -4103,96 +5614,70 @@ DASHBOARD_HTML = """
                             [[points[i-1].lat, points[i-1].lng], [points[i].lat, points[i].lng]],
                             { color: color, weight: 3, opacity: opacity,
                               lineCap: 'round', lineJoin: 'round', dashArray: '8 4' }
-                        ).addTo(map);
+                        );
                         seg.bindTooltip(
                             `${points[i-1].name} → ${points[i].name}`,
                             { sticky: true, opacity: 0.85 }
                         );
-                        trailPolylines.push(seg);
+                        layers.push(seg);
                     }
 
                     // Small circle at each hop to show relay nodes
                     for (let i = 1; i < points.length - 1; i++) {
                         const dot = L.circleMarker([points[i].lat, points[i].lng], {
                             radius: 4, color: color, fillColor: color, fillOpacity: 0.8, weight: 1
-                        }).addTo(map);
+                        });
                         dot.bindTooltip(points[i].name + ' (relay)', { permanent: false });
-                        trailPolylines.push(dot);
+                        layers.push(dot);
                     }
                 }
+                // Trails may have been toggled off or reloaded while this fetch was in flight
+                clearTrails();
+                if (trailsEnabled) trailLayer = L.layerGroup(layers).addTo(map);
             } catch (e) {
                 console.error('[ROUTES] Failed to load:', e);
             }
         }
 
         // ==================== SIGNAL SPARKLINE IN POPUPS ====================
-        function buildSparklineSVG(data) {
-            if (!data || data.length === 0) return '';
-
+        function drawSparkline(canvas, values) {
             const w = 150, h = 30;
-            const values = data.map(d => d.avg_snr).filter(v => v !== null);
-            if (values.length === 0) return '';
+            const dpr = window.devicePixelRatio || 1;
+            canvas.width = w * dpr;
+            canvas.height = h * dpr;
+            canvas.style.width = w + 'px';
+            canvas.style.height = h + 'px';
+            const ctx = canvas.getContext('2d');
+            ctx.scale(dpr, dpr);
 
             const min = Math.min(...values);
             const max = Math.max(...values);
             const range = max - min || 1;
 
-            let points = '';
+            ctx.beginPath();
             for (let i = 0; i < values.length; i++) {
                 const x = (i / (values.length - 1 || 1)) * w;
                 const y = h - ((values[i] - min) / range) * (h - 4) - 2;
-                points += `${x},${y} `;
+                if (i === 0) ctx.moveTo(x, y);
+                else ctx.lineTo(x, y);
             }
-
-            return `<div class="sparkline-container">
-                <div class="sparkline-label">24h SNR trend</div>
-                <svg width="${w}" height="${h}" viewBox="0 0 ${w} ${h}">
-                    <polyline points="${points}" fill="none" stroke="#00d4ff" stroke-width="1.5"/>
-                </svg>
-            </div>`;
+            ctx.strokeStyle = '#00d4ff';
+            ctx.lineWidth = 1.5;
+            ctx.stroke();
         }
 
-        // Enhanced popup with sparkline - override updateMap node popup
-        const originalUpdateMap = updateMap;
-        updateMap = function(nodes, clearExisting) {
-            originalUpdateMap(nodes, clearExisting);
-
-            // Add sparkline fetch on popup open for each marker
-            for (const nodeId in nodeMarkers) {
-                const marker = nodeMarkers[nodeId];
-                marker.off('popupopen');
-                marker.on('popupopen', async function() {
-                    try {
-                        const resp = await fetch('/api/signal-trends?node_id=' + encodeURIComponent(nodeId) + '&hours=24');
-                        const trends = await resp.json();
-                        if (trends && trends.length > 1) {
-                            const sparkline = buildSparklineSVG(trends);
-                            if (sparkline) {
-                                const popup = marker.getPopup();
-                                const content = popup.getContent();
-                                if (!content.includes('sparkline-container')) {
-                                    popup.setContent(content.replace('</div></div></div>', '</div>' + sparkline + '</div></div>'));
-                                }
-                            }
-                        }
-                    } catch (e) {
-                        // Silently fail - sparkline is optional
-                    }
-                });
-            }
-        };
-
         // ==================== ENHANCED STATS ====================
         const originalUpdateEnhancedStats = updateEnhancedStats;
         updateEnhancedStats = function(data) {
             originalUpdateEnhancedStats(data);
 
             // Update extended metric cards
-            const el = (id) => document.getElementById(id);
-            if (el('stat-waypoints')) el('stat-waypoints').textContent = data.waypoint_records || 0;
-            if (el('stat-traceroutes')) el('stat-traceroutes').textContent = data.traceroute_records || 0;
-            if (el('stat-rangetests')) el('stat-rangetests').textContent = data.range_test_records || 0;
-            if (el('stat-alerts')) el('stat-alerts').textContent = data.detection_alerts || 0;
+            mutate(() => {
+                patchText(els.statWaypoints, data.waypoint_records || 0);
+                patchText(els.statTraceroutes, data.traceroute_records || 0);
+                patchText(els.statRangetests, data.range_test_records || 0);
+                patchText(els.statAlerts, data.detection_alerts || 0);
+            });
         };
 
         // ==================== ENHANCED REFRESH ====================
@@ -4202,7 +5687,7 @@ DASHBOARD_HTML = """
             await originalRefreshData();
             loadWaypoints();
             if (trailsEnabled) loadTrails();
-            if (networkTabActive) refreshNetworkTab();
+            if (activeTab === 'network') refreshNetworkTab();
         };
 
         // Initial load
@@ -4214,109 +5699,228 @@ DASHBOARD_HTML = """
 """
 
 
+def _precompress(body):
+    """Compress a static body once, returning {content-encoding: bytes}."""
+    variants = {'gzip': gzip.compress(body, compresslevel=9)}
+    if brotli:
+        variants['br'] = brotli.compress(body, quality=11)
+    return variants
+
+
+def _encoded_response(body, variants, mimetype):
+    """Serve the best precompressed variant the client accepts."""
+    accepted = request.accept_encodings
+    for encoding in ('br', 'gzip'):
+        if encoding in variants and encoding in accepted:
+            resp = Response(variants[encoding], mimetype=mimetype)
+            resp.headers['Content-Encoding'] = encoding
+            break
+    else:
+        resp = Response(body, mimetype=mimetype)
+    resp.vary.add('Accept-Encoding')
+    return resp
+
+
+_HTML_COMMENT = re.compile(r'<!--.*?-->', re.S)
+_STYLE_BLOCK = re.compile(r'<style>.*?</style>', re.S)
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_SCRIPT_BLOCK = re.compile(r'<script>.*?</script>', re.S)
+
+
+def _strip_js_comment_lines(script):
+    """Drop whole-line // comments, leaving lines inside `template literals`."""
+    kept = []
+    in_template = False
+    for line in script.split('\n'):
+        if not in_template and line.lstrip().startswith('//'):
+            continue
+        if (line.count('`') - line.count('\\`')) % 2:
+            in_template = not in_template
+        kept.append(line)
+    return '\n'.join(kept)
+
+
+def _minify_html(html):
+    """Strip comments, indentation and blank lines from the dashboard page.
+
+    Line breaks are kept, so JS semantic newlines and the whitespace between
+    inline elements survive; nothing in the page uses white-space: pre.
+    """
+    html = _HTML_COMMENT.sub('', html)
+    html = _STYLE_BLOCK.sub(lambda m: _CSS_COMMENT.sub('', m.group(0)), html)
+    html = _SCRIPT_BLOCK.sub(lambda m: _strip_js_comment_lines(m.group(0)), html)
+    return '\n'.join(line.strip() for line in html.split('\n') if not line.isspace() and line)
+
+
+# The page has no per-request template variables, so render, minify and
+# compress it once
+_DASHBOARD_PAGE = _minify_html(
+    app.jinja_env.from_string(DASHBOARD_HTML).render(vendor=vendor_urls(),
+                                                      image_versions=image_versions(),
+                                                      msgpack=bool(msgpack))
+).encode('utf-8')
+_DASHBOARD_PAGE_VARIANTS = _precompress(_DASHBOARD_PAGE)
+
+
 @app.route('/')
 def index():
     """Serve the dashboard page."""
-    return render_template_string(DASHBOARD_HTML)
+    return _encoded_response(_DASHBOARD_PAGE, _DASHBOARD_PAGE_VARIANTS, 'text/html')
+
+
+@app.route('/favicon.png')
+@app.route('/logo.png')
+def image_asset():
+    """Serve the favicon/logo with long-lived caching (URLs carry a content hash)."""
+    name = request.path.strip('/').rsplit('.', 1)[0]
+    resp = Response(IMAGES[name], mimetype='image/png')
+    resp.cache_control.public = True
+    resp.cache_control.max_age = VENDOR_MAX_AGE
+    resp.cache_control.immutable = True
+    return resp
+
+
+@app.route('/static/vendor/<path:filename>')
+def vendor_asset(filename):
+    """Serve a vendored library, using a precompressed sibling when accepted."""
+    mimetype = mimetypes.guess_type(filename)[0]
+    accepted = request.accept_encodings
+    for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+        if encoding in accepted and os.path.isfile(os.path.join(VENDOR_DIR, filename + suffix)):
+            resp = send_from_directory(VENDOR_DIR, filename + suffix,
+                                       mimetype=mimetype, max_age=VENDOR_MAX_AGE)
+            resp.headers['Content-Encoding'] = encoding
+            break
+    else:
+        resp = send_from_directory(VENDOR_DIR, filename, mimetype=mimetype, max_age=VENDOR_MAX_AGE)
+    resp.cache_control.immutable = True
+    resp.vary.add('Accept-Encoding')
+    return resp
+
+
+def fetch_vendor_assets():
+    """Download the pinned front-end libraries into static/vendor/."""
+    import requests
+
+    for name, url in VENDOR_ASSETS.items():
+        path = os.path.join(VENDOR_DIR, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        resp = requests.get(url, timeout=30)
+        resp.raise_for_status()
+        body = resp.content
+        with open(path, 'wb') as f:
+            f.write(body)
+        # Images are already compressed; text assets get precompressed siblings
+        if not name.endswith('.png'):
+            for encoding, data in _precompress(body).items():
+                with open(path + ('.br' if encoding == 'br' else '.gz'), 'wb') as f:
+                    f.write(data)
+        print(f"  ✓ {name} ({len(body):,} bytes)")
 
 
 @app.route('/api/stats')
+@conditional_get
 def api_stats():
     """Get overall statistics."""
     global db
     if not db:
-        db = MeshDatabase()
+        db = MeshDatabase(CFG.db_path)
+
+    return jsonify(_cached_query(('stats',), _query_stats))
 
+
+def _query_stats():
     stats = db.get_stats()
 
     # Get packet type counts
     try:
-        conn = db._get_conn()
-        cursor = conn.execute('''
-            SELECT packet_type, COUNT(*) as count
-            FROM raw_packets
-            GROUP BY packet_type
-            ORDER BY count DESC
-        ''')
-        packet_types = {row[0]: row[1] for row in cursor.fetchall()}
-        stats['packet_types'] = packet_types
+        stats['packet_types'] = db.get_packet_type_counts()
     except Exception:
         stats['packet_types'] = {}
 
-    return jsonify(stats)
+    return stats
+
+
+# Range buttons -> SQL datetime modifier for messages, and hours for nodes
+MESSAGE_RANGES = {'30m': '-30 minutes', '1h': '-1 hours', '6h': '-6 hours', '24h': '-24 hours'}
+NODE_RANGE_HOURS = {'1h': 1, '24h': 24, '7d': 168}
 
 
 @app.route('/api/messages')
+@conditional_get
 def api_messages():
     """Get recent messages."""
     global db
     if not db:
-        db = MeshDatabase()
+        db = MeshDatabase(CFG.db_path)
 
     limit = request.args.get('limit', 50, type=int)
-    range_param = request.args.get('range', 'all')
-    range_map = {'30m': '-30 minutes', '1h': '-1 hours', '6h': '-6 hours', '24h': '-24 hours'}
-    time_filter = range_map.get(range_param)
+    time_filter = MESSAGE_RANGES.get(request.args.get('range', 'all'))
+
+    return jsonify(_cached_query(('messages', limit, time_filter),
+                                 lambda: _query_messages(limit, time_filter)))
 
+
+def _query_messages(limit, time_filter, after_id=None, after_sent_id=None):
+    """Newest received and sent messages merged, newest first. after_id and
+    after_sent_id keep only rows past those messages/sent_messages ids."""
     messages = []
     try:
-        conn = db._get_conn()
+        conn = db._get_read_conn()
 
         # Get received messages (exclude assistant entries — those are in sent_messages)
+        where, params = ["from_id != 'assistant'"], []
         if time_filter:
-            cursor = conn.execute('''
-                SELECT timestamp, from_id, from_name, to_id, text, snr, rssi, channel
-                FROM messages
-                WHERE from_id != 'assistant'
-                  AND timestamp > datetime('now', 'localtime', ?)
-                ORDER BY timestamp DESC
-                LIMIT ?
-            ''', (time_filter, limit))
-        else:
-            cursor = conn.execute('''
-                SELECT timestamp, from_id, from_name, to_id, text, snr, rssi, channel
-                FROM messages
-                WHERE from_id != 'assistant'
-                ORDER BY timestamp DESC
-                LIMIT ?
-            ''', (limit,))
+            where.append("timestamp > datetime('now', 'localtime', ?)")
+            params.append(time_filter)
+        if after_id is not None:
+            where.append('id > ?')
+            params.append(after_id)
+        cursor = conn.execute(f'''
+            SELECT id, timestamp, from_id, from_name, to_id, text, snr, rssi, channel
+            FROM messages
+            WHERE {' AND '.join(where)}
+            ORDER BY timestamp DESC
+            LIMIT ?
+        ''', (*params, limit))
 
         for row in cursor.fetchall():
             messages.append({
-                'timestamp': row[0],
-                'from_id': row[1],
-                'from_name': row[2],
-                'to_id': row[3],
-                'text': row[4],
-                'snr': row[5],
-                'rssi': row[6],
-                'channel': row[7],
+                'id': row[0],
+                'timestamp': row[1],
+                'from_id': row[2],
+                'from_name': row[3],
+                'to_id': row[4],
+                'text': row[5],
+                'snr': row[6],
+                'rssi': row[7],
+                'channel': row[8],
                 'direction': 'received'
             })
 
         # Get sent messages
+        where, params = [], []
         if time_filter:
-            cursor = conn.execute('''
-                SELECT timestamp, to_id, text, channel
-                FROM sent_messages
-                WHERE timestamp > datetime('now', 'localtime', ?)
-                ORDER BY timestamp DESC
-                LIMIT ?
-            ''', (time_filter, limit))
-        else:
-            cursor = conn.execute('''
-                SELECT timestamp, to_id, text, channel
-                FROM sent_messages
-                ORDER BY timestamp DESC
-                LIMIT ?
-            ''', (limit,))
+            where.append("timestamp > datetime('now', 'localtime', ?)")
+            params.append(time_filter)
+        if after_sent_id is not None:
+            where.append('id > ?')
+            params.append(after_sent_id)
+        cursor = conn.execute(f'''
+            SELECT id, timestamp, to_id, text, channel
+            FROM sent_messages
+            {'WHERE ' + ' AND '.join(where) if where else ''}
+            ORDER BY timestamp DESC
+            LIMIT ?
+        ''', (*params, limit))
 
         for row in cursor.fetchall():
             messages.append({
-                'timestamp': row[0],
-                'to_id': row[1],
-                'text': row[2],
-                'channel': row[3],
+                'id': row[0],
+                'timestamp': row[1],
+                'to_id': row[2],
+                'text': row[3],
+                'channel': row[4],
                 'direction': 'sent'
             })
 
@@ -4327,19 +5931,24 @@ def api_messages():
     except Exception as e:
         print(f"Error getting messages: {e}")
 
-    return jsonify(messages)
+    return messages
 
 
 @app.route('/api/dm-conversations')
+@conditional_get
 def api_dm_conversations():
     """Get DM conversations grouped by partner node."""
     global db
     if not db:
-        db = MeshDatabase()
+        db = MeshDatabase(CFG.db_path)
+
+    return jsonify(_offload(_query_dm_conversations))
 
+
+def _query_dm_conversations():
     conversations = []
     try:
-        conn = db._get_conn()
+        conn = db._get_read_conn()
 
         # Get our node ID (the bot) from sent_messages — find the most common to_id that's not ^all
         # Actually, DMs are: received messages where to_id is NOT ^all/broadcast,
@@ -4407,23 +6016,28 @@ def api_dm_conversations():
     except Exception as e:
         print(f"Error getting DM conversations: {e}")
 
-    return jsonify(conversations)
+    return conversations
 
 
 @app.route('/api/dm-thread')
+@conditional_get
 def api_dm_thread():
     """Get DM thread with a specific node."""
     global db
     if not db:
-        db = MeshDatabase()
+        db = MeshDatabase(CFG.db_path)
 
     node_id = request.args.get('node_id')
     if not node_id:
         return jsonify({'error': 'node_id required'}), 400
 
+    return jsonify(_offload(_query_dm_thread, node_id))
+
+
+def _query_dm_thread(node_id):
     messages = []
     try:
-        conn = db._get_conn()
+        conn = db._get_read_conn()
 
         # Received from this node (DMs only)
         cursor = conn.execute('''
@@ -4458,51 +6072,76 @@ def api_dm_thread():
     except Exception as e:
         print(f"Error getting DM thread: {e}")
 
-    return jsonify(messages)
+    return messages
 
 
 @app.route('/api/nodes')
+@conditional_get
 def api_nodes():
     """Get all known nodes."""
     global db
     if not db:
-        db = MeshDatabase()
+        db = MeshDatabase(CFG.db_path)
+
+    filter_hours = NODE_RANGE_HOURS.get(request.args.get('range', 'all'))
+
+    now_ts = g.now_ts
+    return jsonify(_cached_query(('nodes', filter_hours), lambda: _query_nodes(filter_hours, now_ts)))
+
+
+def _query_nodes(filter_hours, now_ts):
+    cutoff = int(now_ts) - (filter_hours * 3600) if filter_hours else None
+    return _query_nodes_heard_after(cutoff)
 
-    range_param = request.args.get('range', 'all')
-    hours_map = {'1h': 1, '24h': 24, '7d': 168}
-    filter_hours = hours_map.get(range_param)
 
+def _latest_node_heard():
+    """Newest last_heard, and the ids of the nodes heard in that second."""
+    conn = db._get_read_conn()
+    latest = conn.execute('SELECT MAX(last_heard) FROM nodes').fetchone()[0] or 0
+    cursor = conn.execute('SELECT node_id FROM nodes WHERE last_heard = ?', (latest,))
+    return latest, {row[0] for row in cursor.fetchall()}
+
+
+def _advance_node_cursor(nodes, cursor, seen):
+    """Split rows read with last_heard >= cursor into the ones not pushed
+    yet, plus the next (cursor, seen) pair.
+
+    last_heard only has whole seconds, so the cursor second is read again
+    each time and seen holds the node ids already pushed in it.
+    """
+    fresh = [n for n in nodes if n['last_heard'] != cursor or n['node_id'] not in seen]
+    if not fresh:
+        return fresh, cursor, seen
+    # Newest first; a node clock running ahead mustn't park the cursor in the future
+    next_cursor = min(fresh[0]['last_heard'], int(time.time()))
+    if next_cursor != cursor:
+        seen = set()
+    seen = seen | {n['node_id'] for n in fresh if n['last_heard'] == next_cursor}
+    return fresh, next_cursor, seen
+
+
+def _query_nodes_heard_after(cutoff, inclusive=False):
+    """Node rows for the list and map, newest first; every node when cutoff
+    is None, else only those with last_heard after it (or at it, if
+    inclusive)."""
     nodes = []
     try:
-        conn = db._get_conn()
-        if filter_hours:
-            cutoff = int(time.time()) - (filter_hours * 3600)
-            cursor = conn.execute('''
-                SELECT n.node_id, n.long_name, n.short_name, n.hw_model, n.last_heard, n.snr,
-                       n.battery_level, n.latitude, n.longitude, n.hops_away,
-                       n.role, n.uptime_seconds, n.channel_utilization, n.air_util_tx,
-                       n.voltage, n.times_heard, n.via_mqtt, n.first_seen,
-                       (SELECT m.hop_start - m.hop_limit
-                        FROM messages m
-                        WHERE m.from_id = n.node_id AND m.hop_start > 0
-                        ORDER BY m.timestamp DESC LIMIT 1) as hops_used
-                FROM nodes n
-                WHERE n.last_heard > ?
-                ORDER BY n.last_heard DESC
-            ''', (cutoff,))
-        else:
-            cursor = conn.execute('''
-                SELECT n.node_id, n.long_name, n.short_name, n.hw_model, n.last_heard, n.snr,
-                       n.battery_level, n.latitude, n.longitude, n.hops_away,
-                       n.role, n.uptime_seconds, n.channel_utilization, n.air_util_tx,
-                       n.voltage, n.times_heard, n.via_mqtt, n.first_seen,
-                       (SELECT m.hop_start - m.hop_limit
-                        FROM messages m
-                        WHERE m.from_id = n.node_id AND m.hop_start > 0
-                        ORDER BY m.timestamp DESC LIMIT 1) as hops_used
-                FROM nodes n
-                ORDER BY n.last_heard DESC
-            ''')
+        conn = db._get_read_conn()
+        op = '>=' if inclusive else '>'
+        where = f'WHERE n.last_heard {op} ?' if cutoff is not None else ''
+        cursor = conn.execute(f'''
+            SELECT n.node_id, n.long_name, n.short_name, n.hw_model, n.last_heard, n.snr,
+                   n.battery_level, n.latitude, n.longitude, n.hops_away,
+                   n.role, n.uptime_seconds, n.channel_utilization, n.air_util_tx,
+                   n.voltage, n.times_heard, n.via_mqtt, n.first_seen,
+                   (SELECT m.hop_start - m.hop_limit
+                    FROM messages m
+                    WHERE m.from_id = n.node_id AND m.hop_start > 0
+                    ORDER BY m.timestamp DESC LIMIT 1) as hops_used
+            FROM nodes n
+            {where}
+            ORDER BY n.last_heard DESC
+        ''', (cutoff,) if cutoff is not None else ())
 
         for row in cursor.fetchall():
             nodes.append({
@@ -4529,19 +6168,24 @@ def api_nodes():
     except Exception as e:
         print(f"Error getting nodes: {e}")
 
-    return jsonify(nodes)
+    return nodes
 
 
 @app.route('/api/activity')
+@conditional_get
 def api_activity():
     """Get hourly activity data for chart."""
     global db
     if not db:
-        db = MeshDatabase()
+        db = MeshDatabase(CFG.db_path)
+
+    return jsonify(_offload(_query_activity))
 
+
+def _query_activity():
     activity = []
     try:
-        conn = db._get_conn()
+        conn = db._get_read_conn()
 
         # Get message counts per hour for last 24 hours
         cursor = conn.execute('''
@@ -4562,7 +6206,7 @@ def api_activity():
     except Exception as e:
         print(f"Error getting activity: {e}")
 
-    return jsonify(activity)
+    return activity
 
 
 @app.route('/api/check-updates')
@@ -4570,10 +6214,10 @@ def api_check_updates():
     """Check if database has been updated since given timestamp."""
     global db
     if not db:
-        db = MeshDatabase()
+        db = MeshDatabase(CFG.db_path)
 
     since = request.args.get('since', 0, type=float)
-    last_update = db.get_last_modified()
+    last_update = _offload(db.get_last_modified)
 
     return jsonify({
         'has_updates': last_update > since,
@@ -4586,7 +6230,7 @@ def api_send():
     """Queue a message to be sent via the bridge."""
     global db
     if not db:
-        db = MeshDatabase()
+        db = MeshDatabase(CFG.db_path)
 
     try:
         data = request.get_json()
@@ -4621,81 +6265,120 @@ def api_send():
 
 
 @app.route('/api/time-range')
+@conditional_get
 def api_time_range():
     """Get the available time range for historical data."""
     global db
     if not db:
-        db = MeshDatabase()
+        db = MeshDatabase(CFG.db_path)
 
     try:
-        time_range = db.get_time_range(days=7)
+        time_range = _offload(db.get_time_range, 7)
         return jsonify(time_range)
     except Exception as e:
         print(f"Error getting time range: {e}")
         return jsonify({'error': str(e)}), 500
 
 
+# Conditions change on a scale of minutes; every viewer shares one upstream call
+WEATHER_CACHE_TTL = 600.0  # seconds
+
+
 @app.route('/api/weather')
 def api_weather():
-    """Fetch current weather from Open-Meteo API."""
-    import requests
-
+    """Current weather, fetched from Open-Meteo at most once per WEATHER_CACHE_TTL."""
     try:
-        lat, lon = 30.2672, -97.7431  # Austin, TX (change to your location)
-        location = "Austin, TX"
-        url = (f"https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}"
-               f"&current=temperature_2m,relative_humidity_2m,apparent_temperature,weather_code,wind_speed_10m,wind_direction_10m"
-               f"&temperature_unit=fahrenheit&wind_speed_unit=mph")
-        resp = requests.get(url, timeout=10)
-        data = resp.json()
-        current = data.get('current', {})
-        temp = current.get('temperature_2m', '?')
-        feels_like = current.get('apparent_temperature', '?')
-        humidity = current.get('relative_humidity_2m', '?')
-        wind_speed = current.get('wind_speed_10m', '?')
-        wind_deg = current.get('wind_direction_10m', 0)
-        weather_code = current.get('weather_code', 0)
-
-        # Wind direction to cardinal
-        directions = ['N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
-                      'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW']
-        wind_dir = directions[int((wind_deg + 11.25) / 22.5) % 16] if isinstance(wind_deg, (int, float)) else '?'
-
-        # Weather code to description
-        weather_desc = {
-            0: 'Clear', 1: 'Mostly Clear', 2: 'Partly Cloudy', 3: 'Overcast',
-            45: 'Fog', 48: 'Fog', 51: 'Light Drizzle', 53: 'Drizzle', 55: 'Heavy Drizzle',
-            61: 'Light Rain', 63: 'Rain', 65: 'Heavy Rain', 71: 'Light Snow', 73: 'Snow',
-            75: 'Heavy Snow', 80: 'Showers', 81: 'Showers', 82: 'Heavy Showers',
-            95: 'Thunderstorm', 96: 'Thunderstorm', 99: 'Severe Thunderstorm'
-        }.get(weather_code, 'Unknown')
-
-        return jsonify({
-            'weather': f"{temp}F {weather_desc}",
-            'temp': temp,
-            'feels_like': feels_like,
-            'humidity': humidity,
-            'wind_speed': wind_speed,
-            'wind_dir': wind_dir,
-            'description': weather_desc,
-            'weather_code': weather_code,
-            'location': location,
-            'raw': current
-        })
+        return jsonify(_cached(('weather',), _fetch_weather, ttl=WEATHER_CACHE_TTL))
     except Exception as e:
         print(f"Error fetching weather: {e}")
         return jsonify({'error': str(e)}), 500
 
 
+def _fetch_weather():
+    """Fetch current weather from Open-Meteo API."""
+    import requests
+
+    lat, lon = 30.2672, -97.7431  # Austin, TX (change to your location)
+    location = "Austin, TX"
+    url = (f"https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}"
+           f"&current=temperature_2m,relative_humidity_2m,apparent_temperature,weather_code,wind_speed_10m,wind_direction_10m"
+           f"&temperature_unit=fahrenheit&wind_speed_unit=mph")
+    resp = requests.get(url, timeout=10)
+    data = resp.json()
+    current = data.get('current', {})
+    temp = current.get('temperature_2m', '?')
+    feels_like = current.get('apparent_temperature', '?')
+    humidity = current.get('relative_humidity_2m', '?')
+    wind_speed = current.get('wind_speed_10m', '?')
+    wind_deg = current.get('wind_direction_10m', 0)
+    weather_code = current.get('weather_code', 0)
+
+    # Wind direction to cardinal
+    directions = ['N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
+                  'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW']
+    wind_dir = directions[int((wind_deg + 11.25) / 22.5) % 16] if isinstance(wind_deg, (int, float)) else '?'
+
+    # Weather code to description
+    weather_desc = {
+        0: 'Clear', 1: 'Mostly Clear', 2: 'Partly Cloudy', 3: 'Overcast',
+        45: 'Fog', 48: 'Fog', 51: 'Light Drizzle', 53: 'Drizzle', 55: 'Heavy Drizzle',
+        61: 'Light Rain', 63: 'Rain', 65: 'Heavy Rain', 71: 'Light Snow', 73: 'Snow',
+        75: 'Heavy Snow', 80: 'Showers', 81: 'Showers', 82: 'Heavy Showers',
+        95: 'Thunderstorm', 96: 'Thunderstorm', 99: 'Severe Thunderstorm'
+    }.get(weather_code, 'Unknown')
+
+    return {
+        'weather': f"{temp}F {weather_desc}",
+        'temp': temp,
+        'feels_like': feels_like,
+        'humidity': humidity,
+        'wind_speed': wind_speed,
+        'wind_dir': wind_dir,
+        'description': weather_desc,
+        'weather_code': weather_code,
+        'location': location,
+        'raw': current
+    }
+
+
+PACKET_TYPE_ROWS = 6
+
+
+def _packet_type_rows(counts):
+    """Top packet types as stats panel bar rows, largest first.
+
+    pct is the bar width relative to the largest count, floored at 2 so a
+    rare type still shows a sliver.
+    """
+    top = sorted(counts.items(), key=lambda item: item[1], reverse=True)[:PACKET_TYPE_ROWS]
+    peak = top[0][1] if top else 1
+    return [{
+        'type': packet_type,
+        'short_type': packet_type.replace('_APP', '', 1).replace('MESSAGE', 'MSG', 1),
+        'count': count,
+        'pct': round(max(count / peak * 100, 2), 1),
+    } for packet_type, count in top]
+
+
 @app.route('/api/stats-enhanced')
+@conditional_get
 def api_stats_enhanced():
     """Get enhanced statistics with time range filtering. Single endpoint for entire stats panel."""
     global db
     if not db:
-        db = MeshDatabase()
+        db = MeshDatabase(CFG.db_path)
+
+    try:
+        return jsonify(_offload(_query_stats_enhanced, request.args.get('range', '24h'), g.now_ts))
+    except Exception as e:
+        import traceback
+        print(f"Error getting enhanced stats: {e}")
+        traceback.print_exc()
+        return jsonify({'error': str(e)}), 500
 
-    range_param = request.args.get('range', '24h')
 
+def _query_stats_enhanced(range_param, now_ts):
+    """Build the stats panel payload for one range; raises on database errors."""
     # Map range to SQL datetime modifier
     range_map = {
         '1h': '-1 hours',
@@ -4705,416 +6388,514 @@ def api_stats_enhanced():
     }
     time_filter = range_map.get(range_param)  # None for 'all'
 
-    try:
-        conn = db._get_conn()
-        result = {}
+    conn = db._get_read_conn()
+    result = {}
+    # All-time history counts come from trigger-maintained counters
+    row_counts = db.get_row_counts()
 
-        def count_filtered(table, time_col='timestamp'):
-            if time_filter:
-                row = conn.execute(f'SELECT COUNT(*) FROM {table} WHERE {time_col} > datetime("now", "localtime", ?)', (time_filter,)).fetchone()
-            else:
-                row = conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()
+    def count_all(table):
+        if table in row_counts:
+            return row_counts[table]
+        row = conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()
+        return row[0] if row else 0
+
+    def count_filtered(table, time_col='timestamp'):
+        if time_filter:
+            row = conn.execute(f'SELECT COUNT(*) FROM {table} WHERE {time_col} > datetime("now", "localtime", ?)', (time_filter,)).fetchone()
             return row[0] if row else 0
+        return count_all(table)
 
-        # Core counts (filtered by range) - only message counts are filtered
-        result['total_messages'] = count_filtered('messages')
-        result['sent_messages'] = count_filtered('sent_messages')
+    # Core counts (filtered by range) - only message counts are filtered
+    result['total_messages'] = count_filtered('messages')
+    result['sent_messages'] = count_filtered('sent_messages')
 
-        # Infrastructure stats - filtered by range like messages
-        result['total_packets'] = count_filtered('raw_packets')
-        result['telemetry_records'] = count_filtered('telemetry')
-        result['position_records'] = count_filtered('positions')
-        try:
-            result['routing_records'] = count_filtered('routing')
-        except:
-            result['routing_records'] = 0
+    # Infrastructure stats - filtered by range like messages
+    result['total_packets'] = count_filtered('raw_packets')
+    result['telemetry_records'] = count_filtered('telemetry')
+    result['position_records'] = count_filtered('positions')
+    try:
+        result['routing_records'] = count_filtered('routing')
+    except:
+        result['routing_records'] = 0
+    try:
+        result['filtered_messages'] = count_filtered('filtered_content')
+    except:
+        result['filtered_messages'] = 0
+
+    # All-time totals for header bar (always unfiltered)
+    result['all_time_messages'] = count_all('messages')
+    result['all_time_sent'] = count_all('sent_messages')
+    result['all_time_packets'] = count_all('raw_packets')
+
+    # Total nodes (always all-time)
+    row = conn.execute('SELECT COUNT(*) FROM nodes').fetchone()
+    result['total_nodes'] = row[0] if row else 0
+
+    # Active nodes within range
+    if range_param == 'all':
+        result['active_nodes'] = result['total_nodes']
+    else:
+        hours_map = {'1h': 1, '6h': 6, '24h': 24, '7d': 168}
+        cutoff = int(now_ts) - (hours_map.get(range_param, 24) * 3600)
+        row = conn.execute('SELECT COUNT(*) FROM nodes WHERE last_heard > ?', (cutoff,)).fetchone()
+        result['active_nodes'] = row[0] if row else 0
+
+    # Neighbor count
+    try:
+        row = conn.execute('SELECT COUNT(*) FROM neighbors').fetchone()
+        result['neighbor_records'] = row[0] if row else 0
+    except:
+        result['neighbor_records'] = 0
+
+    # New table counts
+    for table, key in [('waypoints', 'waypoint_records'), ('traceroutes', 'traceroute_records'),
+                       ('store_forward', 'store_forward_records'), ('range_tests', 'range_test_records'),
+                       ('detection_sensor', 'detection_alerts'), ('paxcounter', 'paxcounter_records')]:
         try:
-            result['filtered_messages'] = count_filtered('filtered_content')
+            result[key] = count_all(table)
         except:
-            result['filtered_messages'] = 0
+            result[key] = 0
 
-        # All-time totals for header bar (always unfiltered)
-        result['all_time_messages'] = conn.execute('SELECT COUNT(*) FROM messages').fetchone()[0]
-        result['all_time_sent'] = conn.execute('SELECT COUNT(*) FROM sent_messages').fetchone()[0]
+    # DB size
+    from pathlib import Path
+    db_size = Path(db.db_path).stat().st_size if Path(db.db_path).exists() else 0
+    result['database_size_mb'] = round(db_size / (1024 * 1024), 2)
 
-        # Total nodes (always all-time)
-        row = conn.execute('SELECT COUNT(*) FROM nodes').fetchone()
-        result['total_nodes'] = row[0] if row else 0
+    # Packet types breakdown (top 6, filtered)
+    if time_filter:
+        cursor = conn.execute('''
+            SELECT packet_type, COUNT(*) as count
+            FROM raw_packets WHERE timestamp > datetime('now', 'localtime', ?)
+            GROUP BY packet_type ORDER BY count DESC LIMIT 6
+        ''', (time_filter,))
+        result['packet_types'] = _packet_type_rows({row[0]: row[1] for row in cursor.fetchall()})
+    else:
+        result['packet_types'] = _packet_type_rows(db.get_packet_type_counts(limit=PACKET_TYPE_ROWS))
+
+    # Hop distribution - count ALL nodes by hops_away (0-7) from nodes table
+    hop_sql = '''
+        SELECT
+            SUM(CASE WHEN hops_away IS NULL OR hops_away = 0 THEN 1 ELSE 0 END),
+            SUM(CASE WHEN hops_away = 1 THEN 1 ELSE 0 END),
+            SUM(CASE WHEN hops_away = 2 THEN 1 ELSE 0 END),
+            SUM(CASE WHEN hops_away = 3 THEN 1 ELSE 0 END),
+            SUM(CASE WHEN hops_away = 4 THEN 1 ELSE 0 END),
+            SUM(CASE WHEN hops_away = 5 THEN 1 ELSE 0 END),
+            SUM(CASE WHEN hops_away = 6 THEN 1 ELSE 0 END),
+            SUM(CASE WHEN hops_away >= 7 THEN 1 ELSE 0 END),
+            COUNT(*)
+        FROM nodes
+    '''
+    if range_param == 'all':
+        cursor = conn.execute(hop_sql)
+    else:
+        hours_map_hop = {'1h': 1, '6h': 6, '24h': 24, '7d': 168}
+        hop_cutoff = int(now_ts) - (hours_map_hop.get(range_param, 24) * 3600)
+        cursor = conn.execute(hop_sql + ' WHERE last_heard > ?', (hop_cutoff,))
+    hop_row = cursor.fetchone()
+    result['hop_distribution'] = {
+        'direct': hop_row[0] or 0,
+        'hop1': hop_row[1] or 0,
+        'hop2': hop_row[2] or 0,
+        'hop3': hop_row[3] or 0,
+        'hop4': hop_row[4] or 0,
+        'hop5': hop_row[5] or 0,
+        'hop6': hop_row[6] or 0,
+        'hop7': hop_row[7] or 0,
+        'total': hop_row[8] or 0
+    }
 
-        # Active nodes within range
-        if range_param == 'all':
-            result['active_nodes'] = result['total_nodes']
-        else:
-            hours_map = {'1h': 1, '6h': 6, '24h': 24, '7d': 168}
-            cutoff = int(time.time()) - (hours_map.get(range_param, 24) * 3600)
-            row = conn.execute('SELECT COUNT(*) FROM nodes WHERE last_heard > ?', (cutoff,)).fetchone()
-            result['active_nodes'] = row[0] if row else 0
+    # Average SNR
+    if time_filter:
+        row = conn.execute('SELECT AVG(snr) FROM messages WHERE snr IS NOT NULL AND timestamp > datetime("now", "localtime", ?)', (time_filter,)).fetchone()
+    else:
+        row = conn.execute('SELECT AVG(snr) FROM messages WHERE snr IS NOT NULL').fetchone()
+    result['avg_snr'] = round(row[0], 1) if row and row[0] else None
+
+    # Channel utilization & Air TX (latest from nodes)
+    row = conn.execute('''
+        SELECT AVG(channel_utilization), AVG(air_util_tx)
+        FROM nodes WHERE channel_utilization IS NOT NULL AND channel_utilization > 0
+    ''').fetchone()
+    result['avg_channel_util'] = round(row[0], 1) if row and row[0] else None
+    result['avg_air_tx'] = round(row[1], 1) if row and row[1] else None
+
+    # Top 5 most active nodes in range
+    if time_filter:
+        cursor = conn.execute('''
+            SELECT m.from_id, m.from_name, COUNT(*) as msg_count,
+                   n.battery_level, n.hops_away
+            FROM messages m
+            LEFT JOIN nodes n ON m.from_id = n.node_id
+            WHERE m.timestamp > datetime('now', 'localtime', ?)
+            GROUP BY m.from_id
+            ORDER BY msg_count DESC LIMIT 5
+        ''', (time_filter,))
+    else:
+        cursor = conn.execute('''
+            SELECT m.from_id, m.from_name, COUNT(*) as msg_count,
+                   n.battery_level, n.hops_away
+            FROM messages m
+            LEFT JOIN nodes n ON m.from_id = n.node_id
+            GROUP BY m.from_id
+            ORDER BY msg_count DESC LIMIT 5
+        ''')
+    result['top_nodes'] = [{
+        'node_id': row[0],
+        'name': row[1] or row[0],
+        'msg_count': row[2],
+        'battery': row[3],
+        'hops': row[4]
+    } for row in cursor.fetchall()]
+
+    # Activity chart with adaptive buckets (pre-filled to avoid sparse gaps)
+    now = datetime.fromtimestamp(now_ts)
+    if range_param == '1h':
+        cursor = conn.execute('''
+            SELECT strftime('%H', timestamp) || ':' ||
+                   printf('%02d', (CAST(strftime('%M', timestamp) AS INTEGER) / 5) * 5) as bucket,
+                   COUNT(*) as count
+            FROM messages WHERE timestamp > datetime('now', 'localtime', '-1 hours')
+            GROUP BY bucket ORDER BY bucket
+        ''')
+        # Pre-fill all 12 five-minute buckets for the last hour
+        buckets = {}
+        t = now - timedelta(hours=1)
+        t = t.replace(minute=(t.minute // 5) * 5, second=0, microsecond=0)
+        while t <= now:
+            label = f'{t.hour:02d}:{(t.minute // 5) * 5:02d}'
+            buckets[label] = 0
+            t += timedelta(minutes=5)
+        for row in cursor.fetchall():
+            if row[0] in buckets:
+                buckets[row[0]] = row[1]
+        result['activity'] = [{'label': k, 'count': v} for k, v in sorted(buckets.items())]
+        result['activity_bucket'] = '5min'
+    elif range_param == '6h':
+        cursor = conn.execute('''
+            SELECT strftime('%H', timestamp) || ':' ||
+                   CASE WHEN CAST(strftime('%M', timestamp) AS INTEGER) < 30 THEN '00' ELSE '30' END as bucket,
+                   COUNT(*) as count
+            FROM messages WHERE timestamp > datetime('now', 'localtime', '-6 hours')
+            GROUP BY bucket ORDER BY bucket
+        ''')
+        # Pre-fill all 30-minute buckets for the last 6 hours
+        buckets = {}
+        t = now - timedelta(hours=6)
+        t = t.replace(minute=0 if t.minute < 30 else 30, second=0, microsecond=0)
+        while t <= now:
+            label = f'{t.hour:02d}:{"00" if t.minute < 30 else "30"}'
+            buckets[label] = 0
+            t += timedelta(minutes=30)
+        for row in cursor.fetchall():
+            if row[0] in buckets:
+                buckets[row[0]] = row[1]
+        result['activity'] = [{'label': k, 'count': v} for k, v in sorted(buckets.items())]
+        result['activity_bucket'] = '30min'
+    elif range_param == '7d':
+        cursor = conn.execute('''
+            SELECT strftime('%m/%d', timestamp) as bucket, COUNT(*) as count
+            FROM messages WHERE timestamp > datetime('now', 'localtime', '-7 days')
+            GROUP BY bucket ORDER BY bucket
+        ''')
+        # Pre-fill all 7 daily buckets
+        buckets = {}
+        for i in range(7, -1, -1):
+            d = now - timedelta(days=i)
+            label = d.strftime('%m/%d')
+            buckets[label] = 0
+        for row in cursor.fetchall():
+            if row[0] in buckets:
+                buckets[row[0]] = row[1]
+        result['activity'] = [{'label': k, 'count': v} for k, v in sorted(buckets.items())]
+        result['activity_bucket'] = 'day'
+    elif range_param == 'all':
+        # All time: daily buckets
+        cursor = conn.execute('''
+            SELECT strftime('%m/%d', timestamp) as bucket, COUNT(*) as count
+            FROM messages
+            GROUP BY bucket ORDER BY bucket
+        ''')
+        result['activity'] = [{'label': row[0], 'count': row[1]} for row in cursor.fetchall()]
+        result['activity_bucket'] = 'day'
+    else:
+        # 24h: hourly, pre-filled
+        cursor = conn.execute('''
+            SELECT strftime('%H', timestamp) as hour, COUNT(*) as count
+            FROM messages WHERE timestamp > datetime('now', 'localtime', '-24 hours')
+            GROUP BY hour ORDER BY hour
+        ''')
+        hour_counts = {f'{i:02d}': 0 for i in range(24)}
+        for row in cursor.fetchall():
+            hour_counts[row[0]] = row[1]
+        result['activity'] = [{'label': h, 'count': c} for h, c in sorted(hour_counts.items())]
+        result['activity_bucket'] = 'hour'
 
-        # Neighbor count
-        try:
-            row = conn.execute('SELECT COUNT(*) FROM neighbors').fetchone()
-            result['neighbor_records'] = row[0] if row else 0
-        except:
-            result['neighbor_records'] = 0
+    return result
 
-        # New table counts
-        for table, key in [('waypoints', 'waypoint_records'), ('traceroutes', 'traceroute_records'),
-                           ('store_forward', 'store_forward_records'), ('range_tests', 'range_test_records'),
-                           ('detection_sensor', 'detection_alerts'), ('paxcounter', 'paxcounter_records')]:
-            try:
-                row = conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()
-                result[key] = row[0] if row else 0
-            except:
-                result[key] = 0
 
-        # DB size
-        from pathlib import Path
-        db_size = Path(db.db_path).stat().st_size if Path(db.db_path).exists() else 0
-        result['database_size_mb'] = round(db_size / (1024 * 1024), 2)
+@app.route('/api/dashboard')
+@conditional_get
+def api_dashboard():
+    """Messages, nodes and stats for one live refresh in a single response.
 
-        # Packet types breakdown (top 6, filtered)
-        if time_filter:
-            cursor = conn.execute('''
-                SELECT packet_type, COUNT(*) as count
-                FROM raw_packets WHERE timestamp > datetime('now', 'localtime', ?)
-                GROUP BY packet_type ORDER BY count DESC LIMIT 6
-            ''', (time_filter,))
-        else:
-            cursor = conn.execute('''
-                SELECT packet_type, COUNT(*) as count
-                FROM raw_packets GROUP BY packet_type ORDER BY count DESC LIMIT 6
-            ''')
-        result['packet_types'] = {row[0]: row[1] for row in cursor.fetchall()}
-
-        # Hop distribution - count ALL nodes by hops_away (0-7) from nodes table
-        hop_sql = '''
-            SELECT
-                SUM(CASE WHEN hops_away IS NULL OR hops_away = 0 THEN 1 ELSE 0 END),
-                SUM(CASE WHEN hops_away = 1 THEN 1 ELSE 0 END),
-                SUM(CASE WHEN hops_away = 2 THEN 1 ELSE 0 END),
-                SUM(CASE WHEN hops_away = 3 THEN 1 ELSE 0 END),
-                SUM(CASE WHEN hops_away = 4 THEN 1 ELSE 0 END),
-                SUM(CASE WHEN hops_away = 5 THEN 1 ELSE 0 END),
-                SUM(CASE WHEN hops_away = 6 THEN 1 ELSE 0 END),
-                SUM(CASE WHEN hops_away >= 7 THEN 1 ELSE 0 END),
-                COUNT(*)
-            FROM nodes
-        '''
-        if range_param == 'all':
-            cursor = conn.execute(hop_sql)
-        else:
-            hours_map_hop = {'1h': 1, '6h': 6, '24h': 24, '7d': 168}
-            hop_cutoff = int(time.time()) - (hours_map_hop.get(range_param, 24) * 3600)
-            cursor = conn.execute(hop_sql + ' WHERE last_heard > ?', (hop_cutoff,))
-        hop_row = cursor.fetchone()
-        result['hop_distribution'] = {
-            'direct': hop_row[0] or 0,
-            'hop1': hop_row[1] or 0,
-            'hop2': hop_row[2] or 0,
-            'hop3': hop_row[3] or 0,
-            'hop4': hop_row[4] or 0,
-            'hop5': hop_row[5] or 0,
-            'hop6': hop_row[6] or 0,
-            'hop7': hop_row[7] or 0,
-            'total': hop_row[8] or 0
-        }
-
-        # Average SNR
-        if time_filter:
-            row = conn.execute('SELECT AVG(snr) FROM messages WHERE snr IS NOT NULL AND timestamp > datetime("now", "localtime", ?)', (time_filter,)).fetchone()
-        else:
-            row = conn.execute('SELECT AVG(snr) FROM messages WHERE snr IS NOT NULL').fetchone()
-        result['avg_snr'] = round(row[0], 1) if row and row[0] else None
-
-        # Channel utilization & Air TX (latest from nodes)
-        row = conn.execute('''
-            SELECT AVG(channel_utilization), AVG(air_util_tx)
-            FROM nodes WHERE channel_utilization IS NOT NULL AND channel_utilization > 0
-        ''').fetchone()
-        result['avg_channel_util'] = round(row[0], 1) if row and row[0] else None
-        result['avg_air_tx'] = round(row[1], 1) if row and row[1] else None
-
-        # Top 5 most active nodes in range
-        if time_filter:
-            cursor = conn.execute('''
-                SELECT m.from_id, m.from_name, COUNT(*) as msg_count,
-                       n.battery_level, n.hops_away
-                FROM messages m
-                LEFT JOIN nodes n ON m.from_id = n.node_id
-                WHERE m.timestamp > datetime('now', 'localtime', ?)
-                GROUP BY m.from_id
-                ORDER BY msg_count DESC LIMIT 5
-            ''', (time_filter,))
-        else:
-            cursor = conn.execute('''
-                SELECT m.from_id, m.from_name, COUNT(*) as msg_count,
-                       n.battery_level, n.hops_away
-                FROM messages m
-                LEFT JOIN nodes n ON m.from_id = n.node_id
-                GROUP BY m.from_id
-                ORDER BY msg_count DESC LIMIT 5
-            ''')
-        result['top_nodes'] = [{
-            'node_id': row[0],
-            'name': row[1] or row[0],
-            'msg_count': row[2],
-            'battery': row[3],
-            'hops': row[4]
-        } for row in cursor.fetchall()]
-
-        # Activity chart with adaptive buckets (pre-filled to avoid sparse gaps)
-        now = datetime.now()
-        if range_param == '1h':
-            cursor = conn.execute('''
-                SELECT strftime('%H', timestamp) || ':' ||
-                       printf('%02d', (CAST(strftime('%M', timestamp) AS INTEGER) / 5) * 5) as bucket,
-                       COUNT(*) as count
-                FROM messages WHERE timestamp > datetime('now', 'localtime', '-1 hours')
-                GROUP BY bucket ORDER BY bucket
-            ''')
-            # Pre-fill all 12 five-minute buckets for the last hour
-            buckets = {}
-            t = now - timedelta(hours=1)
-            t = t.replace(minute=(t.minute // 5) * 5, second=0, microsecond=0)
-            while t <= now:
-                label = f'{t.hour:02d}:{(t.minute // 5) * 5:02d}'
-                buckets[label] = 0
-                t += timedelta(minutes=5)
-            for row in cursor.fetchall():
-                if row[0] in buckets:
-                    buckets[row[0]] = row[1]
-            result['activity'] = [{'label': k, 'count': v} for k, v in sorted(buckets.items())]
-            result['activity_bucket'] = '5min'
-        elif range_param == '6h':
-            cursor = conn.execute('''
-                SELECT strftime('%H', timestamp) || ':' ||
-                       CASE WHEN CAST(strftime('%M', timestamp) AS INTEGER) < 30 THEN '00' ELSE '30' END as bucket,
-                       COUNT(*) as count
-                FROM messages WHERE timestamp > datetime('now', 'localtime', '-6 hours')
-                GROUP BY bucket ORDER BY bucket
-            ''')
-            # Pre-fill all 30-minute buckets for the last 6 hours
-            buckets = {}
-            t = now - timedelta(hours=6)
-            t = t.replace(minute=0 if t.minute < 30 else 30, second=0, microsecond=0)
-            while t <= now:
-                label = f'{t.hour:02d}:{"00" if t.minute < 30 else "30"}'
-                buckets[label] = 0
-                t += timedelta(minutes=30)
-            for row in cursor.fetchall():
-                if row[0] in buckets:
-                    buckets[row[0]] = row[1]
-            result['activity'] = [{'label': k, 'count': v} for k, v in sorted(buckets.items())]
-            result['activity_bucket'] = '30min'
-        elif range_param == '7d':
-            cursor = conn.execute('''
-                SELECT strftime('%m/%d', timestamp) as bucket, COUNT(*) as count
-                FROM messages WHERE timestamp > datetime('now', 'localtime', '-7 days')
-                GROUP BY bucket ORDER BY bucket
-            ''')
-            # Pre-fill all 7 daily buckets
-            buckets = {}
-            for i in range(7, -1, -1):
-                d = now - timedelta(days=i)
-                label = d.strftime('%m/%d')
-                buckets[label] = 0
-            for row in cursor.fetchall():
-                if row[0] in buckets:
-                    buckets[row[0]] = row[1]
-            result['activity'] = [{'label': k, 'count': v} for k, v in sorted(buckets.items())]
-            result['activity_bucket'] = 'day'
-        elif range_param == 'all':
-            # All time: daily buckets
-            cursor = conn.execute('''
-                SELECT strftime('%m/%d', timestamp) as bucket, COUNT(*) as count
-                FROM messages
-                GROUP BY bucket ORDER BY bucket
-            ''')
-            result['activity'] = [{'label': row[0], 'count': row[1]} for row in cursor.fetchall()]
-            result['activity_bucket'] = 'day'
-        else:
-            # 24h: hourly, pre-filled
-            cursor = conn.execute('''
-                SELECT strftime('%H', timestamp) as hour, COUNT(*) as count
-                FROM messages WHERE timestamp > datetime('now', 'localtime', '-24 hours')
-                GROUP BY hour ORDER BY hour
-            ''')
-            hour_counts = {f'{i:02d}': 0 for i in range(24)}
-            for row in cursor.fetchall():
-                hour_counts[row[0]] = row[1]
-            result['activity'] = [{'label': h, 'count': c} for h, c in sorted(hour_counts.items())]
-            result['activity_bucket'] = 'hour'
-
-        return jsonify(result)
+    Takes the same ranges as /api/messages, /api/nodes and
+    /api/stats-enhanced (msg_range, map_range, stats_range) and shares
+    their query cache entries.
+    """
+    global db
+    if not db:
+        db = MeshDatabase(CFG.db_path)
 
+    limit = request.args.get('limit', 50, type=int)
+    time_filter = MESSAGE_RANGES.get(request.args.get('msg_range', 'all'))
+    filter_hours = NODE_RANGE_HOURS.get(request.args.get('map_range', 'all'))
+    now_ts = g.now_ts
+
+    return jsonify({
+        'messages': _cached_query(('messages', limit, time_filter), lambda: _query_messages(limit, time_filter)),
+        'nodes': _cached_query(('nodes', filter_hours), lambda: _query_nodes(filter_hours, now_ts)),
+        'stats': _dashboard_stats(request.args.get('stats_range', '24h'), now_ts),
+    })
+
+
+def _dashboard_stats(range_param, now_ts):
+    try:
+        return _offload(_query_stats_enhanced, range_param, now_ts)
     except Exception as e:
-        import traceback
         print(f"Error getting enhanced stats: {e}")
-        traceback.print_exc()
-        return jsonify({'error': str(e)}), 500
+        return {'error': str(e)}
+
+
+@app.route('/api/dashboard-delta')
+@conditional_get
+def api_dashboard_delta():
+    """What changed in /api/dashboard past the client's cursor.
+
+    Takes the same arguments as /api/dashboard plus the newest ids and
+    node last_heard the client holds (since_id, since_sent_id,
+    since_heard). Stored messages never change, so messages only carry
+    'added'; nodes carry 'added' and 'updated' rows and the ids 'removed'
+    by the map range since since_heard. Stats come whole, as they do from
+    /api/dashboard.
+    """
+    global db
+    if not db:
+        db = MeshDatabase(CFG.db_path)
+
+    limit = request.args.get('limit', 50, type=int)
+    time_filter = MESSAGE_RANGES.get(request.args.get('msg_range', 'all'))
+    filter_hours = NODE_RANGE_HOURS.get(request.args.get('map_range', 'all'))
+    since_id = request.args.get('since_id', 0, type=int)
+    since_sent_id = request.args.get('since_sent_id', 0, type=int)
+    since_heard = request.args.get('since_heard', 0, type=int)
+    now_ts = g.now_ts
+
+    return jsonify({
+        'messages': {'added': _offload(_query_messages, limit, time_filter, since_id, since_sent_id)},
+        'nodes': _offload(_query_node_delta, since_heard, filter_hours, now_ts),
+        'stats': _dashboard_stats(request.args.get('stats_range', '24h'), now_ts),
+    })
+
+
+def _query_node_delta(since_heard, filter_hours, now_ts):
+    range_cutoff = int(now_ts) - filter_hours * 3600 if filter_hours else 0
+    # last_heard only has whole seconds, so the client's newest second is
+    # read again; rows it already holds merge by node_id as a no-op
+    inclusive = since_heard > range_cutoff
+    since_iso = datetime.fromtimestamp(since_heard + 1).isoformat()
+    delta = {'added': [], 'updated': [], 'removed': []}
+    for node in _query_nodes_heard_after(max(since_heard, range_cutoff), inclusive):
+        # A node first seen after the cursor second is one the client cannot have
+        new = (node['first_seen'] or '') > since_iso
+        delta['added' if new else 'updated'].append(node)
+
+    # Nodes the client could hold that have since aged out of the range
+    if filter_hours and since_heard:
+        try:
+            delta['removed'] = db.get_node_ids_heard_between(since_heard - filter_hours * 3600, range_cutoff)
+        except Exception as e:
+            print(f"Error getting removed nodes: {e}")
+
+    return delta
 
 
 @app.route('/api/historical')
+@conditional_get
 def api_historical():
     """Get all data at a specific point in time."""
     global db
     if not db:
-        db = MeshDatabase()
+        db = MeshDatabase(CFG.db_path)
 
     try:
         timestamp = request.args.get('at')
         if not timestamp:
             return jsonify({'error': 'Missing "at" parameter'}), 400
 
-        # Get historical data
-        messages = db.get_messages_before(timestamp, limit=50)
-        nodes = db.get_nodes_at_time(timestamp)
-        stats = db.get_stats_at_time(timestamp)
-
-        # Get activity chart data (hourly counts for 24h before timestamp)
-        activity = []
-        try:
-            conn = db._get_conn()
-            cursor = conn.execute('''
-                SELECT strftime('%H', timestamp) as hour, COUNT(*) as count
-                FROM messages
-                WHERE timestamp > datetime(?, '-24 hours') AND timestamp <= ?
-                GROUP BY hour
-                ORDER BY hour
-            ''', (timestamp, timestamp))
-
-            hour_counts = {f'{i:02d}': 0 for i in range(24)}
-            for row in cursor.fetchall():
-                hour_counts[row[0]] = row[1]
-            activity = [{'hour': h, 'count': c} for h, c in sorted(hour_counts.items())]
-        except Exception as e:
-            print(f"Error getting historical activity: {e}")
-
-        return jsonify({
-            'timestamp': timestamp,
-            'messages': messages,
-            'nodes': nodes,
-            'stats': stats,
-            'activity': activity
-        })
+        return jsonify(_offload(_query_historical, timestamp))
 
     except Exception as e:
         print(f"Error getting historical data: {e}")
         return jsonify({'error': str(e)}), 500
 
 
+def _query_historical(timestamp):
+    """The /api/historical payload for one point in time; raises on database errors."""
+    messages = db.get_messages_before(timestamp, limit=50)
+    nodes = db.get_nodes_at_time(timestamp)
+    stats = db.get_stats_at_time(timestamp)
+    stats['packet_types'] = _packet_type_rows(stats.get('packet_types', {}))
+
+    # Get activity chart data (hourly counts for 24h before timestamp)
+    activity = []
+    try:
+        conn = db._get_read_conn()
+        cursor = conn.execute('''
+            SELECT strftime('%H', timestamp) as hour, COUNT(*) as count
+            FROM messages
+            WHERE timestamp > datetime(?, '-24 hours') AND timestamp <= ?
+            GROUP BY hour
+            ORDER BY hour
+        ''', (timestamp, timestamp))
+
+        hour_counts = {f'{i:02d}': 0 for i in range(24)}
+        for row in cursor.fetchall():
+            hour_counts[row[0]] = row[1]
+        activity = [{'hour': h, 'count': c} for h, c in sorted(hour_counts.items())]
+    except Exception as e:
+        print(f"Error getting historical activity: {e}")
+
+    return {
+        'timestamp': timestamp,
+        'messages': messages,
+        'nodes': nodes,
+        'stats': stats,
+        'activity': activity
+    }
+
+
 @app.route('/api/telemetry-history')
+@conditional_get
 def api_telemetry_history():
     """Get telemetry time series for a node."""
     global db
     if not db:
-        db = MeshDatabase()
+        db = MeshDatabase(CFG.db_path)
 
     node_id = request.args.get('node_id')
     tel_type = request.args.get('type', 'device')
     limit = request.args.get('limit', 100, type=int)
 
     try:
-        conn = db._get_conn()
-        if node_id:
-            cursor = conn.execute('''
-                SELECT timestamp, telemetry_type, battery_level, voltage,
-                       channel_utilization, air_util_tx, uptime_seconds,
-                       temperature, relative_humidity, barometric_pressure
-                FROM telemetry
-                WHERE node_id = ? AND (? = 'all' OR telemetry_type = ?)
-                ORDER BY timestamp DESC LIMIT ?
-            ''', (node_id, tel_type, tel_type, limit))
-        else:
-            cursor = conn.execute('''
-                SELECT node_id, timestamp, telemetry_type, battery_level, voltage,
-                       channel_utilization, air_util_tx, temperature, relative_humidity
-                FROM telemetry
-                WHERE ? = 'all' OR telemetry_type = ?
-                ORDER BY timestamp DESC LIMIT ?
-            ''', (tel_type, tel_type, limit))
-
-        results = [dict(row) for row in cursor.fetchall()]
-        return jsonify(results)
+        return jsonify(_offload(_query_telemetry_history, node_id, tel_type, limit))
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+def _query_telemetry_history(node_id, tel_type, limit):
+    conn = db._get_read_conn()
+    if node_id:
+        cursor = conn.execute('''
+            SELECT timestamp, telemetry_type, battery_level, voltage,
+                   channel_utilization, air_util_tx, uptime_seconds,
+                   temperature, relative_humidity, barometric_pressure
+            FROM telemetry
+            WHERE node_id = ? AND (? = 'all' OR telemetry_type = ?)
+            ORDER BY timestamp DESC LIMIT ?
+        ''', (node_id, tel_type, tel_type, limit))
+    else:
+        cursor = conn.execute('''
+            SELECT node_id, timestamp, telemetry_type, battery_level, voltage,
+                   channel_utilization, air_util_tx, temperature, relative_humidity
+            FROM telemetry
+            WHERE ? = 'all' OR telemetry_type = ?
+            ORDER BY timestamp DESC LIMIT ?
+        ''', (tel_type, tel_type, limit))
+    return [dict(row) for row in cursor.fetchall()]
+
+
 @app.route('/api/position-trail')
+@conditional_get
 def api_position_trail():
     """Get position history for map trails."""
     global db
     if not db:
-        db = MeshDatabase()
+        db = MeshDatabase(CFG.db_path)
 
     node_id = request.args.get('node_id')
     limit = request.args.get('limit', 100, type=int)
 
     try:
-        conn = db._get_conn()
-        if node_id:
-            cursor = conn.execute('''
-                SELECT node_id, timestamp, latitude, longitude, altitude, speed
-                FROM positions
-                WHERE node_id = ? AND latitude IS NOT NULL AND longitude IS NOT NULL
-                ORDER BY timestamp DESC LIMIT ?
-            ''', (node_id, limit))
-        else:
-            cursor = conn.execute('''
-                SELECT node_id, timestamp, latitude, longitude, altitude, speed
-                FROM positions
-                WHERE latitude IS NOT NULL AND longitude IS NOT NULL
-                ORDER BY timestamp DESC LIMIT ?
-            ''', (limit,))
-
-        results = [dict(row) for row in cursor.fetchall()]
-        return jsonify(results)
+        return jsonify(_offload(_query_position_trail, node_id, limit))
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+def _query_position_trail(node_id, limit):
+    conn = db._get_read_conn()
+    if node_id:
+        cursor = conn.execute('''
+            SELECT node_id, timestamp, latitude, longitude, altitude, speed
+            FROM positions
+            WHERE node_id = ? AND latitude IS NOT NULL AND longitude IS NOT NULL
+            ORDER BY timestamp DESC LIMIT ?
+        ''', (node_id, limit))
+    else:
+        cursor = conn.execute('''
+            SELECT node_id, timestamp, latitude, longitude, altitude, speed
+            FROM positions
+            WHERE latitude IS NOT NULL AND longitude IS NOT NULL
+            ORDER BY timestamp DESC LIMIT ?
+        ''', (limit,))
+    return [dict(row) for row in cursor.fetchall()]
+
+
 @app.route('/api/topology')
+@conditional_get
 def api_topology():
     """Get network topology graph."""
     global db
     if not db:
-        db = MeshDatabase()
+        db = MeshDatabase(CFG.db_path)
 
     try:
-        topology = db.get_network_topology()
+        topology = _offload(db.get_network_topology)
         return jsonify(topology)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/waypoints')
+@conditional_get
 def api_waypoints():
     """Get active waypoints."""
     global db
     if not db:
-        db = MeshDatabase()
+        db = MeshDatabase(CFG.db_path)
 
     active_only = request.args.get('active_only', 'true').lower() == 'true'
 
     try:
-        waypoints = db.get_waypoints(active_only=active_only)
+        waypoints = _offload(db.get_waypoints, active_only)
         return jsonify(waypoints)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/traceroutes')
+@conditional_get
 def api_traceroutes():
     """Get recent traceroutes, optionally filtered by node_id."""
     global db
     if not db:
-        db = MeshDatabase()
+        db = MeshDatabase(CFG.db_path)
 
     limit = request.args.get('limit', 20, type=int)
     node_id = request.args.get('node_id')
 
     try:
-        traceroutes = db.get_traceroutes(limit=limit)
+        traceroutes = _offload(db.get_traceroutes, limit)
         if node_id:
             filtered = []
             for tr in traceroutes:
@@ -5139,7 +6920,7 @@ def api_request_traceroute():
     """Queue a traceroute request to be sent by the bridge."""
     global db
     if not db:
-        db = MeshDatabase()
+        db = MeshDatabase(CFG.db_path)
 
     data = request.get_json()
     node_id = data.get('node_id') if data else None
@@ -5154,11 +6935,12 @@ def api_request_traceroute():
 
 
 @app.route('/api/signal-trends')
+@conditional_get
 def api_signal_trends():
     """Get SNR/RSSI trends for a node."""
     global db
     if not db:
-        db = MeshDatabase()
+        db = MeshDatabase(CFG.db_path)
 
     node_id = request.args.get('node_id')
     hours = request.args.get('hours', 24, type=int)
@@ -5167,126 +6949,259 @@ def api_signal_trends():
         return jsonify({'error': 'node_id required'}), 400
 
     try:
-        trends = db.get_signal_trends(node_id, hours=hours)
+        trends = _offload(db.get_signal_trends, node_id, hours)
         return jsonify(trends)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/paxcounter')
+@conditional_get
 def api_paxcounter():
     """Get paxcounter history."""
     global db
     if not db:
-        db = MeshDatabase()
+        db = MeshDatabase(CFG.db_path)
 
     node_id = request.args.get('node_id')
     limit = request.args.get('limit', 100, type=int)
 
     try:
-        data = db.get_paxcounter_history(node_id=node_id, limit=limit)
+        data = _offload(db.get_paxcounter_history, node_id, limit)
         return jsonify(data)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/range-tests')
+@conditional_get
 def api_range_tests():
     """Get range test results."""
     global db
     if not db:
-        db = MeshDatabase()
+        db = MeshDatabase(CFG.db_path)
 
     limit = request.args.get('limit', 50, type=int)
 
     try:
-        data = db.get_range_tests(limit=limit)
+        data = _offload(db.get_range_tests, limit)
         return jsonify(data)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/detection-alerts')
+@conditional_get
 def api_detection_alerts():
     """Get detection sensor alerts."""
     global db
     if not db:
-        db = MeshDatabase()
+        db = MeshDatabase(CFG.db_path)
 
     limit = request.args.get('limit', 50, type=int)
 
     try:
-        data = db.get_detection_alerts(limit=limit)
+        data = _offload(db.get_detection_alerts, limit)
         return jsonify(data)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/store-forward-stats')
+@conditional_get
 def api_store_forward_stats():
     """Get latest store & forward stats per node."""
     global db
     if not db:
-        db = MeshDatabase()
+        db = MeshDatabase(CFG.db_path)
 
     try:
-        data = db.get_store_forward_stats()
+        data = _offload(db.get_store_forward_stats)
         return jsonify(data)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/node-detail')
+@conditional_get
 def api_node_detail():
     """Get comprehensive single-node view."""
     global db
     if not db:
-        db = MeshDatabase()
+        db = MeshDatabase(CFG.db_path)
 
     node_id = request.args.get('node_id')
     if not node_id:
         return jsonify({'error': 'node_id required'}), 400
 
     try:
-        node = db.get_node(node_id)
-        if not node:
+        detail = _offload(_query_node_detail, node_id)
+        if not detail:
             return jsonify({'error': 'Node not found'}), 404
-
-        telemetry = db.get_telemetry_history(node_id, limit=20)
-        positions = db.get_position_history(node_id, limit=20)
-        signal = db.get_signal_trends(node_id, hours=24)
-        facts = db.get_user_facts(node_id)
-
-        return jsonify({
-            'node': node,
-            'telemetry': telemetry,
-            'positions': positions,
-            'signal_trends': signal,
-            'facts': facts
-        })
+        return jsonify(detail)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
-def run_dashboard(host='0.0.0.0', port=5000, debug=False):
+def _query_node_detail(node_id):
+    """Everything /api/node-detail shows for one node, or None if unknown."""
+    node = db.get_node(node_id)
+    if not node:
+        return None
+
+    return {
+        'node': node,
+        'telemetry': db.get_telemetry_history(node_id, limit=20),
+        'positions': db.get_position_history(node_id, limit=20),
+        'signal_trends': db.get_signal_trends(node_id, hours=24),
+        'facts': db.get_user_facts(node_id)
+    }
+
+
+# ==================== SOCKET BROADCASTS ====================
+
+def broadcast(name, payload):
+    """Queue a socket event; it goes out with the next 'batch' frame."""
+    _pending.append((name, payload))
+    _start_once(_flush_pending)
+
+
+def _start_once(task):
+    with _background_lock:
+        if task in _background_tasks:
+            return
+        _background_tasks.add(task)
+    socketio.start_background_task(task)
+
+
+def _flush_pending():
+    """Drain queued events, emitting up to BROADCAST_BATCH_MAX per frame."""
+    while True:
+        socketio.sleep(BROADCAST_INTERVAL)
+        while _pending:
+            batch = []
+            while _pending and len(batch) < BROADCAST_BATCH_MAX:
+                name, payload = _pending.popleft()
+                batch.append({'name': name, 'data': payload})
+            try:
+                socketio.emit('batch', batch)
+            except Exception as e:
+                print(f"Error broadcasting batch: {e}")
+
+
+def _counter_changes(previous, counts):
+    """Row counters whose value moved since the previous sample."""
+    return {key: val for key, val in counts.items() if previous.get(key) != val}
+
+
+def _watch_database():
+    """The one producer of socket pushes.
+
+    Samples the database at a fixed rate rather than emitting per write, so
+    a burst of mesh traffic costs the same as a trickle: each new message
+    is queued once, nodes heard since the last look go out as full rows in
+    a 'node_update', changed row counters go out as a small 'stats_delta',
+    and anything else collapses into a 'db_update' at most every
+    UPDATE_PUSH_INTERVAL seconds.
+    """
+    global db
+    if not db:
+        db = MeshDatabase(CFG.db_path)
+
+    last_version = None
+    last_message_id = None
+    last_node_heard = 0
+    nodes_seen = set()
+    last_counts = {}
+    last_update_push = 0.0
+    changed = False
+    while True:
+        socketio.sleep(WATCH_INTERVAL)
+        try:
+            version = _offload(db.get_data_version)
+            if last_message_id is None:
+                last_version, last_message_id = version, _offload(db.get_latest_message_id)
+                last_node_heard, nodes_seen = _offload(_latest_node_heard)
+                last_counts = _offload(db.get_row_counts)
+                continue
+            if version != last_version:
+                changed = True
+                new_messages = _offload(db.get_messages_since, last_message_id, WATCH_MESSAGE_PAGE)
+                for msg in new_messages:
+                    last_message_id = msg['id']
+                    broadcast('new_message', msg)
+                nodes, last_node_heard, nodes_seen = _advance_node_cursor(
+                    _offload(_query_nodes_heard_after, last_node_heard, True),
+                    last_node_heard, nodes_seen)
+                if nodes:
+                    broadcast('node_update', nodes)
+                counts = _offload(db.get_row_counts)
+                delta = _counter_changes(last_counts, counts)
+                last_counts = counts
+                if delta:
+                    broadcast('stats_delta', delta)
+                # A full page means there may be more; look again next tick
+                if len(new_messages) < WATCH_MESSAGE_PAGE:
+                    last_version = version
+
+            now = time.monotonic()
+            if changed and now - last_update_push >= UPDATE_PUSH_INTERVAL:
+                changed = False
+                last_update_push = now
+                broadcast('db_update', {'last_update': _offload(db.get_last_modified)})
+        except Exception as e:
+            print(f"Error watching database: {e}")
+
+
+@socketio.on('connect')
+def on_connect():
+    _start_once(_flush_pending)
+    _start_once(_watch_database)
+
+
+def _tls_options():
+    """socketio.run() keyword arguments that serve HTTPS, if configured.
+
+    eventlet takes the cert and key files itself; werkzeug takes them as an
+    ssl_context pair.
+    """
+    if not CFG.tls:
+        return {}
+    if ASYNC_MODE == 'eventlet':
+        return {'certfile': CFG.cert_file, 'keyfile': CFG.key_file}
+    return {'ssl_context': (CFG.cert_file, CFG.key_file)}
+
+
+def run_dashboard(host=CFG.host, port=CFG.port, debug=False):
     """Run the dashboard server."""
+    scheme = 'https' if CFG.tls else 'http'
     print(f"\n{'='*60}")
     print("  🦙 LoRaLlama Dashboard")
     print(f"{'='*60}")
-    print(f"\n  🌐 Local:   http://localhost:{port}")
-    print(f"  🌐 Network: http://<your-ip>:{port}")
+    print(f"\n  🌐 Local:   {scheme}://localhost:{port}")
+    print(f"  🌐 Network: {scheme}://<your-ip>:{port}")
+    print(f"  ⚙️  Server:  {ASYNC_MODE}")
     print("\n  Press Ctrl+C to stop\n")
 
-    socketio.run(app, host=host, port=port, debug=debug, allow_unsafe_werkzeug=True)
+    # The reloader forks a second process, which doesn't mix with a
+    # monkey-patched event loop
+    socketio.run(app, host=host, port=port, debug=debug,
+                 use_reloader=debug and ASYNC_MODE == 'threading',
+                 allow_unsafe_werkzeug=True, **_tls_options())
 
 
 if __name__ == '__main__':
     import argparse
 
     parser = argparse.ArgumentParser(description='LoRaLlama Dashboard')
-    parser.add_argument('--host', default='0.0.0.0', help='Host to bind to')
-    parser.add_argument('--port', type=int, default=5000, help='Port to listen on')
+    parser.add_argument('--host', default=CFG.host, help='Host to bind to')
+    parser.add_argument('--port', type=int, default=CFG.port, help='Port to listen on')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
+    parser.add_argument('--fetch-vendor', action='store_true',
+                        help='Download Leaflet/socket.io into static/vendor/ and exit')
 
     args = parser.parse_args()
+    if args.fetch_vendor:
+        fetch_vendor_assets()
+        raise SystemExit(0)
     run_dashboard(host=args.host, port=args.port, debug=args.debug)
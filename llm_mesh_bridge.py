@@ -31,7 +31,7 @@ from collections import deque
 
 from meshtastic_connector import MeshtasticConnector, MeshMessage, LLMInterface
 from mesh_database import MeshDatabase
-from content_filter import ContentFilter, RateLimiter
+from content_filter import get_content_filter, RateLimiter
 
 # ==================== LOGGING SETUP ====================
 # Set up comprehensive logging
@@ -912,7 +912,7 @@ class LLMHandler:
         self.db = MeshDatabase() if enable_memory else None
         self.web_search = WebSearch() if enable_web_search else None
         self.weather = WeatherService() if WEATHER_ENABLED else None
-        self.content_filter = ContentFilter(strict_mode=CONTENT_FILTER_STRICT) if CONTENT_FILTER_ENABLED else None
+        self.content_filter = get_content_filter(strict_mode=CONTENT_FILTER_STRICT) if CONTENT_FILTER_ENABLED else None
         self.rate_limiter = RateLimiter(RATE_LIMIT_MESSAGES, RATE_LIMIT_WINDOW) if CONTENT_FILTER_ENABLED else None
 
         # Keep old memory for compatibility (will migrate to db)
@@ -18,6 +18,7 @@ import json
 import threading
 import logging
 import time
+import weakref
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from pathlib import Path
@@ -26,6 +27,34 @@ logger = logging.getLogger(__name__)
 
 DB_FILE = "mesh_data.db"
 
+# Append-only history tables whose row counts are kept in stats_counters by
+# triggers. Tables rewritten with INSERT OR REPLACE (nodes, neighbors,
+# waypoints, user_facts) stay small and are counted directly.
+COUNTED_TABLES = [
+    'raw_packets', 'messages', 'sent_messages', 'telemetry', 'positions',
+    'routing', 'traceroutes', 'store_forward', 'range_tests',
+    'detection_sensor', 'paxcounter', 'filtered_content', 'global_context',
+]
+
+# Idle read-only connections kept for the next thread to pick up. Werkzeug's
+# threaded server runs every request on a fresh thread, so without reuse each
+# request would open a connection and start with an empty page cache.
+READ_POOL_SIZE = 8
+
+
+class _ReadConn:
+    """A pooled read connection held by one thread; goes back to the pool
+    when the thread's locals are dropped."""
+    __slots__ = ('conn', 'release', '__weakref__')
+
+
+def _return_read_conn(pool, lock, conn):
+    with lock:
+        if len(pool) < READ_POOL_SIZE:
+            pool.append(conn)
+            return
+    conn.close()
+
 
 class MeshDatabase:
     """SQLite database for comprehensive mesh network data storage."""
@@ -33,6 +62,8 @@ class MeshDatabase:
     def __init__(self, db_path: str = DB_FILE):
         self.db_path = db_path
         self._local = threading.local()
+        self._read_pool = []
+        self._read_pool_lock = threading.Lock()
         self._init_db()
         logger.info(f"[DB] Database initialized: {self.db_path}")
 
@@ -48,8 +79,53 @@ class MeshDatabase:
             # Enable WAL mode for better concurrent access
             self._local.conn.execute('PRAGMA journal_mode=WAL')
             self._local.conn.execute('PRAGMA busy_timeout=30000')
+            self._tune(self._local.conn)
         return self._local.conn
 
+    def _get_read_conn(self) -> sqlite3.Connection:
+        """Get thread-local read-only connection.
+
+        Readers get their own WAL snapshot, so dashboard queries never queue
+        behind the bridge's writes on the shared connection. A thread takes
+        one from the pool of idle connections and returns it when it exits,
+        so short-lived request threads keep a warm page cache.
+        """
+        if self.db_path == ':memory:':
+            return self._get_conn()
+        reader = getattr(self._local, 'reader', None)
+        if reader is None:
+            with self._read_pool_lock:
+                conn = self._read_pool.pop() if self._read_pool else None
+            if conn is None:
+                conn = self._open_read_conn()
+            reader = self._local.reader = _ReadConn()
+            reader.conn = conn
+            # Holds the pool, not self, so the database can still be collected
+            reader.release = weakref.finalize(
+                reader, _return_read_conn, self._read_pool, self._read_pool_lock, conn)
+        return reader.conn
+
+    def _open_read_conn(self) -> sqlite3.Connection:
+        uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(
+            uri,
+            uri=True,
+            check_same_thread=False,
+            timeout=30.0
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA busy_timeout=30000')
+        self._tune(conn)
+        return conn
+
+    @staticmethod
+    def _tune(conn: sqlite3.Connection):
+        """Per-connection settings: WAL makes NORMAL sync safe, and a larger
+        page cache plus memory-mapped reads keep hot tables out of syscalls."""
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA mmap_size=268435456')  # 256 MB
+        conn.execute('PRAGMA cache_size=-65536')    # 64 MB
+
     def _init_db(self):
         """Initialize database schema."""
         conn = self._get_conn()
@@ -392,7 +468,7 @@ class MeshDatabase:
         # Initialize last_updated if not exists
         cursor.execute('''
             INSERT OR IGNORE INTO db_meta (key, value) VALUES ('last_updated', ?)
-        ''', (datetime.now().isoformat(),))
+        ''', (str(time.time()),))
 
         # ==================== CREATE INDEXES ====================
         indexes = [
@@ -421,8 +497,72 @@ class MeshDatabase:
         for idx in indexes:
             cursor.execute(idx)
 
+        self._init_stats_counters(cursor)
+
         conn.commit()
 
+    def _init_stats_counters(self, cursor):
+        """Create the trigger-maintained row counters behind get_stats().
+
+        A counter is seeded with a full COUNT(*) only when its row is missing
+        (a new database, one written before the triggers existed, or a table
+        added to COUNTED_TABLES); from then on the triggers keep it current.
+        Seeding runs inside the schema transaction, so no write can slip in
+        between the count and the triggers.
+        """
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS stats_counters (
+                key TEXT PRIMARY KEY,
+                val INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        for table in COUNTED_TABLES:
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS stats_{table}_insert AFTER INSERT ON {table}
+                BEGIN
+                    UPDATE stats_counters SET val = val + 1 WHERE key = '{table}';
+                END
+            ''')
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS stats_{table}_delete AFTER DELETE ON {table}
+                BEGIN
+                    UPDATE stats_counters SET val = val - 1 WHERE key = '{table}';
+                END
+            ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS stats_packet_type_insert AFTER INSERT ON raw_packets
+            WHEN NEW.packet_type IS NOT NULL
+            BEGIN
+                INSERT INTO stats_counters (key, val) VALUES ('packet_type:' || NEW.packet_type, 1)
+                ON CONFLICT(key) DO UPDATE SET val = val + 1;
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS stats_packet_type_delete AFTER DELETE ON raw_packets
+            WHEN OLD.packet_type IS NOT NULL
+            BEGIN
+                UPDATE stats_counters SET val = val - 1 WHERE key = 'packet_type:' || OLD.packet_type;
+            END
+        ''')
+
+        cursor.execute('SELECT key FROM stats_counters WHERE key NOT LIKE ?', ('packet_type:%',))
+        seeded = {row[0] for row in cursor.fetchall()}
+        for table in COUNTED_TABLES:
+            if table in seeded:
+                continue
+            cursor.execute(f'''
+                INSERT INTO stats_counters (key, val) SELECT '{table}', COUNT(*) FROM {table}
+            ''')
+        if 'raw_packets' in seeded:
+            return
+        cursor.execute("DELETE FROM stats_counters WHERE key LIKE 'packet_type:%'")
+        cursor.execute('''
+            INSERT INTO stats_counters (key, val)
+            SELECT 'packet_type:' || packet_type, COUNT(*) FROM raw_packets
+            WHERE packet_type IS NOT NULL
+            GROUP BY packet_type
+        ''')
+
     def _migrate_if_needed(self, cursor):
         """Check for old schema and migrate if needed."""
         try:
@@ -548,7 +688,7 @@ class MeshDatabase:
     def get_raw_packets(self, packet_type: Optional[str] = None, from_id: Optional[str] = None,
                         limit: int = 100, offset: int = 0) -> List[Dict]:
         """Get raw packets with optional filtering."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         query = 'SELECT * FROM raw_packets WHERE 1=1'
@@ -636,7 +776,7 @@ class MeshDatabase:
     def get_messages(self, from_id: Optional[str] = None, limit: int = 50, offset: int = 0,
                      include_outgoing: bool = True) -> List[Dict]:
         """Get messages, optionally filtered by sender."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         if from_id:
@@ -659,7 +799,7 @@ class MeshDatabase:
 
     def get_conversation_history(self, user_id: str, limit: int = 10) -> List[Dict]:
         """Get recent conversation with a specific user."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         cursor.execute('''
@@ -672,9 +812,31 @@ class MeshDatabase:
         messages.reverse()
         return messages
 
+    def get_latest_message_id(self) -> int:
+        """Get the id of the newest message (0 if there are none)."""
+        conn = self._get_read_conn()
+        cursor = conn.cursor()
+
+        cursor.execute('SELECT MAX(id) FROM messages')
+        return cursor.fetchone()[0] or 0
+
+    def get_messages_since(self, after_id: int, limit: int = 50) -> List[Dict]:
+        """Get received messages newer than after_id, oldest first."""
+        conn = self._get_read_conn()
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            SELECT id, timestamp, from_id, from_name, to_id, text, snr, rssi, channel
+            FROM messages
+            WHERE id > ? AND from_id != 'assistant'
+            ORDER BY id LIMIT ?
+        ''', (after_id, limit))
+
+        return [dict(row) for row in cursor.fetchall()]
+
     def get_message_count(self, from_id: Optional[str] = None) -> int:
         """Get total message count."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         if from_id:
@@ -801,9 +963,16 @@ class MeshDatabase:
         except Exception as e:
             logger.debug(f"[DB] touch_node_last_heard failed for {node_id}: {e}")
 
+    def get_node_ids_heard_between(self, after: int, until: int) -> List[str]:
+        """Ids of nodes last heard after `after` and at or before `until`."""
+        conn = self._get_read_conn()
+        cursor = conn.execute(
+            'SELECT node_id FROM nodes WHERE last_heard > ? AND last_heard <= ?', (after, until))
+        return [row[0] for row in cursor.fetchall()]
+
     def get_node(self, node_id: str) -> Optional[Dict]:
         """Get a specific node by ID."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         cursor.execute('SELECT * FROM nodes WHERE node_id = ?', (node_id,))
@@ -812,7 +981,7 @@ class MeshDatabase:
 
     def get_all_nodes(self) -> List[Dict]:
         """Get all known nodes."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         cursor.execute('SELECT * FROM nodes ORDER BY last_heard DESC')
@@ -820,7 +989,7 @@ class MeshDatabase:
 
     def get_active_nodes(self, hours: int = 24) -> List[Dict]:
         """Get nodes seen within the last N hours."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         cutoff = int(time.time()) - (hours * 3600)
@@ -874,10 +1043,11 @@ class MeshDatabase:
         ))
 
         conn.commit()
+        self._update_last_modified()
 
     def get_telemetry_history(self, node_id: str, limit: int = 100) -> List[Dict]:
         """Get telemetry history for a node."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         cursor.execute('''
@@ -935,10 +1105,11 @@ class MeshDatabase:
         ))
 
         conn.commit()
+        self._update_last_modified()
 
     def get_position_history(self, node_id: str, limit: int = 100) -> List[Dict]:
         """Get position history for a node."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         cursor.execute('''
@@ -984,6 +1155,7 @@ class MeshDatabase:
         ))
 
         conn.commit()
+        self._update_last_modified()
 
     # ==================== NEIGHBOR OPERATIONS ====================
 
@@ -1016,6 +1188,7 @@ class MeshDatabase:
         ))
 
         conn.commit()
+        self._update_last_modified()
 
     # ==================== WAYPOINT OPERATIONS ====================
 
@@ -1068,7 +1241,7 @@ class MeshDatabase:
 
     def get_waypoints(self, active_only: bool = True, limit: int = 100) -> List[Dict]:
         """Get waypoints, optionally filtering expired ones."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         if active_only:
@@ -1121,7 +1294,7 @@ class MeshDatabase:
 
     def get_traceroutes(self, limit: int = 50) -> List[Dict]:
         """Get recent traceroutes."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         cursor.execute('SELECT * FROM traceroutes ORDER BY timestamp DESC LIMIT ?', (limit,))
@@ -1181,10 +1354,11 @@ class MeshDatabase:
         ))
 
         conn.commit()
+        self._update_last_modified()
 
     def get_store_forward_stats(self) -> List[Dict]:
         """Get latest store & forward stats per node."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         cursor.execute('''
@@ -1231,10 +1405,11 @@ class MeshDatabase:
         ))
 
         conn.commit()
+        self._update_last_modified()
 
     def get_range_tests(self, limit: int = 50) -> List[Dict]:
         """Get recent range test results."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         cursor.execute('SELECT * FROM range_tests ORDER BY timestamp DESC LIMIT ?', (limit,))
@@ -1277,7 +1452,7 @@ class MeshDatabase:
 
     def get_detection_alerts(self, limit: int = 50) -> List[Dict]:
         """Get recent detection sensor alerts."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         cursor.execute('SELECT * FROM detection_sensor ORDER BY timestamp DESC LIMIT ?', (limit,))
@@ -1309,10 +1484,11 @@ class MeshDatabase:
         ))
 
         conn.commit()
+        self._update_last_modified()
 
     def get_paxcounter_history(self, node_id: Optional[str] = None, limit: int = 100) -> List[Dict]:
         """Get paxcounter history, optionally for a specific node."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         if node_id:
@@ -1326,7 +1502,7 @@ class MeshDatabase:
 
     def get_neighbors_graph(self) -> List[Dict]:
         """Get all neighbor relationships as a list of dicts."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         cursor.execute('SELECT * FROM neighbors ORDER BY timestamp DESC')
@@ -1334,7 +1510,7 @@ class MeshDatabase:
 
     def get_network_topology(self) -> Dict:
         """Build network topology from traceroutes and neighbors."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         # Only include nodes heard in last 24h that have connections
@@ -1419,7 +1595,7 @@ class MeshDatabase:
 
     def get_telemetry_summary(self, node_id: Optional[str] = None, hours: int = 24) -> Dict:
         """Get aggregated telemetry summary."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         from datetime import timedelta as td
@@ -1461,7 +1637,7 @@ class MeshDatabase:
 
     def get_signal_trends(self, node_id: str, hours: int = 24) -> List[Dict]:
         """Get SNR/RSSI trends bucketed by hour."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         from datetime import timedelta as td
@@ -1507,13 +1683,14 @@ class MeshDatabase:
                 VALUES (?, ?, ?, ?, ?)
             ''', (user_id, fact_type, fact_value, confidence, source))
             conn.commit()
+            self._update_last_modified()
             logger.debug(f"[DB] Saved fact for {user_id}: {fact_type}={fact_value}")
         except sqlite3.IntegrityError:
             pass
 
     def get_user_facts(self, user_id: str) -> List[Dict]:
         """Get all facts about a user."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         cursor.execute('''
@@ -1552,12 +1729,13 @@ class MeshDatabase:
                 INSERT INTO global_context (context, category) VALUES (?, ?)
             ''', (context, category))
             conn.commit()
+            self._update_last_modified()
         except sqlite3.IntegrityError:
             pass
 
     def get_global_context(self, limit: int = 10) -> List[str]:
         """Get global context items."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         cursor.execute('''
@@ -1580,6 +1758,7 @@ class MeshDatabase:
         ''', (datetime.now().isoformat(), from_id, from_name, text, reason, category))
 
         conn.commit()
+        self._update_last_modified()
 
     # ==================== CONTEXT BUILDING ====================
 
@@ -1662,7 +1841,7 @@ class MeshDatabase:
         # Network health summary
         if include_health:
             try:
-                conn = self._get_conn()
+                conn = self._get_read_conn()
                 cursor = conn.cursor()
                 total = cursor.execute('SELECT COUNT(*) FROM nodes').fetchone()[0]
                 cutoff = int(time.time()) - (24 * 3600)
@@ -1675,7 +1854,7 @@ class MeshDatabase:
         if include_stats:
             try:
                 from datetime import timedelta as td
-                conn = self._get_conn()
+                conn = self._get_read_conn()
                 cursor = conn.cursor()
                 user_msg_count = cursor.execute(
                     'SELECT COUNT(*) FROM messages WHERE from_id = ?', (user_id,)
@@ -1732,7 +1911,7 @@ class MeshDatabase:
         parts = []
 
         try:
-            conn = self._get_conn()
+            conn = self._get_read_conn()
             cursor = conn.cursor()
 
             # Node counts
@@ -1801,7 +1980,7 @@ class MeshDatabase:
 
     def get_stats(self) -> Dict[str, Any]:
         """Get comprehensive database statistics."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         stats = {}
@@ -1827,7 +2006,11 @@ class MeshDatabase:
             ('paxcounter', 'paxcounter_records'),
         ]
 
+        counters = self.get_row_counts()
         for table, stat_name in tables:
+            if table in counters:
+                stats[stat_name] = counters[table]
+                continue
             try:
                 cursor.execute(f'SELECT COUNT(*) FROM {table}')
                 stats[stat_name] = cursor.fetchone()[0]
@@ -1844,14 +2027,7 @@ class MeshDatabase:
         stats['active_nodes_24h'] = cursor.fetchone()[0]
 
         # Packet type breakdown
-        cursor.execute('''
-            SELECT packet_type, COUNT(*) as count
-            FROM raw_packets
-            GROUP BY packet_type
-            ORDER BY count DESC
-            LIMIT 10
-        ''')
-        stats['packet_types'] = {row['packet_type']: row['count'] for row in cursor.fetchall()}
+        stats['packet_types'] = self.get_packet_type_counts(limit=10)
 
         # Database file size
         db_size = Path(self.db_path).stat().st_size if Path(self.db_path).exists() else 0
@@ -1859,6 +2035,26 @@ class MeshDatabase:
 
         return stats
 
+    def get_row_counts(self) -> Dict[str, int]:
+        """Row counts of the COUNTED_TABLES, read from stats_counters."""
+        conn = self._get_read_conn()
+        cursor = conn.execute(
+            f"SELECT key, val FROM stats_counters WHERE key IN ({','.join('?' * len(COUNTED_TABLES))})",
+            COUNTED_TABLES
+        )
+        return {row[0]: row[1] for row in cursor.fetchall()}
+
+    def get_packet_type_counts(self, limit: Optional[int] = None) -> Dict[str, int]:
+        """All-time packet counts by type, most common first."""
+        conn = self._get_read_conn()
+        cursor = conn.execute('''
+            SELECT substr(key, 13), val FROM stats_counters
+            WHERE key GLOB 'packet_type:*' AND val > 0
+            ORDER BY val DESC
+            LIMIT ?
+        ''', (limit if limit is not None else -1,))
+        return {row[0]: row[1] for row in cursor.fetchall()}
+
     # ==================== CLEANUP ====================
 
     def clear_all(self):
@@ -1875,6 +2071,7 @@ class MeshDatabase:
             cursor.execute(f'DELETE FROM {table}')
 
         conn.commit()
+        self._update_last_modified()
         logger.warning("[DB] All database data cleared!")
 
     def vacuum(self):
@@ -1884,7 +2081,16 @@ class MeshDatabase:
         logger.info("[DB] Database vacuumed")
 
     def close(self):
-        """Close database connection."""
+        """Close this thread's connections and the idle read connections."""
+        reader = getattr(self._local, 'reader', None)
+        if reader is not None:
+            reader.release.detach()
+            reader.conn.close()
+            self._local.reader = None
+        with self._read_pool_lock:
+            idle, self._read_pool[:] = self._read_pool[:], []
+        for conn in idle:
+            conn.close()
         if hasattr(self._local, 'conn') and self._local.conn:
             self._local.conn.close()
             self._local.conn = None
@@ -1933,7 +2139,7 @@ class MeshDatabase:
 
     def get_pending_outbox(self) -> List[Dict]:
         """Get all pending outbox messages."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         cursor.execute('''
@@ -1978,6 +2184,7 @@ class MeshDatabase:
         ''', (hours,))
 
         conn.commit()
+        self._update_last_modified()
 
     # ==================== DB METADATA (for change tracking) ====================
 
@@ -1994,7 +2201,7 @@ class MeshDatabase:
 
     def get_last_modified(self) -> float:
         """Get the last modification timestamp."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         cursor.execute('SELECT value FROM db_meta WHERE key = ?', ('last_updated',))
@@ -2007,11 +2214,22 @@ class MeshDatabase:
                 return 0.0
         return 0.0
 
+    def get_data_version(self) -> str:
+        """Cheap fingerprint of the database contents.
+
+        Every writer but save_raw_packet bumps db_meta.last_updated once its
+        rows are committed; the newest raw_packets rowid covers packets that
+        are stored without any other row.
+        """
+        conn = self._get_read_conn()
+        last_packet = conn.execute('SELECT MAX(rowid) FROM raw_packets').fetchone()[0]
+        return f"{self.get_last_modified()}:{last_packet}"
+
     # ==================== HISTORICAL DATA QUERIES ====================
 
     def get_time_range(self, days: int = 7) -> Dict:
         """Get the time range of available data (limited to N days)."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         # Calculate the cutoff time (N days ago)
@@ -2040,7 +2258,7 @@ class MeshDatabase:
 
     def get_messages_before(self, timestamp: str, limit: int = 50) -> List[Dict]:
         """Get messages up to a specific timestamp."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         # Get received messages before timestamp
@@ -2098,7 +2316,7 @@ class MeshDatabase:
         For each node, gets the last known position before the timestamp.
         Only returns nodes that had activity (message or position) before that time.
         """
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         # Get only nodes that had activity before the timestamp
@@ -2210,7 +2428,7 @@ class MeshDatabase:
 
     def get_stats_at_time(self, timestamp: str) -> Dict:
         """Get stats calculated up to a specific time (matching live get_stats keys)."""
-        conn = self._get_conn()
+        conn = self._get_read_conn()
         cursor = conn.cursor()
 
         # Count messages up to timestamp
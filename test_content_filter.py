@@ -0,0 +1,170 @@
+"""
+Tests for the content filter and rate limiter in content_filter.py
+
+Run: python -m pytest test_content_filter.py -v
+"""
+
+import sys
+import os
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from content_filter import ContentFilter, FilterCategory, RateLimiter, get_content_filter
+
+
+# ── Fixtures ─────────────────────────────────────────────────────────
+
+@pytest.fixture(scope='module')
+def strict():
+    return ContentFilter(strict_mode=True)
+
+
+@pytest.fixture(scope='module')
+def lenient():
+    return ContentFilter(strict_mode=False)
+
+
+# ── Category detection ───────────────────────────────────────────────
+
+class TestCategories:
+
+    @pytest.mark.parametrize('text', [
+        'hello there', 'how is the weather', 'nice pistol', 'pisa tower',
+        'grab the peacock', 'ok', 'essex county', 'café\xa0au lait',
+    ])
+    def test_clean_messages_allowed(self, strict, text):
+        result = strict.filter_message(text)
+        assert result.is_allowed, f'{text!r} blocked as {result.category}'
+        assert result.filtered_text == text
+
+    @pytest.mark.parametrize('text', [
+        'fuck', 'FUUUUCK off', 'well shit', 'you asshole', 'pissed off',
+        'what a biiitch', 'dammmn', '-slut-', 'sh1t', 'wh0re',
+    ])
+    def test_profanity(self, strict, text):
+        result = strict.filter_message(text)
+        assert result.category == FilterCategory.PROFANITY
+
+    @pytest.mark.parametrize('text', ['nude beach', 'sexy', 'send nudes', 'Send pics'])
+    def test_explicit(self, strict, text):
+        assert strict.filter_message(text).category == FilterCategory.EXPLICIT
+
+    @pytest.mark.parametrize('text, category', [
+        ('kill\xa0all them', FilterCategory.HATE_SPEECH),
+        ('kill all\u2003them', FilterCategory.HATE_SPEECH),
+        ('going\xa0to kill', FilterCategory.VIOLENCE),
+    ])
+    def test_unicode_whitespace(self, strict, text, category):
+        assert strict.filter_message(text).category == category
+
+    @pytest.mark.parametrize('text', ['kill all élèves', 'death to ñandúes'])
+    def test_accented_targets(self, strict, text):
+        assert strict.filter_message(text).category == FilterCategory.HATE_SPEECH
+
+    def test_priority_hate_before_profanity(self, strict):
+        result = strict.filter_message('shit, kill all of them')
+        assert result.category == FilterCategory.HATE_SPEECH
+
+    def test_priority_profanity_before_explicit(self, strict):
+        result = strict.filter_message('naked and damn cold')
+        assert result.category == FilterCategory.PROFANITY
+
+    def test_lenient_skips_profanity(self, lenient):
+        assert lenient.filter_message('well shit').is_allowed
+
+    def test_lenient_keeps_violence(self, lenient):
+        result = lenient.filter_message("i'll hurt you")
+        assert result.category == FilterCategory.VIOLENCE
+
+    def test_empty_text_allowed(self, strict):
+        assert strict.filter_message('').is_allowed
+
+    def test_result_is_slotted_and_frozen(self, strict):
+        import dataclasses
+        result = strict.filter_message('hello')
+        assert not hasattr(result, '__dict__')
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.is_allowed = False
+
+
+# ── Sensitive info and spam ──────────────────────────────────────────
+
+class TestSensitiveAndSpam:
+
+    def test_ssn_redacted(self, strict):
+        result = strict.filter_message('my ssn is 123-45-6789')
+        assert result.category == FilterCategory.SENSITIVE_INFO
+        assert result.filtered_text == 'my ssn is [SSN REDACTED]'
+
+    def test_repetition(self, strict):
+        result = strict.filter_message('heyyyyyy')
+        assert result.category == FilterCategory.SPAM
+
+    def test_caps(self, strict):
+        result = strict.filter_message('WHERE IS EVERYONE TODAY')
+        assert result.category == FilterCategory.SPAM
+        assert result.reason == 'Excessive capitalization'
+
+
+# ── Result cache ─────────────────────────────────────────────────────
+
+class TestResultCache:
+
+    def test_repeat_text_reuses_result(self, strict):
+        assert strict.filter_message('hello mesh') is strict.filter_message('hello mesh')
+
+    def test_cache_keyed_on_exact_text(self, strict):
+        loud = strict.filter_message('WHERE IS EVERYONE TODAY')
+        quiet = strict.filter_message('where is everyone today')
+        assert not loud.is_allowed
+        assert quiet.is_allowed
+
+
+# ── Shared instances ─────────────────────────────────────────────────
+
+class TestSharedFilter:
+
+    def test_one_instance_per_mode(self):
+        assert get_content_filter(True) is get_content_filter(True)
+        assert get_content_filter(True) is not get_content_filter(False)
+        assert not get_content_filter(False).strict_mode
+
+    def test_patterns_shared_between_instances(self):
+        assert ContentFilter(True).hate_pattern is ContentFilter(False).hate_pattern
+
+
+# ── RateLimiter ──────────────────────────────────────────────────────
+
+class TestRateLimiter:
+
+    def test_blocks_after_max(self):
+        limiter = RateLimiter(max_messages=3, window_seconds=60)
+        results = [limiter.is_allowed('!abc')[0] for _ in range(4)]
+        assert results == [True, True, True, False]
+
+    def test_users_independent(self):
+        limiter = RateLimiter(max_messages=1, window_seconds=60)
+        assert limiter.is_allowed('!a')[0]
+        assert limiter.is_allowed('!b')[0]
+        assert not limiter.is_allowed('!a')[0]
+
+    def test_window_expiry(self, monkeypatch):
+        import content_filter
+        now = [1000.0]
+        monkeypatch.setattr(content_filter.time, 'time', lambda: now[0])
+        limiter = RateLimiter(max_messages=2, window_seconds=60)
+        assert limiter.is_allowed('!a')[0]
+        now[0] += 30
+        assert limiter.is_allowed('!a')[0]
+        assert not limiter.is_allowed('!a')[0]
+        now[0] += 30  # first message is now exactly one window old
+        assert limiter.is_allowed('!a')[0]
+        assert len(limiter.message_times['!a']) == 2
+
+    def test_reset(self):
+        limiter = RateLimiter(max_messages=1, window_seconds=60)
+        limiter.is_allowed('!a')
+        limiter.reset('!a')
+        assert limiter.is_allowed('!a')[0]
@@ -127,6 +127,16 @@ class TestStatsEnhanced:
         day_data = api_json(client, '/api/stats-enhanced?range=24h')
         assert day_data['total_messages'] <= all_data['total_messages']
 
+    def test_packet_types_are_sorted_bar_rows(self, client):
+        rows = api_json(client, '/api/stats-enhanced?range=all')['packet_types']
+        assert len(rows) <= 6
+        counts = [r['count'] for r in rows]
+        assert counts == sorted(counts, reverse=True)
+        if rows:
+            assert rows[0]['pct'] == 100
+            assert all(2 <= r['pct'] <= 100 for r in rows)
+            assert all('_APP' not in r['short_type'] for r in rows)
+
 
 # ── /api/nodes ───────────────────────────────────────────────────────
 
@@ -398,6 +408,473 @@ class TestSpecializedEndpoints:
         assert len(data) == db_count
 
 
+# ── Startup config ───────────────────────────────────────────────────
+
+class TestConfig:
+
+    def test_reads_environment(self, monkeypatch):
+        import dashboard
+        monkeypatch.setenv('DASHBOARD_PORT', '8080')
+        monkeypatch.setenv('MESH_DB', '/tmp/other.db')
+        cfg = dashboard.DashboardConfig.from_env()
+        assert cfg.port == 8080
+        assert cfg.db_path == '/tmp/other.db'
+
+    def test_tls_needs_cert_and_key(self, monkeypatch):
+        import dashboard
+        monkeypatch.setenv('DASHBOARD_CERT', '/tmp/cert.pem')
+        assert not dashboard.DashboardConfig.from_env().tls
+        monkeypatch.setenv('DASHBOARD_KEY', '/tmp/key.pem')
+        cfg = dashboard.DashboardConfig.from_env()
+        assert cfg.tls
+        assert (cfg.cert_file, cfg.key_file) == ('/tmp/cert.pem', '/tmp/key.pem')
+
+    def test_frozen_and_slotted(self):
+        import dataclasses
+        import dashboard
+        assert not hasattr(dashboard.CFG, '__dict__')
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            dashboard.CFG.port = 1
+
+
+# ── Dashboard page ───────────────────────────────────────────────────
+
+class TestIndexPage:
+
+    def test_uncompressed_by_default(self, client):
+        resp = client.get('/', headers={'Accept-Encoding': 'identity'})
+        assert resp.status_code == 200
+        assert 'Content-Encoding' not in resp.headers
+        assert b'<html' in resp.data
+
+    def test_minified(self, client):
+        html = client.get('/').data.decode()
+        assert '<!--' not in html
+        assert '\n    ' not in html
+
+    def test_minify_keeps_template_literal_lines(self):
+        import dashboard
+        src = '<script>\n    // gone\n    const t = `\n    // kept\n    `;\n</script>'
+        assert dashboard._minify_html(src) == '<script>\nconst t = `\n// kept\n`;\n</script>'
+
+    def test_gzip_when_accepted(self, client):
+        import gzip
+        plain = client.get('/', headers={'Accept-Encoding': 'identity'}).data
+        resp = client.get('/', headers={'Accept-Encoding': 'gzip, deflate'})
+        assert resp.headers['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in resp.headers['Vary']
+        assert gzip.decompress(resp.data) == plain
+
+
+# ── Favicon and logo ─────────────────────────────────────────────────
+
+class TestImages:
+
+    @pytest.mark.parametrize('path', ['/favicon.png', '/logo.png'])
+    def test_served_as_cacheable_png(self, client, path):
+        resp = client.get(path)
+        assert resp.status_code == 200
+        assert resp.mimetype == 'image/png'
+        assert resp.data.startswith(b'\x89PNG')
+        assert 'immutable' in resp.headers['Cache-Control']
+
+    def test_page_links_versioned_urls(self, client):
+        import dashboard
+        html = client.get('/').data.decode()
+        versions = dashboard.image_versions()
+        assert f'/favicon.png?v={versions["favicon"]}' in html
+        assert f'/logo.png?v={versions["logo"]}' in html
+        assert 'data:image/png;base64' not in html
+
+
+# ── Vendored front-end assets ────────────────────────────────────────
+
+class TestVendorAssets:
+
+    @pytest.fixture
+    def vendor_dir(self, tmp_path, monkeypatch):
+        import dashboard
+        (tmp_path / 'leaflet.js').write_bytes(b'var L = {};')
+        (tmp_path / 'leaflet.js.gz').write_bytes(b'gz-bytes')
+        monkeypatch.setattr(dashboard, 'VENDOR_DIR', str(tmp_path))
+        return tmp_path
+
+    def test_cdn_fallback_when_not_fetched(self, monkeypatch, tmp_path):
+        import dashboard
+        monkeypatch.setattr(dashboard, 'VENDOR_DIR', str(tmp_path))
+        assert dashboard.vendor_urls()['leaflet.js'].startswith('https://')
+
+    def test_local_url_when_fetched(self, vendor_dir):
+        import dashboard
+        assert dashboard.vendor_urls()['leaflet.js'] == '/static/vendor/leaflet.js'
+
+    def test_immutable_cache_headers(self, client, vendor_dir):
+        resp = client.get('/static/vendor/leaflet.js', headers={'Accept-Encoding': 'identity'})
+        assert resp.status_code == 200
+        assert resp.data == b'var L = {};'
+        assert 'immutable' in resp.headers['Cache-Control']
+        assert 'max-age=31536000' in resp.headers['Cache-Control']
+
+    def test_precompressed_sibling(self, client, vendor_dir):
+        resp = client.get('/static/vendor/leaflet.js', headers={'Accept-Encoding': 'gzip'})
+        assert resp.headers['Content-Encoding'] == 'gzip'
+        assert resp.data == b'gz-bytes'
+        assert 'javascript' in resp.mimetype
+
+    def test_socket_client_matches_serializer(self, client):
+        import dashboard
+        html = client.get('/').data.decode()
+        assert ('socket.io.msgpack' in html) == bool(dashboard.msgpack)
+
+
+# ── Query cache ──────────────────────────────────────────────────────
+
+class TestQueryCache:
+
+    def test_repeat_calls_share_one_query(self):
+        import dashboard
+        calls = []
+        key = ('test-shared', time.time())
+        for _ in range(3):
+            assert dashboard._cached(key, lambda: calls.append(1) or len(calls)) == 1
+        assert len(calls) == 1
+
+    def test_entry_expires_after_ttl(self, monkeypatch):
+        import dashboard
+        monkeypatch.setattr(dashboard, 'QUERY_CACHE_TTL', 0.0)
+        calls = []
+        key = ('test-expiry', time.time())
+        dashboard._cached(key, lambda: calls.append(1))
+        dashboard._cached(key, lambda: calls.append(1))
+        assert len(calls) == 2
+
+    def test_size_bounded(self, monkeypatch):
+        import dashboard
+        monkeypatch.setattr(dashboard, 'QUERY_CACHE_MAX', 4)
+        for i in range(10):
+            dashboard._cached(('test-bounded', i), lambda: i)
+        assert len(dashboard._query_cache) <= 4
+
+    def test_misses_go_through_thread_pool(self, monkeypatch):
+        import dashboard
+        submitted = []
+
+        class FakePool:
+            @staticmethod
+            def execute(fn, *args):
+                submitted.append(fn)
+                return fn(*args)
+
+        monkeypatch.setattr(dashboard, 'tpool', FakePool)
+        key = ('test-offload', time.time())
+        assert dashboard._cached(key, lambda: 42) == 42
+        assert len(submitted) == 1
+
+    @pytest.mark.parametrize('url, fn', [
+        ('/api/stats-enhanced?range=24h', '_query_stats_enhanced'),
+        ('/api/dashboard?stats_range=7d', '_query_stats_enhanced'),
+        ('/api/dm-conversations', '_query_dm_conversations'),
+        ('/api/dm-thread?node_id=!abc', '_query_dm_thread'),
+        ('/api/activity', '_query_activity'),
+        ('/api/historical?at=2026-01-01T00:00:00', '_query_historical'),
+        ('/api/telemetry-history?type=all', '_query_telemetry_history'),
+        ('/api/topology', 'get_network_topology'),
+        ('/api/node-detail?node_id=!abc', '_query_node_detail'),
+    ])
+    def test_route_queries_go_through_thread_pool(self, client, monkeypatch, url, fn):
+        import dashboard
+        submitted = []
+
+        class FakePool:
+            @staticmethod
+            def execute(f, *args):
+                submitted.append(f.__name__)
+                return f(*args)
+
+        monkeypatch.setattr(dashboard, 'tpool', FakePool)
+        assert client.get(url).status_code in (200, 404)
+        assert fn in submitted
+
+    def test_per_key_ttl(self, monkeypatch):
+        import dashboard
+        monkeypatch.setattr(dashboard, 'QUERY_CACHE_TTL', 0.0)
+        calls = []
+        key = ('test-ttl', time.time())
+        dashboard._cached(key, lambda: calls.append(1), ttl=60)
+        dashboard._cached(key, lambda: calls.append(1), ttl=60)
+        assert len(calls) == 1
+
+    def test_weather_shares_one_upstream_call(self, client, monkeypatch):
+        import dashboard
+        calls = []
+        monkeypatch.setattr(dashboard, '_fetch_weather', lambda: calls.append(1) or {'temp': 70})
+        dashboard._query_cache.pop(('weather',), None)
+        assert client.get('/api/weather').get_json() == {'temp': 70}
+        assert client.get('/api/weather').get_json() == {'temp': 70}
+        assert len(calls) == 1
+        dashboard._query_cache.pop(('weather',), None)
+
+    def test_weather_failure_not_cached(self, client, monkeypatch):
+        import dashboard
+
+        def boom():
+            raise RuntimeError('offline')
+
+        monkeypatch.setattr(dashboard, '_fetch_weather', boom)
+        dashboard._query_cache.pop(('weather',), None)
+        assert client.get('/api/weather').status_code == 500
+        assert ('weather',) not in dashboard._query_cache
+
+
+# ── JSON encoding ────────────────────────────────────────────────────
+
+class TestJsonProvider:
+
+    def test_orjson_provider_installed(self):
+        import dashboard
+        if dashboard.orjson is None:
+            pytest.skip('orjson not installed')
+        assert isinstance(dashboard.app.json, dashboard.OrjsonProvider)
+
+    def test_int_keys_and_fallback_types(self):
+        import decimal
+        import dashboard
+        with dashboard.app.app_context():
+            resp = dashboard.jsonify({1: 'one', 'amount': decimal.Decimal('2.5')})
+        assert json.loads(resp.data) == {'1': 'one', 'amount': '2.5'}
+        assert resp.mimetype == 'application/json'
+
+
+# ── Conditional GET ──────────────────────────────────────────────────
+
+class TestConditionalGet:
+
+    def test_etag_and_revalidation_headers(self, client):
+        resp = client.get('/api/nodes?range=all')
+        assert resp.status_code == 200
+        assert resp.headers['ETag'].startswith('W/')
+        assert 'no-cache' in resp.headers['Cache-Control']
+
+    def test_not_modified_when_etag_matches(self, client):
+        etag = client.get('/api/messages?limit=5').headers['ETag']
+        resp = client.get('/api/messages?limit=5', headers={'If-None-Match': etag})
+        assert resp.status_code == 304
+        assert resp.data == b''
+        assert resp.headers['ETag'] == etag
+
+    def test_etag_varies_with_query(self, client):
+        a = client.get('/api/messages?limit=5').headers['ETag']
+        b = client.get('/api/messages?limit=6').headers['ETag']
+        assert a != b
+
+    @pytest.fixture
+    def temp_db(self, tmp_path, monkeypatch):
+        import dashboard
+        from mesh_database import MeshDatabase
+        temp = MeshDatabase(db_path=str(tmp_path / 'mesh.db'))
+        monkeypatch.setattr(dashboard, 'db', temp)
+        return temp
+
+    def test_new_data_changes_etag(self, client, temp_db):
+        etag = client.get('/api/stats').headers['ETag']
+        temp_db._update_last_modified()
+        resp = client.get('/api/stats', headers={'If-None-Match': etag})
+        assert resp.status_code == 200
+        assert resp.headers['ETag'] != etag
+
+    @pytest.mark.parametrize('write', [
+        lambda db: db.save_telemetry('!a', {'deviceMetrics': {'batteryLevel': 50}}),
+        lambda db: db.save_position('!a', {'latitude': 30.0, 'longitude': -97.0}),
+        lambda db: db.save_neighbor('!a', {'nodeId': '!b', 'snr': 4.5}),
+        lambda db: db.clear_old_outbox(0),
+    ])
+    def test_writers_move_data_version(self, temp_db, write):
+        before = temp_db.get_data_version()
+        time.sleep(0.001)
+        write(temp_db)
+        assert temp_db.get_data_version() != before
+
+    def test_row_after_raw_packet_reaches_body(self, client, temp_db):
+        """The bridge stores the raw packet first, then the telemetry row."""
+        url = '/api/telemetry-history?node_id=!a&type=all'
+        temp_db.save_raw_packet({'fromId': '!a'}, 'TELEMETRY_APP')
+        first = client.get(url)
+        assert json.loads(first.data) == []
+        temp_db.save_telemetry('!a', {'deviceMetrics': {'batteryLevel': 50}})
+        resp = client.get(url, headers={'If-None-Match': first.headers['ETag']})
+        assert resp.status_code == 200
+        assert [row['battery_level'] for row in json.loads(resp.data)] == [50]
+
+    def test_new_data_reaches_body_within_cache_ttl(self, client, temp_db):
+        """A write right after a cached read must not go out under the new ETag."""
+        first = client.get('/api/messages?limit=5')
+        assert json.loads(first.data) == []
+        temp_db.save_message({'from_id': '!a', 'from_name': 'A', 'text': 'fresh'})
+        resp = client.get('/api/messages?limit=5', headers={'If-None-Match': first.headers['ETag']})
+        assert resp.status_code == 200
+        assert [m['text'] for m in json.loads(resp.data)] == ['fresh']
+        again = client.get('/api/messages?limit=5', headers={'If-None-Match': resp.headers['ETag']})
+        assert again.status_code == 304
+
+
+# ── Socket broadcasts ────────────────────────────────────────────────
+
+class TestBroadcast:
+
+    def test_events_coalesced_into_one_batch(self):
+        import dashboard
+        sio = dashboard.socketio.test_client(dashboard.app)
+        dashboard.broadcast('stats_update', {'total_packets': 1})
+        dashboard.broadcast('new_message', {'from_id': '!abc'})
+
+        deadline = time.time() + 2
+        received = []
+        while not received and time.time() < deadline:
+            time.sleep(dashboard.BROADCAST_INTERVAL)
+            received = sio.get_received()
+        sio.disconnect()
+
+        assert [r['name'] for r in received] == ['batch']
+        events = received[0]['args'][0]
+        assert [e['name'] for e in events] == ['stats_update', 'new_message']
+
+    def test_stats_delta_carries_only_changed_counters(self):
+        import dashboard
+        before = {'raw_packets': 10, 'messages': 4, 'telemetry': 2}
+        after = {'raw_packets': 12, 'messages': 4, 'telemetry': 2, 'positions': 1}
+        assert dashboard._counter_changes(before, after) == {'raw_packets': 12, 'positions': 1}
+        assert dashboard._counter_changes(after, after) == {}
+
+    def test_node_update_rows_are_newer_than_cursor(self, client):
+        import dashboard
+        nodes = api_json(client, '/api/nodes?range=all')
+        if not nodes:
+            pytest.skip('no nodes in database')
+        latest, at_latest = dashboard._latest_node_heard()
+        assert latest == max(n['last_heard'] or 0 for n in nodes)
+        assert at_latest == {n['node_id'] for n in nodes if n['last_heard'] == latest}
+        assert dashboard._query_nodes_heard_after(latest) == []
+        assert {n['node_id'] for n in dashboard._query_nodes_heard_after(latest, inclusive=True)} == at_latest
+        cursor = latest - 1
+        newer = dashboard._query_nodes_heard_after(cursor)
+        assert newer and all(n['last_heard'] > cursor for n in newer)
+        assert newer[0].keys() == nodes[0].keys()
+
+    def test_node_cursor_pushes_same_second_writes_once(self):
+        import dashboard
+        now = int(time.time())
+        first = [{'node_id': '!a', 'last_heard': now}]
+        fresh, cursor, seen = dashboard._advance_node_cursor(first, 0, set())
+        assert fresh == first and cursor == now and seen == {'!a'}
+
+        # !b lands later in the same second; the inclusive read returns both
+        both = [{'node_id': '!b', 'last_heard': now}, {'node_id': '!a', 'last_heard': now}]
+        fresh, cursor, seen = dashboard._advance_node_cursor(both, cursor, seen)
+        assert [n['node_id'] for n in fresh] == ['!b']
+        assert cursor == now and seen == {'!a', '!b'}
+
+        assert dashboard._advance_node_cursor(both, cursor, seen)[0] == []
+
+
+class TestMessagesSince:
+
+    @pytest.fixture
+    def temp_db(self, tmp_path):
+        from mesh_database import MeshDatabase
+        return MeshDatabase(db_path=str(tmp_path / 'mesh.db'))
+
+    def test_empty_db_has_no_latest_id(self, temp_db):
+        assert temp_db.get_latest_message_id() == 0
+
+    def test_returns_only_newer_received_messages(self, temp_db):
+        first = temp_db.save_message({'from_id': '!a', 'from_name': 'A', 'text': 'one'})
+        temp_db.save_message({'from_id': 'assistant', 'from_name': 'assistant', 'text': 'reply'})
+        temp_db.save_message({'from_id': '!b', 'from_name': 'B', 'text': 'two'})
+
+        newer = temp_db.get_messages_since(first)
+        assert [m['text'] for m in newer] == ['two']
+        assert temp_db.get_latest_message_id() > first
+
+    def test_read_connection_is_read_only(self, temp_db):
+        import sqlite3
+        conn = temp_db._get_read_conn()
+        assert conn is not temp_db._get_conn()
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("INSERT INTO db_meta (key, value) VALUES ('x', 'y')")
+
+    def test_read_connection_reused_by_later_threads(self, temp_db):
+        import threading
+        seen = []
+
+        def read():
+            conn = temp_db._get_read_conn()
+            conn.execute('SELECT 1').fetchone()
+            seen.append(conn)
+
+        for _ in range(2):
+            t = threading.Thread(target=read)
+            t.start()
+            t.join()
+            # The thread's locals are dropped as it exits, which returns the connection
+            deadline = time.time() + 1
+            while not temp_db._read_pool and time.time() < deadline:
+                time.sleep(0.01)
+        assert seen[0] is seen[1]
+
+    def test_close_closes_read_connection(self, temp_db):
+        import sqlite3
+        conn = temp_db._get_read_conn()
+        temp_db.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute('SELECT 1')
+        assert temp_db._get_read_conn() is not conn
+
+    def test_read_connection_sees_committed_writes(self, temp_db):
+        assert temp_db.get_message_count() == 0
+        temp_db.save_message({'from_id': '!a', 'from_name': 'A', 'text': 'one'})
+        assert temp_db.get_message_count() == 1
+
+
+class TestStatsCounters:
+
+    @pytest.fixture
+    def temp_db(self, tmp_path):
+        from mesh_database import MeshDatabase
+        return MeshDatabase(db_path=str(tmp_path / 'mesh.db'))
+
+    def test_counters_follow_inserts_and_deletes(self, temp_db):
+        temp_db.save_raw_packet({'fromId': '!a'}, 'TEXT_MESSAGE_APP')
+        temp_db.save_raw_packet({'fromId': '!a'}, 'TEXT_MESSAGE_APP')
+        temp_db.save_raw_packet({'fromId': '!b'}, 'POSITION_APP')
+        assert temp_db.get_row_counts()['raw_packets'] == 3
+        assert temp_db.get_packet_type_counts() == {'TEXT_MESSAGE_APP': 2, 'POSITION_APP': 1}
+        assert temp_db.get_packet_type_counts(limit=1) == {'TEXT_MESSAGE_APP': 2}
+
+        temp_db.clear_all()
+        assert temp_db.get_row_counts()['raw_packets'] == 0
+        assert temp_db.get_packet_type_counts() == {}
+
+    def test_not_recounted_on_open(self, temp_db):
+        from mesh_database import MeshDatabase
+        temp_db.save_message({'from_id': '!a', 'from_name': 'A', 'text': 'one'})
+        conn = temp_db._get_conn()
+        conn.execute("UPDATE stats_counters SET val = 99 WHERE key = 'messages'")
+        conn.commit()
+        reopened = MeshDatabase(db_path=temp_db.db_path)
+        assert reopened.get_row_counts()['messages'] == 99
+
+    def test_missing_counters_seeded_on_open(self, temp_db):
+        from mesh_database import MeshDatabase
+        temp_db.save_message({'from_id': '!a', 'from_name': 'A', 'text': 'one'})
+        temp_db.save_raw_packet({'fromId': '!a'}, 'TEXT_MESSAGE_APP')
+        conn = temp_db._get_conn()
+        conn.execute('DELETE FROM stats_counters')
+        conn.commit()
+        reopened = MeshDatabase(db_path=temp_db.db_path)
+        assert reopened.get_row_counts()['messages'] == 1
+        assert reopened.get_packet_type_counts() == {'TEXT_MESSAGE_APP': 1}
+
+
 # ── Cross-validation: API consistency ────────────────────────────────
 
 class TestCrossValidation:
@@ -434,6 +911,62 @@ class TestCrossValidation:
         db_count = db_conn.execute('SELECT COUNT(*) FROM telemetry').fetchone()[0]
         assert len(telemetry) <= min(100, db_count)
 
+    def test_dashboard_matches_individual_endpoints(self, client):
+        """/dashboard sections should equal the endpoints they combine."""
+        combined = api_json(client, '/api/dashboard?limit=20&msg_range=24h&map_range=7d&stats_range=all')
+        assert combined['messages'] == api_json(client, '/api/messages?limit=20&range=24h')
+        assert combined['nodes'] == api_json(client, '/api/nodes?range=7d')
+        assert combined['stats']['total_nodes'] == api_json(client, '/api/stats-enhanced?range=all')['total_nodes']
+
+    def test_delta_from_empty_cursor_is_the_full_lists(self, client):
+        """A client holding nothing should get every row as a delta."""
+        delta = api_json(client, '/api/dashboard-delta?limit=20&msg_range=24h&map_range=7d')
+        assert delta['messages']['added'] == api_json(client, '/api/messages?limit=20&range=24h')
+        nodes = delta['nodes']['added'] + delta['nodes']['updated']
+        assert sorted(n['node_id'] for n in nodes) == sorted(
+            n['node_id'] for n in api_json(client, '/api/nodes?range=7d'))
+        assert delta['nodes']['removed'] == []
+
+    def test_delta_past_newest_rows_is_empty(self, client):
+        messages = api_json(client, '/api/messages?limit=50')
+        nodes = api_json(client, '/api/nodes?range=all')
+        since_id = max((m['id'] for m in messages if m['direction'] == 'received'), default=0)
+        since_sent_id = max((m['id'] for m in messages if m['direction'] == 'sent'), default=0)
+        since_heard = max((n['last_heard'] or 0 for n in nodes), default=0)
+        delta = api_json(client, f'/api/dashboard-delta?since_id={since_id}'
+                                 f'&since_sent_id={since_sent_id}&since_heard={since_heard}')
+        assert delta['messages']['added'] == []
+        assert delta['nodes']['added'] == [] and delta['nodes']['removed'] == []
+        # The cursor second itself is read again
+        assert {n['node_id'] for n in delta['nodes']['updated']} == {
+            n['node_id'] for n in nodes if since_heard and n['last_heard'] == since_heard}
+
+    def test_delta_includes_nodes_heard_in_cursor_second(self, client, tmp_path, monkeypatch):
+        import dashboard
+        from mesh_database import MeshDatabase
+        temp = MeshDatabase(db_path=str(tmp_path / 'mesh.db'))
+        monkeypatch.setattr(dashboard, 'db', temp)
+        heard = int(time.time()) - 60
+        temp.save_node({'node_id': '!a', 'short_name': 'A', 'last_heard': heard})
+        temp.save_node({'node_id': '!b', 'short_name': 'B', 'last_heard': heard})
+        temp.save_node({'node_id': '!c', 'short_name': 'C', 'last_heard': heard - 5})
+
+        delta = api_json(client, f'/api/dashboard-delta?map_range=24h&since_heard={heard}')
+        nodes = delta['nodes']['added'] + delta['nodes']['updated']
+        assert sorted(n['node_id'] for n in nodes) == ['!a', '!b']
+
+    def test_delta_removes_nodes_aged_out_of_range(self, client, tmp_path, monkeypatch):
+        import dashboard
+        from mesh_database import MeshDatabase
+        temp = MeshDatabase(db_path=str(tmp_path / 'mesh.db'))
+        monkeypatch.setattr(dashboard, 'db', temp)
+        now = int(time.time())
+        temp.save_node({'node_id': '!fresh', 'last_heard': now - 60})
+        temp.save_node({'node_id': '!aged', 'last_heard': now - 24 * 3600 - 30})
+
+        delta = api_json(client, f'/api/dashboard-delta?map_range=24h&since_heard={now - 60}')
+        assert delta['nodes']['removed'] == ['!aged']
+
 
 # ── Database schema validation ───────────────────────────────────────
 